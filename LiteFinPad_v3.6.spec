@@ -26,6 +26,11 @@ hiddenimports = [
     'win32api',  # For Win32 API calls
     'pywintypes',  # For Win32 types
     
+    # Widgets package: submodules are imported lazily by widgets.__getattr__
+    'widgets.number_pad',
+    'widgets.collapsible_date_combo',
+    'widgets.autocomplete_entry',
+    
     # Export libraries
     'xlsxwriter',
     'xlsxwriter.workbook',
@@ -1,20 +1,218 @@
 """Expense analytics calculations. All functions are pure (no side effects)."""
 
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import calendar
 import json
 import os
 from date_utils import DateUtils
 
+try:
+    # Optional faster C parser; falls back to the stdlib json module
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Month totals read from disk, keyed by (path, mtime_ns, size) - see _load_month_total
+_month_total_cache = {}
+
+
+@lru_cache(maxsize=64)
+def _monthrange(year, month):
+    """Memoized calendar.monthrange: (weekday of first day, days in month)."""
+    return calendar.monthrange(year, month)
+
+
+@lru_cache(maxsize=64)
+def _month_bounds(year, month):
+    """Memoized (first day, last day) of a month as date objects."""
+    return date(year, month, 1), date(year, month, _monthrange(year, month)[1])
+
+
+@lru_cache(maxsize=64)
+def _weeks_in_month(year, month):
+    """Memoized number of (partial) 7-day weeks in a month."""
+    total_days = _monthrange(year, month)[1]
+    return (total_days // 7) + (1 if total_days % 7 > 0 else 0)
+
+
+@lru_cache(maxsize=64)
+def _week_start(day):
+    """Memoized Monday of the week containing the given date object."""
+    return day - timedelta(days=day.weekday())
+
+
+@lru_cache(maxsize=4096)
+def _date_key(date_str):
+    """
+    Normalize a YYYY-MM-DD string to its zero-padded ISO form (memoized). Returns None if invalid.
+    
+    ISO 8601 keys sort lexicographically in chronological order, so range
+    checks can compare the strings directly instead of building date objects.
+    """
+    # Fast path: already well-formed YYYY-MM-DD, validated by slicing instead of strptime
+    if (isinstance(date_str, str) and len(date_str) == 10
+            and date_str[4] == '-' and date_str[7] == '-'):
+        digits = date_str[:4] + date_str[5:7] + date_str[8:]
+        if digits.isascii() and digits.isdigit():
+            year, month, day = int(digits[:4]), int(digits[4:6]), int(digits[6:])
+            if year >= 1 and 1 <= month <= 12 and 1 <= day <= _monthrange(year, month)[1]:
+                return date_str
+            return None
+    
+    # Slow path: unpadded or otherwise unusual strings go through the full parser
+    dt = DateUtils.parse_date(date_str)
+    return DateUtils.format_date(dt) if dt else None
+
+
+def _aggregate_columns(dates, amounts, today_key, month_start_key, week_start_key):
+    """
+    Aggregation kernel behind ExpenseAnalytics.compute_summary.
+    
+    Works only on the parallel date-key/amount columns with locally bound names,
+    so the per-expense cost is a few string comparisons and float additions.
+    
+    Returns:
+        (month_total, week_total, past_total, past_amounts, largest_index)
+        - largest_index is None if no past expenses
+    """
+    month_total = 0.0
+    week_total = 0.0
+    past_total = 0.0
+    past_amounts = []
+    append = past_amounts.append
+    largest_index = None
+    largest_amount = 0.0
+    index = -1
+    for date_key, amount in zip(dates, amounts):
+        index += 1
+        if date_key is None or date_key > today_key:
+            continue  # Skip invalid and future dates
+        
+        append(amount)
+        past_total += amount
+        if largest_index is None or amount > largest_amount:
+            largest_index = index
+            largest_amount = amount
+        if date_key >= month_start_key:
+            month_total += amount
+            if date_key >= week_start_key:
+                week_total += amount
+        elif date_key >= week_start_key:
+            week_total += amount  # Week started in the previous month
+    
+    return month_total, week_total, past_total, past_amounts, largest_index
+
+
+def _median(sorted_amounts):
+    """Median of an ascending-sorted, non-empty list of amounts."""
+    count = len(sorted_amounts)
+    if count % 2 == 0:
+        # Even number: average of two middle values
+        return (sorted_amounts[count // 2 - 1] + sorted_amounts[count // 2]) / 2
+    # Odd number: middle value
+    return sorted_amounts[count // 2]
+
+
+class ExpenseSummary:
+    """Aggregates for one expense list and reference date, computed in a single pass."""
+    
+    def __init__(self, current_date, month_total, week_total, past_total, past_amounts,
+                 largest_amount, largest_description):
+        self.current_date = current_date
+        self.month_total = month_total
+        self.week_total = week_total
+        self.days_elapsed_this_week = current_date.weekday() + 1  # Monday through current_date
+        self.past_total = past_total
+        self.past_amounts = past_amounts  # In list order; see get_median()
+        self.largest_amount = largest_amount
+        self.largest_description = largest_description
+        self._median = None
+    
+    def get_median(self):
+        """Median of past amounts (0.0 if none), sorted lazily on first request and cached."""
+        if self._median is None:
+            self._median = _median(sorted(self.past_amounts)) if self.past_amounts else 0.0
+        return self._median
+
+
+class PastStats:
+    """Median, largest, total and count of the past (non-future) expenses."""
+    
+    def __init__(self, median, largest_amount, largest_description, total, count):
+        self.median = median
+        self.largest_amount = largest_amount
+        self.largest_description = largest_description
+        self.total = total
+        self.count = count
+
 
 class ExpenseAnalytics:
     """Pure analytics class for expense calculations. All methods are static."""
     
+    # Last columnar view built by _to_columns: (expenses_list, length, dates, amounts)
+    _columns_cache = None
+    
+    # Last date-sorted index built by _indexed: (expenses_list, length, sorted_keys, sorted_expenses)
+    _index_cache = None
+    
     # ==========================================
     # HELPER METHODS: Expense Filtering
     # ==========================================
     # These methods centralize common expense filtering patterns to eliminate duplication.
     
+    @staticmethod
+    def _to_columns(expenses):
+        """
+        Get parallel (dates, amounts) tuples for an expense list.
+        
+        The view is cached against the list object and its length, so the
+        back-to-back analytics of a single render share one conversion.
+        
+        Args:
+            expenses: List of expense dictionaries
+        
+        Returns:
+            (dates, amounts) - ISO date keys (None if invalid) and amounts
+        """
+        cached = ExpenseAnalytics._columns_cache
+        if cached is not None and cached[0] is expenses and cached[1] == len(expenses):
+            return cached[2], cached[3]
+        
+        # List comprehensions over locally bound callables (no generator frames)
+        date_key = _date_key
+        dates = tuple([date_key(e['date']) for e in expenses])
+        amounts = tuple([e['amount'] for e in expenses])
+        ExpenseAnalytics._columns_cache = (expenses, len(expenses), dates, amounts)
+        return dates, amounts
+    
+    @staticmethod
+    def _indexed(expenses):
+        """
+        Get the valid-dated expenses sorted by date, with their parallel date keys.
+        
+        Cached against the list object and its length like _to_columns. The
+        sort is stable, so expenses sharing a date keep their list order.
+        
+        Args:
+            expenses: List of expense dictionaries
+        
+        Returns:
+            (sorted_keys, sorted_expenses) - invalid dates are left out
+        """
+        cached = ExpenseAnalytics._index_cache
+        if cached is not None and cached[0] is expenses and cached[1] == len(expenses):
+            return cached[2], cached[3]
+        
+        dates, _ = ExpenseAnalytics._to_columns(expenses)
+        order = sorted((i for i, key in enumerate(dates) if key), key=dates.__getitem__)
+        sorted_keys = [dates[i] for i in order]
+        sorted_expenses = [expenses[i] for i in order]
+        ExpenseAnalytics._index_cache = (expenses, len(expenses), sorted_keys, sorted_expenses)
+        return sorted_keys, sorted_expenses
+    
     @staticmethod
     def _filter_expenses_by_date_range(expenses, start_date=None, end_date=None, current_date=None):
         """
@@ -27,31 +225,20 @@ class ExpenseAnalytics:
             current_date: Reference date for future filtering, defaults to today
         
         Returns:
-            Filtered expense list
+            Filtered expense list, in date order
         """
         if current_date is None:
             current_date = datetime.now()
         
-        filtered = []
-        for expense in expenses:
-            dt = DateUtils.parse_date(expense['date'])
-            if not dt:
-                continue  # Skip invalid dates
-            
-            expense_date = dt.date()
-            
-            if start_date and expense_date < start_date.date():
-                continue
-            
-            if end_date:
-                if expense_date > end_date.date():
-                    continue
-            elif expense_date > current_date.date():
-                continue
-            
-            filtered.append(expense)
+        # ISO date keys compare lexicographically == chronologically
+        end_key = DateUtils.format_date(end_date if end_date else current_date)
+        
+        # Binary-search the range boundaries in the date-sorted index
+        sorted_keys, sorted_expenses = ExpenseAnalytics._indexed(expenses)
+        lo = bisect_left(sorted_keys, DateUtils.format_date(start_date)) if start_date else 0
+        hi = bisect_right(sorted_keys, end_key)
         
-        return filtered
+        return sorted_expenses[lo:hi]
     
     @staticmethod
     def _filter_expenses_by_month(expenses, month_date, exclude_future=True):
@@ -66,12 +253,7 @@ class ExpenseAnalytics:
         Returns:
             Expenses for the specified month
         """
-        month_start = month_date.replace(day=1)
-        
-        if month_date.month == 12:
-            month_end = month_date.replace(year=month_date.year + 1, month=1, day=1) - timedelta(days=1)
-        else:
-            month_end = month_date.replace(month=month_date.month + 1, day=1) - timedelta(days=1)
+        month_start, month_end = _month_bounds(month_date.year, month_date.month)
         
         end_date = month_date if exclude_future else month_end
         
@@ -95,7 +277,7 @@ class ExpenseAnalytics:
         Returns:
             Expenses for the specified week
         """
-        week_start = week_date - timedelta(days=week_date.weekday())  # Monday
+        week_start = _week_start(week_date.date())  # Monday
         week_end = week_start + timedelta(days=6)  # Sunday
         
         end_date = week_date if exclude_future else week_end
@@ -128,10 +310,156 @@ class ExpenseAnalytics:
             current_date=current_date
         )
     
+    @staticmethod
+    def count_past_expenses(expenses, current_date=None):
+        """
+        Count expenses dated on or before current_date (invalid dates are not counted).
+        
+        Binary-searches the cached date-sorted key index, so repeated counts
+        over the same expense list neither re-parse dates nor scan the list.
+        
+        Args:
+            expenses: List of expense dictionaries
+            current_date: Reference date, defaults to today
+        
+        Returns:
+            Number of past (and today's) expenses
+        """
+        if current_date is None:
+            current_date = datetime.now()
+        
+        today_key = DateUtils.format_date(current_date)
+        sorted_keys, _ = ExpenseAnalytics._indexed(expenses)
+        return bisect_right(sorted_keys, today_key)
+    
+    @staticmethod
+    def _load_month_total(expenses_file):
+        """
+        Sum all expense amounts in a month's expenses.json file.
+        
+        Totals are cached by (path, mtime, size), so an unchanged file is
+        only opened and parsed once.
+        
+        Args:
+            expenses_file: Path to the month's expenses.json
+        
+        Returns:
+            Total amount, or 0.0 if the file is missing or unreadable
+        """
+        try:
+            st = os.stat(expenses_file)
+        except OSError:
+            return 0.0
+        
+        cache_key = (expenses_file, st.st_mtime_ns, st.st_size)
+        cached_total = _month_total_cache.get(cache_key)
+        if cached_total is not None:
+            return cached_total
+        
+        try:
+            with open(expenses_file, 'rb') as f:
+                data = _json_loads(f.read())
+                # Handle both old format (list) and new format (dict with 'expenses' key)
+                if isinstance(data, list):
+                    expenses = data
+                elif isinstance(data, dict):
+                    expenses = data.get('expenses', [])
+                else:
+                    expenses = []
+                
+                total = sum(e['amount'] for e in expenses)
+        except Exception:
+            # If error reading file, use 0.00
+            return 0.0
+        
+        _month_total_cache[cache_key] = total
+        return total
+    
     # ==========================================
     # PUBLIC METHODS: Analytics Calculations
     # ==========================================
     
+    @staticmethod
+    def compute_summary(expenses, current_date=None):
+        """
+        Compute month, week and past-expense aggregates in one pass.
+        
+        Pass the result as ``summary=`` to the calculate_* methods so a render
+        that needs several analytics only walks the expense list once.
+        
+        Args:
+            expenses: List of expense dictionaries
+            current_date: Date to calculate from, defaults to today
+            
+        Returns:
+            ExpenseSummary
+        """
+        if current_date is None:
+            current_date = datetime.now()
+        
+        today = current_date.date()
+        week_start = _week_start(today)  # Monday
+        today_key = DateUtils.format_date(today)
+        month_start_key = today_key[:8] + '01'
+        week_start_key = DateUtils.format_date(week_start)
+        
+        dates, amounts = ExpenseAnalytics._to_columns(expenses)
+        month_total, week_total, past_total, past_amounts, largest_index = _aggregate_columns(
+            dates, amounts, today_key, month_start_key, week_start_key
+        )
+        
+        if largest_index is None:
+            largest_amount, largest_description = 0.0, "No expenses"
+        else:
+            largest_amount = amounts[largest_index]
+            largest_description = expenses[largest_index]['description']
+        
+        return ExpenseSummary(current_date, month_total, week_total, past_total, past_amounts,
+                              largest_amount, largest_description)
+    
+    @staticmethod
+    def calculate_all(expenses, current_date=None):
+        """
+        Calculate every dashboard analytic against a single reference date.
+        
+        Captures current_date once (so the whole report shares one clock
+        reading, even across midnight) and one ExpenseSummary.
+        
+        Args:
+            expenses: List of expense dictionaries
+            current_date: Date to calculate from, defaults to today
+            
+        Returns:
+            dict with 'day_progress', 'week_progress', 'daily_average',
+            'weekly_average' and 'weekly_pace' tuples, the 'summary', and
+            'labels' holding the display strings for day_progress,
+            daily_average, weekly_average and weekly_pace
+        """
+        if current_date is None:
+            current_date = datetime.now()
+        
+        summary = ExpenseAnalytics.compute_summary(expenses, current_date)
+        day_progress = ExpenseAnalytics.calculate_day_progress(current_date)
+        daily_average = ExpenseAnalytics.calculate_daily_average(expenses, summary=summary)
+        weekly_average = ExpenseAnalytics.calculate_weekly_average(expenses, summary=summary)
+        weekly_pace = ExpenseAnalytics.calculate_weekly_pace(expenses, summary=summary)
+        
+        return {
+            'day_progress': day_progress,
+            'week_progress': ExpenseAnalytics.calculate_week_progress(current_date),
+            'daily_average': daily_average,
+            'weekly_average': weekly_average,
+            'weekly_pace': weekly_pace,
+            'summary': summary,
+            # Formatted once with the numbers, so cached results also skip the formatting
+            'labels': {
+                'day_progress': f"{day_progress[0]} / {day_progress[1]}",
+                'daily_average': f"${daily_average[0]:.2f} /day",
+                'weekly_average': f"${weekly_average[0]:.2f} /week",
+                'weekly_pace': f"${weekly_pace[0]:.2f} /day",
+            },
+        }
+    
     @staticmethod
     def calculate_day_progress(current_date=None):
         """
@@ -147,7 +475,7 @@ class ExpenseAnalytics:
             current_date = datetime.now()
         
         current_day = current_date.day
-        total_days = calendar.monthrange(current_date.year, current_date.month)[1]
+        total_days = _monthrange(current_date.year, current_date.month)[1]
         
         return current_day, total_days
     
@@ -179,19 +507,19 @@ class ExpenseAnalytics:
         precise_week = base_week + week_decimal
         
         # Total weeks in month (estimate based on total days)
-        total_days = calendar.monthrange(current_date.year, current_date.month)[1]
-        total_weeks = (total_days // 7) + (1 if total_days % 7 > 0 else 0)
+        total_weeks = _weeks_in_month(current_date.year, current_date.month)
         
         return precise_week, total_weeks
     
     @staticmethod
-    def calculate_daily_average(expenses, current_date=None):
+    def calculate_daily_average(expenses, current_date=None, summary=None):
         """
         Calculate average spending per day (month total ÷ days elapsed).
         
         Args:
             expenses: List of expense dictionaries
             current_date: Date to calculate from, defaults to today
+            summary: Optional precomputed ExpenseSummary (overrides current_date)
             
         Returns:
             (average_per_day, days_elapsed)
@@ -199,17 +527,11 @@ class ExpenseAnalytics:
         if not expenses:
             return 0.0, 0
         
-        if current_date is None:
-            current_date = datetime.now()
-        
-        # Get current month's expenses (excluding future dates) using helper method
-        month_expenses = ExpenseAnalytics._filter_expenses_by_month(
-            expenses, 
-            month_date=current_date, 
-            exclude_future=True
-        )
+        if summary is None:
+            summary = ExpenseAnalytics.compute_summary(expenses, current_date)
+        current_date = summary.current_date
         
-        monthly_total = sum(e['amount'] for e in month_expenses)
+        monthly_total = summary.month_total
         days_elapsed = current_date.day
         
         # Average per day = monthly total ÷ days elapsed
@@ -218,13 +540,14 @@ class ExpenseAnalytics:
         return avg_per_day, days_elapsed
     
     @staticmethod
-    def calculate_weekly_average(expenses, current_date=None):
+    def calculate_weekly_average(expenses, current_date=None, summary=None):
         """
         Calculate average spending per week (month total ÷ weeks elapsed).
         
         Args:
             expenses: List of expense dictionaries
             current_date: Date to calculate from, defaults to today
+            summary: Optional precomputed ExpenseSummary (overrides current_date)
             
         Returns:
             (average_per_week, weeks_elapsed)
@@ -232,17 +555,11 @@ class ExpenseAnalytics:
         if not expenses:
             return 0.0, 0
         
-        if current_date is None:
-            current_date = datetime.now()
-        
-        # Get current month's expenses (excluding future dates) using helper method
-        month_expenses = ExpenseAnalytics._filter_expenses_by_month(
-            expenses,
-            month_date=current_date,
-            exclude_future=True
-        )
+        if summary is None:
+            summary = ExpenseAnalytics.compute_summary(expenses, current_date)
+        current_date = summary.current_date
         
-        monthly_total = sum(e['amount'] for e in month_expenses)
+        monthly_total = summary.month_total
         
         # Calculate weeks elapsed: (current day - 1) ÷ 7 + 1
         # This gives us the week number we're in (1, 2, 3, 4, etc.)
@@ -255,13 +572,14 @@ class ExpenseAnalytics:
         return avg_per_week, weeks_elapsed
     
     @staticmethod
-    def calculate_weekly_pace(expenses, current_date=None):
+    def calculate_weekly_pace(expenses, current_date=None, summary=None):
         """
         Calculate current week's spending pace (week total ÷ days elapsed this week).
         
         Args:
             expenses: List of expense dictionaries
             current_date: Date to calculate from, defaults to today
+            summary: Optional precomputed ExpenseSummary (overrides current_date)
             
         Returns:
             (pace_per_day, days_elapsed_this_week)
@@ -269,33 +587,22 @@ class ExpenseAnalytics:
         if not expenses:
             return 0.0, 0
         
-        if current_date is None:
-            current_date = datetime.now()
-        
-        # Get current week's expenses (Monday to today, excluding future dates) using helper method
-        week_expenses = ExpenseAnalytics._filter_expenses_by_week(
-            expenses,
-            week_date=current_date,
-            exclude_future=True
-        )
-        
-        weekly_total = sum(e['amount'] for e in week_expenses)
-        week_start = current_date - timedelta(days=current_date.weekday())  # Monday of current week
-        days_elapsed = (current_date - week_start).days + 1  # Days from Monday to today (inclusive)
+        if summary is None:
+            summary = ExpenseAnalytics.compute_summary(expenses, current_date)
         
-        # Pace = weekly total ÷ days elapsed in current week
-        pace_per_day = weekly_total / days_elapsed if days_elapsed > 0 else 0
-        
-        # Return pace and days for context
-        return pace_per_day, days_elapsed
+        # Pace = weekly total ÷ days elapsed in current week (both from the summary pass)
+        days_elapsed = summary.days_elapsed_this_week
+        return summary.week_total / days_elapsed, days_elapsed
     
     @staticmethod
-    def calculate_monthly_trend(prev_month_data_folder, current_month_total=None, viewed_month_key=None):
+    def calculate_monthly_trend(current_month_total=None, viewed_month_key=None):
         """
         Get previous month's total and name for comparison, with trend indicator.
         
+        The previous month's total comes from _load_month_total, which only
+        re-reads its expenses.json when the file has changed.
+        
         Args:
-            prev_month_data_folder: Folder path for previous month's data
             current_month_total: Current/viewed month's total for comparison
             viewed_month_key: Month being viewed (YYYY-MM), calculates contextual previous month if provided
             
@@ -320,23 +627,7 @@ class ExpenseAnalytics:
         # Check if we have previous month data file
         prev_expenses_file = os.path.join(prev_data_folder, 'expenses.json')
         
-        prev_total = 0.0
-        if os.path.exists(prev_expenses_file):
-            try:
-                with open(prev_expenses_file, 'r') as f:
-                    data = json.load(f)
-                    # Handle both old format (list) and new format (dict with 'expenses' key)
-                    if isinstance(data, list):
-                        prev_expenses = data
-                    elif isinstance(data, dict):
-                        prev_expenses = data.get('expenses', [])
-                    else:
-                        prev_expenses = []
-                    
-                    prev_total = sum(e['amount'] for e in prev_expenses)
-            except Exception:
-                # If error reading file, use 0.00
-                prev_total = 0.0
+        prev_total = ExpenseAnalytics._load_month_total(prev_expenses_file)
         
         # Calculate comparison indicator if current month total provided
         comparison_indicator = None
@@ -373,63 +664,57 @@ class ExpenseAnalytics:
         return f"${prev_total:.2f}", prev_month_name, comparison_indicator
     
     @staticmethod
-    def calculate_median_expense(expenses, current_date=None):
+    def calculate_past_stats(expenses, current_date=None, summary=None):
         """
-        Calculate median expense amount (typical expense size).
+        Get median, largest, total and count of past expenses from one pass.
         
         Args:
             expenses: List of expense dictionaries
             current_date: Date to calculate from, defaults to today
+            summary: Optional precomputed ExpenseSummary (overrides current_date)
             
         Returns:
-            (median_amount, count)
+            PastStats
         """
-        if current_date is None:
-            current_date = datetime.now()
-        
-        # Filter out future expenses using helper method
-        past_expenses = ExpenseAnalytics._filter_past_expenses(expenses, current_date)
+        if summary is None:
+            summary = ExpenseAnalytics.compute_summary(expenses, current_date)
         
-        if not past_expenses:
-            return 0.0, 0
-        
-        # Get all expense amounts and sort them
-        amounts = sorted([e['amount'] for e in past_expenses])
-        count = len(amounts)
+        return PastStats(summary.get_median(), summary.largest_amount, summary.largest_description,
+                         summary.past_total, len(summary.past_amounts))
+    
+    @staticmethod
+    def calculate_median_expense(expenses, current_date=None, summary=None):
+        """
+        Calculate median expense amount (typical expense size).
         
-        # Calculate median
-        if count % 2 == 0:
-            # Even number: average of two middle values
-            median = (amounts[count // 2 - 1] + amounts[count // 2]) / 2
-        else:
-            # Odd number: middle value
-            median = amounts[count // 2]
+        Args:
+            expenses: List of expense dictionaries
+            current_date: Date to calculate from, defaults to today
+            summary: Optional precomputed ExpenseSummary (overrides current_date)
+            
+        Returns:
+            (median_amount, count)
+        """
+        if summary is None:
+            summary = ExpenseAnalytics.compute_summary(expenses, current_date)
         
-        return median, count
+        return summary.get_median(), len(summary.past_amounts)
     
     @staticmethod
-    def calculate_largest_expense(expenses, current_date=None):
+    def calculate_largest_expense(expenses, current_date=None, summary=None):
         """
         Get the largest expense amount and description.
         
         Args:
             expenses: List of expense dictionaries
             current_date: Date to calculate from, defaults to today
+            summary: Optional precomputed ExpenseSummary (overrides current_date)
             
         Returns:
             (amount, description)
         """
-        if current_date is None:
-            current_date = datetime.now()
-        
-        # Filter out future expenses using helper method
-        past_expenses = ExpenseAnalytics._filter_past_expenses(expenses, current_date)
-        
-        if not past_expenses:
-            return 0.0, "No expenses"
-        
-        # Find the largest expense
-        largest = max(past_expenses, key=lambda e: e['amount'])
+        if summary is None:
+            summary = ExpenseAnalytics.compute_summary(expenses, current_date)
         
-        return largest['amount'], largest['description']
+        return summary.largest_amount, summary.largest_description
 
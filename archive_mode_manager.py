@@ -2,14 +2,63 @@
 
 import tkinter as tk
 from tkinter import ttk
+from collections import deque
+from contextlib import contextmanager
+import sys
+import weakref
 from datetime import datetime
-import calendar
 import config
 import customtkinter as ctk
+from error_logger import log_error, log_warning
+
+
+# Months with 31 days (February handled separately for leap years)
+_LONG_MONTHS = frozenset({1, 3, 5, 7, 8, 10, 12})
+
+
+class _ModeSpec:
+    """Fixed per-mode values for ArchiveModeManager._apply_mode (colors are theme-dependent and resolved per call)."""
+    
+    __slots__ = ('archive', 'frame_style', 'btn_state')
+    
+    def __init__(self, archive, frame_style, btn_state):
+        self.archive = archive
+        self.frame_style = frame_style
+        self.btn_state = btn_state
+
+
+# ttk frame styles that keep their name (with an 'Archive.' prefix in archive mode)
+_CUSTOM_FRAME_STYLES = frozenset({'Analytics.TFrame', 'Progress.TFrame', 'Expenses.TFrame',
+                                  'Metrics.TFrame', 'StatusBar.TFrame'})
+
+_MODE_SPECS = {
+    'archive': _ModeSpec(archive=True, frame_style='Archive.TFrame', btn_state='disabled'),
+    'normal': _ModeSpec(archive=False, frame_style='TFrame', btn_state='normal'),
+}
 
 
 class ArchiveModeManager:
-    """Manages archive mode UI styling and behavior."""
+    """
+    Manages archive mode UI styling and behavior.
+    
+    A mode switch issues many configure() calls. Tk coalesces the resulting
+    redraws at idle, so the refresh ends with a single update_idletasks()
+    flush (self._flush). Never call root.update() on this path: it re-enters
+    event processing and forces a redraw per pending configure.
+    """
+    
+    __slots__ = (
+        # Collaborators
+        'root', 'expense_tracker', 'page_manager', 'main_frame', 'expense_list_frame',
+        'main_container', 'month_label', 'add_expense_btn', 'quick_add_helper',
+        'table_manager', 'tooltip_creator', 'update_display_callback',
+        'update_metrics_callback', 'theme_manager',
+        # Caches and refresh state
+        '_cached_current_key', '_month_display_cache', '_version', '_title_normal',
+        '_title_archive_tmpl', '_archive_tooltip_tmpl', '_archive_tooltip',
+        '_refresh_pending', '_refresh_after_id', '_batch_depth', '_last_applied_mode',
+        '_children_cache', '_flush', '_tintable', '_epoch', '_page_epochs',
+    )
     
     def __init__(self, root, expense_tracker, page_manager=None, 
                  main_frame=None, expense_list_frame=None,
@@ -35,6 +84,49 @@ class ArchiveModeManager:
         self.update_display_callback = update_display_callback
         self.update_metrics_callback = update_metrics_callback
         self.theme_manager = theme_manager
+        
+        # ((year, month), "YYYY-MM") for the current month, refreshed when the month rolls over
+        self._cached_current_key = (None, None)
+        
+        # (month_key, include_archive_indicator) -> display text
+        self._month_display_cache = {}
+        
+        # App version for the window title (read once; it cannot change while running)
+        try:
+            with open('version.txt', 'r') as f:
+                self._version = f.read().strip()
+        except:
+            self._version = "Unknown"
+        
+        # Window titles and the archive tooltip template (only the month varies)
+        self._title_normal = f"LiteFinPad v{self._version} - Monthly Expense Tracker"
+        self._title_archive_tmpl = f"LiteFinPad v{self._version} - 📚 Archive: {{month}}"
+        self._archive_tooltip_tmpl = "Cannot add expenses in Archive mode. Switch to {month}."
+        # (current_month, tooltip text), rebuilt when the current month rolls over
+        self._archive_tooltip = (None, None)
+        
+        # Debounced refresh state (see request_refresh / batch_updates)
+        self._refresh_pending = False
+        self._refresh_after_id = None
+        self._batch_depth = 0
+        
+        # Viewing mode whose styles were last applied to the widget trees (None forces a restyle)
+        self._last_applied_mode = None
+        
+        # id(widget) -> (widget, children) for the static dashboard/expense list trees
+        self._children_cache = {}
+        
+        # Weak references to CustomTkinter widgets whose fg_color follows the mode background
+        self._tintable = []
+        
+        # Style epoch: bumped whenever the applied styles change (mode switch or invalidate_styles).
+        # Pages and widgets record the epoch they were styled at, so up-to-date ones are skipped.
+        self._epoch = 0
+        # page_id -> epoch of that page's widget tree (hidden pages catch up when shown)
+        self._page_epochs = {}
+        
+        # Redraw flush used once at the end of refresh_ui (see class docstring)
+        self._flush = root.update_idletasks
     
     def is_archive_mode(self):
         """Check if viewing past/future month (archive mode) vs current month."""
@@ -42,510 +134,594 @@ class ArchiveModeManager:
         if viewed_month is None:
             return False
         
-        current_month_key = datetime.now().strftime('%Y-%m')
-        return viewed_month != current_month_key
+        now = datetime.now()
+        year_month = (now.year, now.month)
+        if year_month != self._cached_current_key[0]:
+            self._cached_current_key = (year_month, f"{now.year:04d}-{now.month:02d}")
+            # Archive indicators depend on the current month
+            self._month_display_cache.clear()
+        return viewed_month != self._cached_current_key[1]
+    
+    def invalidate_styles(self):
+        """Force the next refresh_ui to restyle all widgets (e.g. after widgets were rebuilt)."""
+        self._last_applied_mode = None
+        self._epoch += 1
+        self.invalidate_tree()
+    
+    def invalidate_tree(self, widget=None):
+        """Drop cached children lists (for one widget, or all) after widgets are added or destroyed."""
+        if widget is None:
+            self._children_cache.clear()
+        else:
+            self._children_cache.pop(id(widget), None)
+    
+    def attach_expense_list(self, table_manager, quick_add_helper):
+        """
+        Hook up the expense list page's table and quick-add section once they are built.
+        
+        The page is built on its first visit, so its new widget tree is uncached and
+        the quick-add controls take on the current mode's enabled state here.
+        """
+        self.table_manager = table_manager
+        self.quick_add_helper = quick_add_helper
+        self.invalidate_tree(self.expense_list_frame)
+        self._page_epochs.pop("expense_list", None)
+        if quick_add_helper and self.is_archive_mode():
+            quick_add_helper.set_enabled(False, tooltip_text=self._get_archive_tooltip())
+    
+    def _children(self, widget):
+        """
+        Cached winfo_children() for the style walkers.
+        
+        The dashboard and expense list trees are built once, so the Tcl query is
+        only made on the first walk. Toplevel children (hover tooltips) come and
+        go independently and are left out.
+        """
+        entry = self._children_cache.get(id(widget))
+        if entry is not None and entry[0] is widget:
+            return entry[1]
+        
+        children = [child for child in widget.winfo_children()
+                    if not isinstance(child, tk.Toplevel)]
+        self._children_cache[id(widget)] = (widget, children)
+        return children
+    
+    def _format_month(self, month_key, include_archive_indicator=False):
+        """Memoized month_viewer.format_month_display."""
+        cache_key = (month_key, include_archive_indicator)
+        text = self._month_display_cache.get(cache_key)
+        if text is None:
+            text = self.expense_tracker.month_viewer.format_month_display(
+                month_key,
+                include_archive_indicator=include_archive_indicator
+            )
+            self._month_display_cache[cache_key] = text
+        return text
+    
+    def _get_archive_tooltip(self):
+        """Tooltip for the disabled add controls, naming the actual current month."""
+        current_month = self.expense_tracker.current_month
+        if self._archive_tooltip[0] != current_month:
+            text = self._archive_tooltip_tmpl.format(month=self._format_month(current_month))
+            self._archive_tooltip = (current_month, text)
+        return self._archive_tooltip[1]
     
     def get_context_date(self):
         """Get context date for analytics: last day of viewed month (archive) or current date (normal)."""
         if self.is_archive_mode():
             viewed_month = self.expense_tracker.viewed_month
-            year, month = map(int, viewed_month.split('-'))
-            last_day = calendar.monthrange(year, month)[1]
+            # viewed_month is always "YYYY-MM"
+            year = int(viewed_month[:4])
+            month = int(viewed_month[5:7])
+            if month in _LONG_MONTHS:
+                last_day = 31
+            elif month != 2:
+                last_day = 30
+            elif year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+                last_day = 29
+            else:
+                last_day = 28
             return datetime(year, month, last_day)
         else:
             return datetime.now()
     
+    def request_refresh(self):
+        """Schedule refresh_ui for the next idle tick, coalescing repeated requests into one pass."""
+        self._refresh_pending = True
+        if self._batch_depth == 0:
+            self._schedule_refresh()
+    
+    @contextmanager
+    def batch_updates(self):
+        """Suppress scheduling of requested refreshes until the outermost batch exits (reentrant)."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._refresh_pending:
+                self._schedule_refresh()
+    
+    def _schedule_refresh(self):
+        """Register the idle callback unless one is already queued."""
+        if self._refresh_after_id is None:
+            self._refresh_after_id = self.root.after_idle(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Idle callback: run one refresh_ui for all requests made since scheduling."""
+        self._refresh_after_id = None
+        if not self._refresh_pending:
+            return
+        self._refresh_pending = False
+        self.refresh_ui()
+    
     def refresh_ui(self):
         """Update UI styling based on viewing mode (current vs archive)."""
-        viewing_mode = self.expense_tracker.viewing_mode
-        viewed_month = self.expense_tracker.viewed_month
+        tracker = self.expense_tracker
+        viewing_mode = tracker.viewing_mode
+        archive = viewing_mode == "archive"
         
-        try:
-            with open('version.txt', 'r') as f:
-                version = f.read().strip()
-        except:
-            version = "Unknown"
+        month_display_text = self._format_month(tracker.viewed_month)
         
-        month_display_text = self.expense_tracker.month_viewer.format_month_display(
-            viewed_month,
-            include_archive_indicator=False
-        )
+        # Widget backgrounds only depend on the mode, so skip the tree walks when it is unchanged
+        restyle = viewing_mode != self._last_applied_mode
         
-        if viewing_mode == "archive":
-            self._apply_archive_mode(version, month_display_text)
-        else:
-            self._apply_normal_mode(version, month_display_text)
+        self._apply_mode(_MODE_SPECS["archive" if archive else "normal"],
+                         month_display_text, restyle)
         
         if self.update_display_callback:
             try:
                 self.update_display_callback()
             except Exception as e:
-                from error_logger import log_error
                 log_error(f"Error calling update_display_callback: {e}", e)
         else:
-            from error_logger import log_warning
             log_warning("update_display_callback is None - display will not update")
         
-        # Update ttk.Style configurations first (before widget updates)
-        self._update_ttk_styles(viewing_mode == "archive")
-        
-        # Re-apply styles after update_display() runs
-        archive = viewing_mode == "archive"
+        if restyle:
+            # Update ttk.Style configurations first (before widget updates)
+            self._update_ttk_styles(archive)
+            self._last_applied_mode = viewing_mode
+            self._epoch += 1
         
-        if self.main_frame:
-            self.apply_styles_to_widgets(self.main_frame, archive=archive)
-            self.apply_customtkinter_styles(self.main_frame, archive=archive)
-        
-        if self.expense_list_frame:
-            self.apply_styles_to_widgets(self.expense_list_frame, archive=archive)
-            self.apply_customtkinter_styles(self.expense_list_frame, archive=archive)
-        
-        try:
-            self.root.update_idletasks()
-            self.root.update_idletasks()
-            self.root.update()
-        except:
-            pass
+        # Style the page trees after update_display() runs (visible page only)
+        self.restyle_visible_page()
         
         if (self.page_manager and self.page_manager.is_on_page("expense_list") 
             and self.table_manager):
-            self.table_manager.load_expenses(self.expense_tracker.expenses)
+            self.table_manager.load_expenses(tracker.expenses)
             if hasattr(self.table_manager, 'refresh_status_bar_style'):
                 self.table_manager.refresh_status_bar_style()
             if self.update_metrics_callback:
                 self.update_metrics_callback()
-    
-    def _apply_archive_mode(self, version, month_display_text):
-        """Apply archive mode styling to all UI elements."""
-        month_obj = datetime.strptime(self.expense_tracker.viewed_month, "%Y-%m")
-        month_name = month_obj.strftime('%B %Y')
         
-        # Window title: Show archive mode
-        self.root.title(f"LiteFinPad v{version} - 📚 Archive: {month_name}")
+        try:
+            self._flush()
+        except tk.TclError:
+            pass
+    
+    def _apply_mode(self, spec, month_display_text, restyle=True):
+        """
+        Apply a viewing mode's title, backgrounds and add-control state to all UI elements.
         
-        # Background: Theme-aware archive tint (light lavender for light mode, dark purple for dark mode)
-        archive_tint = self.theme_manager.get_archive_tint() if self.theme_manager else config.Colors.BG_ARCHIVE_TINT
-        # Root window uses archive tint
-        self.root.configure(bg=archive_tint)
+        Args:
+            spec: _ModeSpec for the viewing mode
+            month_display_text: Formatted viewed month for the window title and month label
+            restyle: False skips the background/widget restyle (mode unchanged)
+        """
+        if spec.archive:
+            self.root.title(self._title_archive_tmpl.format(month=month_display_text))
+        else:
+            self.root.title(self._title_normal)
         
-        # Main container also uses archive tint
-        if self.main_container:
-            if isinstance(self.main_container, ctk.CTkFrame):
-                self.main_container.configure(fg_color=archive_tint)
-        
-        # Switch main_frame to archive style
-        if self.main_frame:
-            # Check if it's a CustomTkinter widget or ttk widget
-            # Use both isinstance and winfo_class for robust detection
-            is_ctk_frame = isinstance(self.main_frame, ctk.CTkFrame) or hasattr(self.main_frame, 'fg_color')
-            if is_ctk_frame:
-                # CustomTkinter: use fg_color
-                try:
-                    self.main_frame.configure(fg_color=archive_tint)
-                except Exception as e:
-                    from error_logger import log_error
-                    log_error(f"Error configuring main_frame fg_color: {e}", e)
-            else:
-                # ttk widget: use style
-                try:
-                    self.main_frame.configure(style='Archive.TFrame')
-                except Exception as e:
-                    from error_logger import log_error
-                    log_error(f"Error configuring main_frame style: {e}", e)
-            self.apply_styles_to_widgets(self.main_frame, archive=True)
-        
-        if self.expense_list_frame:
-            is_ctk_frame = isinstance(self.expense_list_frame, ctk.CTkFrame) or hasattr(self.expense_list_frame, 'fg_color')
-            if is_ctk_frame:
-                # CustomTkinter: use fg_color
-                try:
-                    self.expense_list_frame.configure(fg_color=archive_tint)
-                except Exception as e:
-                    from error_logger import log_error
-                    log_error(f"Error configuring expense_list_frame fg_color: {e}", e)
-            else:
-                try:
-                    self.expense_list_frame.configure(style='Archive.TFrame')
-                except Exception as e:
-                    from error_logger import log_error
-                    log_error(f"Error configuring expense_list_frame style: {e}", e)
-            self.apply_styles_to_widgets(self.expense_list_frame, archive=True)
+        if restyle:
+            self._restyle(spec)
         
         if self.month_label:
             self.month_label.configure(text=month_display_text)
         
-        if self.main_frame:
-            self.apply_customtkinter_styles(self.main_frame, archive=True)
-        
-        if self.main_frame:
-            try:
-                self.main_frame.update_idletasks()
-            except:
-                pass
-        if self.root:
-            try:
-                self.root.update_idletasks()
-            except:
-                pass
+        tooltip_text = self._get_archive_tooltip() if spec.archive else None
         
         if self.add_expense_btn:
             if isinstance(self.add_expense_btn, ctk.CTkButton):
-                self.add_expense_btn.configure(state='disabled')
+                self.add_expense_btn.configure(state=spec.btn_state)
             else:
-                self.add_expense_btn.config(state='disabled')
-            actual_month_name = self.expense_tracker.month_viewer.format_month_display(
-                self.expense_tracker.current_month,
-                include_archive_indicator=False
-            )
-            if self.tooltip_creator:
-                if hasattr(self.tooltip_creator, '__self__') and hasattr(self.tooltip_creator.__self__, 'update'):
-                    self.tooltip_creator.__self__.update(
-                        self.add_expense_btn,
-                        f"Cannot add expenses in Archive mode. Switch to {actual_month_name}."
-                    )
-                else:
-                    try:
-                        self.add_expense_btn.unbind("<Enter>")
-                        self.add_expense_btn.unbind("<Leave>")
-                    except:
-                        pass
-                    if hasattr(self.add_expense_btn, 'tooltip'):
-                        try:
-                            self.add_expense_btn.tooltip.destroy()
-                        except:
-                            pass
-                        delattr(self.add_expense_btn, 'tooltip')
-                self.tooltip_creator(
-                    self.add_expense_btn,
-                    f"Cannot add expenses in Archive mode. Switch to {actual_month_name}."
-                )
+                self.add_expense_btn.config(state=spec.btn_state)
+            self._update_add_tooltip(tooltip_text)
         
         if self.quick_add_helper:
-            actual_month_name = self.expense_tracker.month_viewer.format_month_display(
-                self.expense_tracker.current_month,
-                include_archive_indicator=False
-            )
-            self.quick_add_helper.set_enabled(
-                False,
-                tooltip_text=f"Cannot add expenses in Archive mode. Switch to {actual_month_name}."
-            )
+            if spec.archive:
+                self.quick_add_helper.set_enabled(False, tooltip_text=tooltip_text)
+            else:
+                self.quick_add_helper.set_enabled(True)
+    
+    def _update_add_tooltip(self, tooltip_text):
+        """Show tooltip_text on the add button, or remove its tooltip when tooltip_text is None."""
+        creator_owner = getattr(self.tooltip_creator, '__self__', None)
+        if tooltip_text is None:
+            if hasattr(creator_owner, 'destroy'):
+                creator_owner.destroy(self.add_expense_btn)
+                return
+        elif not self.tooltip_creator:
+            return
+        elif hasattr(creator_owner, 'update'):
+            creator_owner.update(self.add_expense_btn, tooltip_text)
+            self.tooltip_creator(self.add_expense_btn, tooltip_text)
+            return
+        
+        # No tooltip manager: drop any bindings/tooltip attached directly to the button
+        try:
+            self.add_expense_btn.unbind("<Enter>")
+            self.add_expense_btn.unbind("<Leave>")
+        except:
+            pass
+        if hasattr(self.add_expense_btn, 'tooltip'):
+            try:
+                self.add_expense_btn.tooltip.destroy()
+            except:
+                pass
+            delattr(self.add_expense_btn, 'tooltip')
+        
+        if tooltip_text is not None:
+            self.tooltip_creator(self.add_expense_btn, tooltip_text)
     
-    def _apply_normal_mode(self, version, month_display_text):
-        """Apply normal mode styling to all UI elements - Simplified and reliable."""
-        # Window title: Normal
-        self.root.title(f"LiteFinPad v{version} - Monthly Expense Tracker")
+    def _mode_backgrounds(self, archive):
+        """
+        Theme-aware backgrounds for a viewing mode.
+        
+        Returns:
+            (root_bg, container_bg, frame_bg)
+        """
+        if archive:
+            # Theme-aware archive tint (light lavender for light mode, dark purple for dark mode)
+            archive_tint = self.theme_manager.get_archive_tint() if self.theme_manager else config.Colors.BG_ARCHIVE_TINT
+            return archive_tint, archive_tint, archive_tint
         
         colors = self.theme_manager.get_colors() if self.theme_manager else config.Colors
         is_dark = self.theme_manager.is_dark_mode() if self.theme_manager else False
-        
-        # Root window uses theme-aware background
-        root_bg = colors.BG_MAIN if is_dark else colors.BG_WHITE
+        # Root uses BG_WHITE (light) or BG_MAIN (dark); containers and frames BG_LIGHT_GRAY or BG_SECONDARY
+        frame_bg = colors.BG_SECONDARY if is_dark else colors.BG_LIGHT_GRAY
+        return (colors.BG_MAIN if is_dark else colors.BG_WHITE), frame_bg, frame_bg
+    
+    def _restyle(self, spec):
+        """Apply a viewing mode's backgrounds to the root and main container (page trees: restyle_visible_page)."""
+        root_bg, container_bg, _ = self._mode_backgrounds(spec.archive)
         self.root.configure(bg=root_bg)
         
-        # Main container uses theme-aware background
-        container_bg = colors.BG_SECONDARY if is_dark else colors.BG_LIGHT_GRAY
         if self.main_container:
             if isinstance(self.main_container, ctk.CTkFrame):
                 self.main_container.configure(fg_color=container_bg)
         
-        # Main frame uses BG_LIGHT_GRAY (light) or BG_SECONDARY (dark)
-        frame_bg = colors.BG_SECONDARY if is_dark else colors.BG_LIGHT_GRAY
+    
+    def restyle_visible_page(self):
+        """
+        Bring the visible page's widget tree up to the current viewing mode.
         
-        # Switch main_frame to normal style - Simplified
-        if self.main_frame:
-            if isinstance(self.main_frame, ctk.CTkFrame) or hasattr(self.main_frame, 'fg_color'):
-                try:
-                    self.main_frame.configure(fg_color=frame_bg)
-                except Exception:
-                    pass
-            else:
-                try:
-                    self.main_frame.configure(style='TFrame')
-                except Exception:
-                    pass
-            # Apply styles to all widgets (this updates all labels with explicit backgrounds)
-            self.apply_styles_to_widgets(self.main_frame, archive=False)
-        
-        if self.expense_list_frame:
-            if isinstance(self.expense_list_frame, ctk.CTkFrame) or hasattr(self.expense_list_frame, 'fg_color'):
-                try:
-                    self.expense_list_frame.configure(fg_color=frame_bg)
-                except Exception:
-                    pass
-            else:
-                try:
-                    self.expense_list_frame.configure(style='TFrame')
-                except Exception:
-                    pass
-            self.apply_styles_to_widgets(self.expense_list_frame, archive=False)
+        Hidden pages are skipped and restyled when shown (call this after a
+        page switch), so a refresh only walks the page the user can see.
+        """
+        mode = self._last_applied_mode
+        if mode is None:
+            # No mode applied yet
+            return
+        epoch = self._epoch
         
-        if self.month_label:
-            self.month_label.configure(text=month_display_text)
+        spec = _MODE_SPECS["archive" if mode == "archive" else "normal"]
+        frame_bg = self._mode_backgrounds(spec.archive)[2]
+        restyled = False
+        for page_id, frame in (("main", self.main_frame), ("expense_list", self.expense_list_frame)):
+            if not frame or self._page_epochs.get(page_id) == epoch:
+                continue
+            if self.page_manager and not self.page_manager.is_on_page(page_id):
+                continue
+            self._set_bg(frame, frame_bg, spec.frame_style)
+            self.apply_styles_to_widgets(frame, archive=spec.archive)
+            self._page_epochs[page_id] = epoch
+            restyled = True
         
-        if self.main_frame:
-            self.apply_customtkinter_styles(self.main_frame, archive=False)
-        if self.expense_list_frame:
-            self.apply_customtkinter_styles(self.expense_list_frame, archive=False)
+        if restyled:
+            self._tint_registered(frame_bg)
+    
+    def _set_bg(self, widget, bg_color, style_name):
+        """
+        Set a container frame's background: fg_color for CustomTkinter, style for ttk.
         
-        if self.main_frame:
-            self.apply_styles_to_widgets(self.main_frame, archive=False)
-        if self.expense_list_frame:
-            self.apply_styles_to_widgets(self.expense_list_frame, archive=False)
+        The frame kind is resolved once (see _classify_bg_target) so no exception
+        handling is needed here.
         
-        if self.add_expense_btn:
-            if isinstance(self.add_expense_btn, ctk.CTkButton):
-                self.add_expense_btn.configure(state='normal')
-            else:
-                self.add_expense_btn.config(state='normal')
-            if hasattr(self.tooltip_creator, '__self__') and hasattr(self.tooltip_creator.__self__, 'destroy'):
-                self.tooltip_creator.__self__.destroy(self.add_expense_btn)
-            else:
-                try:
-                    self.add_expense_btn.unbind("<Enter>")
-                    self.add_expense_btn.unbind("<Leave>")
-                except:
-                    pass
-                if hasattr(self.add_expense_btn, 'tooltip'):
-                    try:
-                        self.add_expense_btn.tooltip.destroy()
-                    except:
-                        pass
-                    delattr(self.add_expense_btn, 'tooltip')
+        Args:
+            widget: main_frame or expense_list_frame
+            bg_color: Background color for CustomTkinter frames
+            style_name: ttk style name for ttk frames
+        """
+        kind = getattr(widget, '_lfp_bg_kind', None) or self._classify_bg_target(widget)
+        if kind == 'ctk':
+            widget.configure(fg_color=bg_color)
+        elif kind == 'ttk':
+            widget.configure(style=style_name)
+    
+    @staticmethod
+    def _classify_bg_target(widget):
+        """
+        Record how a container frame's background is set as widget._lfp_bg_kind.
         
-        if self.quick_add_helper:
-            self.quick_add_helper.set_enabled(True)
+        Returns:
+            'ctk', 'ttk', or 'other' (logged once and skipped by _set_bg)
+        """
+        if isinstance(widget, ctk.CTkFrame) or hasattr(widget, 'fg_color'):
+            kind = 'ctk'
+        elif isinstance(widget, ttk.Widget):
+            kind = 'ttk'
+        else:
+            kind = 'other'
+            log_warning(f"Archive styling skipped for unsupported frame type: {type(widget).__name__}")
+        widget._lfp_bg_kind = kind
+        return kind
     
     def apply_styles_to_widgets(self, parent, archive=True):
         """
-        Recursively apply archive or normal styles to all ttk widgets.
+        Apply archive or normal styles to all ttk widgets under parent.
+        
+        The same breadth-first pass classifies CustomTkinter widgets on first
+        visit, so each container's children are listed once per restyle. Their
+        fg_color is then set from the tintable registry (_tint_registered).
         
         Args:
             parent: Parent widget to start from
             archive: True to apply archive styles, False for normal styles
         """
         prefix = 'Archive.' if archive else ''
-        
-        for widget in parent.winfo_children():
-            widget_class = widget.winfo_class()
-            
-            if widget_class == 'TLabel':
-                if archive:
-                    target_bg = self.theme_manager.get_archive_tint() if self.theme_manager else config.Colors.BG_ARCHIVE_TINT
-                else:
-                    theme_colors = self.theme_manager.get_colors() if self.theme_manager else config.Colors
-                    is_dark = self.theme_manager.is_dark_mode() if self.theme_manager else False
-                    target_bg = theme_colors.BG_SECONDARY if is_dark else config.Colors.BG_LIGHT_GRAY
-                
-                try:
-                    widget.configure(background=target_bg)
-                except (tk.TclError, AttributeError):
-                    pass
-                
-                try:
-                    current_style = str(widget.cget('style'))
-                    # Strip any existing 'Archive.' prefix
-                    base_style = current_style.replace('Archive.', '')
-                    
-                    if base_style:
-                        # Has a specific style (Title.TLabel, etc.) - add/remove Archive prefix
-                        new_style = f"{prefix}{base_style}"
-                    else:
-                        # No specific style - use default TLabel style
-                        new_style = 'Archive.TLabel' if archive else 'TLabel'
-                    
-                    widget.configure(style=new_style)
-                except (tk.TclError, AttributeError):
-                    # Style update failed, continue
-                    pass
+        bg_color = self._mode_backgrounds(archive)[2]
+        status_bg = self._status_bar_background()
+        
+        # Bound-method and global lookups hoisted out of the per-widget loop
+        children_of = self._children
+        handlers = self._TTK_HANDLERS
+        epoch = self._epoch
+        classify = self._classify_ctk_widget
+        
+        pending = deque([parent])
+        popleft = pending.popleft
+        append = pending.append
+        while pending:
+            try:
+                children = children_of(popleft())
+            except (tk.TclError, AttributeError):
+                # Widget doesn't support winfo_children or is destroyed
+                continue
             
-            # Update ttk.Frame widgets
-            elif widget_class == 'TFrame':
-                # Check if widget has a custom style (like Analytics.TFrame, Progress.TFrame)
+            for widget in children:
                 try:
-                    current_style = str(widget.cget('style'))
-                    # Strip any existing 'Archive.' prefix
-                    base_style = current_style.replace('Archive.', '')
+                    # winfo_class() is a Tcl round-trip and never changes, so it is read once per widget
+                    widget_class = getattr(widget, '_lfp_cls', None)
+                    if widget_class is None:
+                        widget_class = widget._lfp_cls = sys.intern(widget.winfo_class())
+                    # Widgets already styled in this epoch keep their style; their children are still visited
+                    if getattr(widget, '_lfp_epoch', -1) != epoch:
+                        handler = handlers.get(widget_class)
+                        if handler is not None:
+                            handler(self, widget, archive, prefix, bg_color, status_bg)
+                        widget._lfp_epoch = epoch
                     
-                    # If it's a custom style (Analytics.TFrame, Progress.TFrame, Expenses.TFrame, Metrics.TFrame, StatusBar.TFrame), preserve it
-                    if base_style in ['Analytics.TFrame', 'Progress.TFrame', 'Expenses.TFrame', 'Metrics.TFrame', 'StatusBar.TFrame']:
-                        new_style = f'{prefix}{base_style}'
-                    else:
-                        # Default TFrame style
-                        new_style = f'{prefix}TFrame'
-                    
-                    widget.configure(style=new_style)
-                except (tk.TclError, AttributeError):
-                    # Fallback to default style if we can't read current style
-                    widget.configure(style=f'{prefix}TFrame')
+                    # CustomTkinter widgets are classified on first visit; tintable ones join
+                    # the registry that _tint_registered recolors after the walks
+                    if getattr(widget, '_lfp_kind', None) is None:
+                        classify(widget)
+                except (tk.TclError, AttributeError, RuntimeError):
+                    # Widget might be destroyed during iteration
+                    continue
                 
-                # Recursively update children
-                self.apply_styles_to_widgets(widget, archive)
+                # Check all containers (including non-CustomTkinter widgets)
+                append(widget)
+    
+    def _status_bar_background(self):
+        """Theme-aware background kept by status bar frames in both modes."""
+        if self.theme_manager and self.theme_manager.is_dark_mode():
+            return self.theme_manager.get_colors().BG_TERTIARY  # #2d2d30 (darker gray for status bar)
+        return config.Colors.BG_LIGHT_GRAY  # #e5e5e5
+    
+    def _style_label(self, widget, archive, prefix, label_bg, status_bg):
+        """Apply the mode's background and style to a ttk.Label."""
+        try:
+            if str(widget.cget('background')) != label_bg:
+                widget.configure(background=label_bg)
+        except (tk.TclError, AttributeError):
+            pass
+        
+        try:
+            current_style = str(widget.cget('style'))
+            # Strip any existing 'Archive.' prefix
+            base_style = current_style.replace('Archive.', '')
             
-            # Update ttk.LabelFrame widgets
-            elif widget_class == 'TLabelframe':
-                widget.configure(style=f'{prefix}TLabelframe')
-                # Recursively update children
-                self.apply_styles_to_widgets(widget, archive)
+            if base_style:
+                # Has a specific style (Title.TLabel, etc.) - add/remove Archive prefix
+                new_style = f"{prefix}{base_style}"
+            else:
+                # No specific style - use default TLabel style
+                new_style = 'Archive.TLabel' if archive else 'TLabel'
             
-            # Update tk.Frame widgets (regular Frame, not ttk.Frame)
-            elif widget_class == 'Frame':
-                # Check if this is the status bar frame (has status_label as child)
-                is_status_frame = False
-                try:
-                    for child in widget.winfo_children():
-                        if hasattr(child, 'winfo_class') and child.winfo_class() == 'TLabel':
-                            # Check if it's the status label by checking if it has specific text patterns
-                            try:
-                                text = str(child.cget('text'))
-                                if 'expenses' in text.lower() or text == 'No expenses':
-                                    is_status_frame = True
-                                    break
-                            except:
-                                pass
-                except:
-                    pass
-                
-                # Only update status bar frames - preserve their dark gray background
-                if is_status_frame:
-                    # Get theme-aware status bar background color
-                    if self.theme_manager:
-                        is_dark = self.theme_manager.is_dark_mode()
-                        if is_dark:
-                            status_bg = self.theme_manager.get_colors().BG_TERTIARY  # #2d2d30 (darker gray for status bar)
-                        else:
-                            status_bg = config.Colors.BG_LIGHT_GRAY  # #e5e5e5
-                    else:
-                        status_bg = config.Colors.BG_LIGHT_GRAY
-                    
-                    try:
-                        widget.configure(bg=status_bg)
-                        widget.update_idletasks()  # Force update
-                    except (tk.TclError, AttributeError):
-                        pass
-                
-                # Recursively check children
-                self.apply_styles_to_widgets(widget, archive)
+            # Skip the no-op configure (each one still costs a style lookup and redraw)
+            if current_style != new_style:
+                widget.configure(style=new_style)
+        except (tk.TclError, AttributeError):
+            # Style update failed, continue
+            pass
+    
+    def _style_frame(self, widget, archive, prefix, label_bg, status_bg):
+        """Apply the mode's style to a ttk.Frame, preserving custom section styles."""
+        # Check if widget has a custom style (like Analytics.TFrame, Progress.TFrame)
+        try:
+            current_style = str(widget.cget('style'))
+            # Strip any existing 'Archive.' prefix
+            base_style = current_style.replace('Archive.', '')
             
-            # Update CTkFrame widgets (CustomTkinter frames)
-            elif widget_class == 'CTkFrame':
-                # Recursively check children (CTkFrame styling handled by apply_customtkinter_styles)
-                self.apply_styles_to_widgets(widget, archive)
+            # If it's a custom style (Analytics.TFrame, Progress.TFrame, Expenses.TFrame, Metrics.TFrame, StatusBar.TFrame), preserve it
+            if base_style in _CUSTOM_FRAME_STYLES:
+                new_style = f'{prefix}{base_style}'
+            else:
+                # Default TFrame style
+                new_style = f'{prefix}TFrame'
             
-            # Recursively check other containers
-            elif widget_class in ['Labelframe']:
-                self.apply_styles_to_widgets(widget, archive)
+            if current_style != new_style:
+                widget.configure(style=new_style)
+        except (tk.TclError, AttributeError):
+            # Fallback to default style if we can't read current style
+            widget.configure(style=f'{prefix}TFrame')
+    
+    def _style_labelframe(self, widget, archive, prefix, label_bg, status_bg):
+        """Apply the mode's style to a ttk.LabelFrame."""
+        new_style = f'{prefix}TLabelframe'
+        if str(widget.cget('style')) != new_style:
+            widget.configure(style=new_style)
     
-    def apply_customtkinter_styles(self, parent, archive=True):
+    def _style_tk_frame(self, widget, archive, prefix, label_bg, status_bg):
         """
-        Recursively apply archive or normal styles to all CustomTkinter widgets.
+        Keep the gray background on status bar tk.Frames and tint the rest.
         
-        Args:
-            parent: Parent widget to start from
-            archive: True to apply archive styles, False for normal styles
+        tk.Frames created on a standard background (the dashboard section frames)
+        follow the mode's background; whether a frame qualifies is cached as
+        widget._lfp_bg_tintable. Other tk.Frames are left alone.
         """
-        # Use theme-aware colors
-        if self.theme_manager:
-            colors = self.theme_manager.get_colors()
-            if archive:
-                bg_color = self.theme_manager.get_archive_tint()
-            else:
-                # Normal mode: use BG_LIGHT_GRAY (light) or BG_SECONDARY (dark)
-                bg_color = colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else colors.BG_LIGHT_GRAY
-        else:
-            # Fallback to config colors if theme_manager not available
-            bg_color = config.Colors.BG_ARCHIVE_TINT if archive else config.Colors.BG_LIGHT_GRAY
-        
         try:
-            children = parent.winfo_children()
+            if self._is_status_frame(widget):
+                widget.configure(bg=status_bg)
+                return
+            tintable = getattr(widget, '_lfp_bg_tintable', None)
+            if tintable is None:
+                tintable = widget._lfp_bg_tintable = widget.cget('bg') in self._standard_backgrounds()
+            if tintable and widget.cget('bg') != label_bg:
+                widget.configure(bg=label_bg)
         except (tk.TclError, AttributeError):
-            # Parent widget doesn't support winfo_children or is destroyed
-            return
+            pass
+    
+    def _style_tk_label(self, widget, archive, prefix, label_bg, status_bg):
+        """Tint a tk.Label created on a standard background (cached like _style_tk_frame)."""
+        try:
+            tintable = getattr(widget, '_lfp_bg_tintable', None)
+            if tintable is None:
+                tintable = widget._lfp_bg_tintable = widget.cget('bg') in self._standard_backgrounds()
+            if tintable and widget.cget('bg') != label_bg:
+                widget.configure(bg=label_bg)
+        except (tk.TclError, AttributeError):
+            pass
+    
+    # winfo_class -> style handler, called as handler(self, widget, archive, prefix, label_bg, status_bg)
+    _TTK_HANDLERS = {
+        'TLabel': _style_label,
+        'TFrame': _style_frame,
+        'TLabelframe': _style_labelframe,
+        'Frame': _style_tk_frame,
+        'Label': _style_tk_label,
+    }
+    
+    def _classify_ctk_widget(self, widget):
+        """
+        Record a widget's kind and whether its background follows the archive/normal tint.
         
-        for widget in children:
+        Stores the result as widget._lfp_kind ('ctk_label', 'ctk_frame', 'ctk_status_frame'
+        or 'other') and widget._lfp_tintable, so later walks skip the isinstance/cget checks.
+        A retinted widget keeps a standard background, so the cached answer stays valid.
+        
+        Returns:
+            The widget kind
+        """
+        tintable = False
+        kind = self._ctk_kind_for_type(type(widget))
+        if kind == 'ctk_frame' and self._is_status_frame(widget):
+            kind = 'ctk_status_frame'
+        
+        if kind in ('ctk_label', 'ctk_frame'):
             try:
-                # Update CTkLabel widgets
-                if isinstance(widget, ctk.CTkLabel):
-                    try:
-                        current_fg = widget.cget('fg_color')
-                        # Update labels that use standard background colors
-                        # Keep transparent labels transparent (they inherit from parent)
-                        # Check against both light and dark mode colors
-                        theme_colors = self.theme_manager.get_colors() if self.theme_manager else config.Colors
-                        light_bg = config.Colors.BG_LIGHT_GRAY
-                        dark_bg = theme_colors.BG_SECONDARY if self.theme_manager and self.theme_manager.is_dark_mode() else None
-                        dark_bg_alt = theme_colors.BG_LIGHT_GRAY if self.theme_manager and self.theme_manager.is_dark_mode() else None  # BG_LIGHT_GRAY in dark mode is #2d2d30
-                        light_archive = config.Colors.BG_ARCHIVE_TINT
-                        dark_archive = self.theme_manager.get_archive_tint() if self.theme_manager else None
-                        
-                        # Update if label matches any standard background color (skip transparent)
-                        if (current_fg == light_bg or current_fg == light_archive or 
-                            (dark_bg and current_fg == dark_bg) or 
-                            (dark_bg_alt and current_fg == dark_bg_alt) or  # Also catch BG_LIGHT_GRAY in dark mode
-                            (dark_archive and current_fg == dark_archive)):
-                            # Update to new background color
-                            widget.configure(fg_color=bg_color)
-                        # Skip transparent labels - they inherit from parent
-                    except (tk.TclError, AttributeError, RuntimeError):
-                        # Widget might be destroyed or not fully initialized
-                        pass
-                
-                # Update CTkFrame widgets
-                elif isinstance(widget, ctk.CTkFrame):
-                    try:
-                        # Check if this is the status bar frame (has status_label as child)
-                        is_status_frame = False
-                        try:
-                            for child in widget.winfo_children():
-                                if hasattr(child, 'winfo_class') and child.winfo_class() == 'TLabel':
-                                    # Check if it's the status label by checking if it has specific text patterns
-                                    try:
-                                        text = str(child.cget('text'))
-                                        if 'expenses' in text.lower() or text == 'No expenses':
-                                            is_status_frame = True
-                                            break
-                                    except:
-                                        pass
-                        except:
-                            pass
-                        
-                        # Skip status bar frames - they have their own color management
-                        if is_status_frame:
-                            # Recursively check children but don't modify status bar frame itself
-                            self.apply_customtkinter_styles(widget, archive)
-                            continue
-                        
-                        current_fg = widget.cget('fg_color')
-                        # Update ALL frames that aren't transparent (more aggressive update for proper refresh)
-                        # Check against both light and dark mode colors, and archive colors
-                        theme_colors = self.theme_manager.get_colors() if self.theme_manager else config.Colors
-                        light_bg = config.Colors.BG_LIGHT_GRAY
-                        dark_bg = theme_colors.BG_SECONDARY if self.theme_manager and self.theme_manager.is_dark_mode() else None
-                        dark_bg_alt = theme_colors.BG_LIGHT_GRAY if self.theme_manager and self.theme_manager.is_dark_mode() else None  # BG_LIGHT_GRAY in dark mode is #2d2d30
-                        light_archive = config.Colors.BG_ARCHIVE_TINT
-                        dark_archive = self.theme_manager.get_archive_tint() if self.theme_manager else None
-                        
-                        # Update if frame matches any standard background color OR if it's not transparent
-                        # This ensures all frames get updated when switching modes
-                        if (current_fg == light_bg or current_fg == light_archive or 
-                            (dark_bg and current_fg == dark_bg) or 
-                            (dark_bg_alt and current_fg == dark_bg_alt) or  # Also catch BG_LIGHT_GRAY in dark mode
-                            (dark_archive and current_fg == dark_archive)):
-                            # Update to new background color
-                            widget.configure(fg_color=bg_color)
-                        # Skip transparent frames - they inherit from parent
-                    except (tk.TclError, AttributeError, RuntimeError):
-                        # Widget might be destroyed or not fully initialized
-                        pass
-                
-                # Recursively check all containers (including non-CustomTkinter widgets)
-                try:
-                    self.apply_customtkinter_styles(widget, archive)
-                except (tk.TclError, AttributeError, RuntimeError):
-                    # Widget doesn't support winfo_children or is destroyed
-                    pass
+                tintable = widget.cget('fg_color') in self._standard_backgrounds()
             except (tk.TclError, AttributeError, RuntimeError):
-                # Widget might be destroyed during iteration
+                # Widget might be destroyed or not fully initialized
+                tintable = False
+        
+        widget._lfp_kind = kind
+        widget._lfp_tintable = tintable
+        if tintable:
+            self._tintable.append(weakref.ref(widget))
+        return kind
+    
+    def register_tintable(self, widget):
+        """
+        Register a CustomTkinter widget whose fg_color should follow the archive/normal background.
+        
+        Widgets under main_frame/expense_list_frame are registered automatically the first
+        time a restyle walk classifies them; use this for widgets created elsewhere.
+        
+        Args:
+            widget: CTkFrame or CTkLabel to retint on mode changes
+        """
+        if getattr(widget, '_lfp_kind', None) is not None and widget._lfp_tintable:
+            return
+        widget._lfp_kind = self._ctk_kind_for_type(type(widget))
+        widget._lfp_tintable = True
+        self._tintable.append(weakref.ref(widget))
+    
+    def _tint_registered(self, bg_color):
+        """Set fg_color on registered tintable widgets not yet tinted this epoch, pruning destroyed ones."""
+        epoch = self._epoch
+        live = []
+        for ref in self._tintable:
+            widget = ref()
+            if widget is None:
                 continue
+            if getattr(widget, '_lfp_tint_epoch', -1) != epoch:
+                try:
+                    if widget.cget('fg_color') != bg_color:
+                        widget.configure(fg_color=bg_color)
+                except (tk.TclError, AttributeError, RuntimeError):
+                    # Widget was destroyed
+                    continue
+                widget._lfp_tint_epoch = epoch
+            live.append(ref)
+        self._tintable = live
+    
+    # Widget type -> base kind; exact types hit the dict, subclasses are resolved once and added
+    _ctk_kinds_by_type = {ctk.CTkLabel: 'ctk_label', ctk.CTkFrame: 'ctk_frame'}
+    
+    @classmethod
+    def _ctk_kind_for_type(cls, widget_type):
+        """Map a widget type to 'ctk_label', 'ctk_frame' or 'other' without repeated MRO walks."""
+        kind = cls._ctk_kinds_by_type.get(widget_type)
+        if kind is None:
+            if issubclass(widget_type, ctk.CTkLabel):
+                kind = 'ctk_label'
+            elif issubclass(widget_type, ctk.CTkFrame):
+                kind = 'ctk_frame'
+            else:
+                kind = 'other'
+            cls._ctk_kinds_by_type[widget_type] = kind
+        return kind
+    
+    def _standard_backgrounds(self):
+        """Light, dark and archive background colors that mark a widget as tintable."""
+        # Check against both light and dark mode colors, and archive colors
+        backgrounds = {config.Colors.BG_LIGHT_GRAY, config.Colors.BG_ARCHIVE_TINT}
+        if self.theme_manager:
+            backgrounds.add(self.theme_manager.get_archive_tint())
+            if self.theme_manager.is_dark_mode():
+                theme_colors = self.theme_manager.get_colors()
+                backgrounds.add(theme_colors.BG_SECONDARY)
+                backgrounds.add(theme_colors.BG_LIGHT_GRAY)  # BG_LIGHT_GRAY in dark mode is #2d2d30
+        return backgrounds
+    
+    @staticmethod
+    def _is_status_frame(widget):
+        """Check if a frame is the status bar frame (has the expense status label as a child)."""
+        try:
+            for child in widget.winfo_children():
+                if hasattr(child, 'winfo_class') and (getattr(child, '_lfp_cls', None) or child.winfo_class()) == 'TLabel':
+                    # Check if it's the status label by checking if it has specific text patterns
+                    try:
+                        text = str(child.cget('text'))
+                        if 'expenses' in text.lower() or text == 'No expenses':
+                            return True
+                    except:
+                        pass
+        except:
+            pass
+        return False
     
     def _update_ttk_styles(self, archive=False):
         """
@@ -556,7 +732,6 @@ class ArchiveModeManager:
             archive: True to apply archive styles, False for normal styles
         """
         try:
-            from tkinter import ttk
             style = ttk.Style()
             
             if self.theme_manager:
@@ -1,5 +1,7 @@
 """Centralized configuration constants for visual and behavioral settings."""
 
+from functools import lru_cache
+
 # ============================================================================
 # WINDOW DIMENSIONS
 # ============================================================================
@@ -286,8 +288,9 @@ class App:
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=None)
 def get_font(size, weight=None):
-    """Get font tuple with standard family."""
+    """Get font tuple with standard family (memoized; the tuples are immutable)."""
     if weight:
         return (Fonts.FAMILY, size, weight)
     return (Fonts.FAMILY, size)
@@ -8,13 +8,25 @@ Separates UI construction from update logic and event handling.
 import tkinter as tk
 from tkinter import ttk
 import customtkinter as ctk
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime
 import config
 from analytics import ExpenseAnalytics
-from date_utils import DateUtils
+from error_logger import log_error
 from settings_manager import get_settings_manager
 
 
+# Font tuples used across the dashboard sections (invariant, so built once)
+FONT_SMALL = config.get_font(config.Fonts.SIZE_SMALL)
+FONT_NORMAL = config.get_font(config.Fonts.SIZE_NORMAL)
+FONT_NORMAL_BOLD = config.get_font(config.Fonts.SIZE_NORMAL, 'bold')
+FONT_MEDIUM = config.get_font(config.Fonts.SIZE_MEDIUM)
+FONT_LARGE = config.get_font(config.Fonts.SIZE_LARGE)
+
+# Shown in the Previous Month labels until the worker thread has read the file
+PREV_MONTH_PLACEHOLDER = "…"
+
+
 class DashboardPageBuilder:
     """
     Constructs the main dashboard UI with all sections.
@@ -44,22 +56,69 @@ class DashboardPageBuilder:
         self.theme_manager = theme_manager
         
         self.colors = theme_manager.get_colors() if theme_manager else config.Colors
+        # Theme is fixed for the builder's lifetime; resolved once instead of per section
+        self._is_dark = theme_manager.is_dark_mode() if theme_manager else False
+        self._frame_bg = self.colors.BG_SECONDARY if self._is_dark else self.colors.BG_LIGHT_GRAY
         
         self.widgets = {}
+        # Expense list, (length, day) and the calculate_all result computed for them (see _get_metrics)
+        self._metrics_list = None
+        self._metrics_key = None
+        self._metrics = None
+        self._now = None  # Build timestamp shared by all sections (see _build_time)
+        
+    def _get_metrics(self, context_date):
+        """
+        Get every dashboard analytic for context_date from one ExpenseAnalytics.calculate_all pass.
+        
+        Memoized on the expense list object, its length and the context day: the
+        tracker replaces or grows the list when expenses change. The list itself is
+        kept (not its id), so a new list can't be mistaken for a freed one.
+        """
+        expenses = self.tracker.expenses
+        key = (len(expenses), context_date.date())
+        if expenses is not self._metrics_list or key != self._metrics_key:
+            self._metrics = ExpenseAnalytics.calculate_all(expenses, context_date)
+            self._metrics_list = expenses
+            self._metrics_key = key
+        return self._metrics
+        
+    def _build_time(self):
+        """Timestamp taken once per build_all, so every section sees the same "now"."""
+        return self._now or datetime.now()
         
     def build_all(self):
-        """Build all dashboard sections and return widget references"""
-        self.create_header()
-        self.create_total_section()
-        self.create_progress_section()  # Now includes title at row 4, frame at row 5
-        self.create_analytics_section()  # Title at row 6, frame at row 7
-        self.create_expenses_section()  # Title at row 8, frame at row 9
-        self.create_buttons_section()    # Row 10
+        """
+        Build all dashboard sections and return widget references.
+        
+        The page frame is unmapped while its ~40 widgets are created, so Tk
+        lays out and draws the page once when it is re-gridded instead of
+        after each widget is added.
+        """
+        self._now = datetime.now()
+        context_date = self.callbacks['get_context_date']()
+        
+        was_gridded = bool(self.frame.grid_info())
+        if was_gridded:
+            self.frame.grid_remove()  # Keeps the grid options for the grid() below
+        try:
+            self.create_header()
+            self.create_total_section()
+            self.create_progress_section(context_date)  # Now includes title at row 4, frame at row 5
+            self.create_analytics_section(context_date)  # Title at row 6, frame at row 7
+            self.create_expenses_section()  # Title at row 8, frame at row 9
+            self.create_buttons_section()    # Row 10
+        finally:
+            self._now = None
+            if was_gridded:
+                self.frame.grid()
         
         return self.widgets
         
     def create_header(self):
         """Create header with perfectly centered title and controls - using CustomTkinter"""
+        colors = self.colors
+        
         header_frame = ctk.CTkFrame(self.frame, fg_color="transparent")
         header_frame.grid(row=0, column=0, columnspan=2, pady=(0, 5), sticky=(tk.W, tk.E))
         
@@ -70,7 +129,7 @@ class DashboardPageBuilder:
             header_frame, 
             text=month_text, 
             font=config.Fonts.TITLE,
-            text_color=self.colors.TEXT_BLACK,
+            text_color=colors.TEXT_BLACK,
             cursor='hand2'
         )
         month_label.grid(row=0, column=0, sticky=tk.W)
@@ -85,13 +144,13 @@ class DashboardPageBuilder:
         about_label = ctk.CTkLabel(
             controls_frame,
             text="ℹ️",
-            font=config.get_font(config.Fonts.SIZE_MEDIUM),
-            text_color=self.colors.TEXT_BLACK,
+            font=FONT_MEDIUM,
+            text_color=colors.TEXT_BLACK,
             cursor='hand2'
         )
         about_label.pack(side=tk.LEFT, padx=(0, 1))
         
-        about_label.bind('<Button-1>', lambda e: self.callbacks['show_about_dialog']())
+        about_label.bind('<Button-1>', self.callbacks['show_about_dialog'])
         
         self.tooltip_manager.create(about_label, "About LiteFinPad")
         
@@ -103,8 +162,8 @@ class DashboardPageBuilder:
         stay_on_top_label = ctk.CTkLabel(
             controls_frame,
             text="📌",
-            font=config.get_font(config.Fonts.SIZE_MEDIUM),
-            fg_color=self.colors.BG_BUTTON_DISABLED,
+            font=FONT_MEDIUM,
+            fg_color=colors.BG_BUTTON_DISABLED,
             cursor='hand2',
             padx=5,
             pady=2,
@@ -112,7 +171,7 @@ class DashboardPageBuilder:
         )
         stay_on_top_label.pack(side=tk.LEFT, padx=(0, 5))
         
-        stay_on_top_label.bind('<Button-1>', lambda e: self.callbacks['toggle_stay_on_top_visual']())
+        stay_on_top_label.bind('<Button-1>', self.callbacks['toggle_stay_on_top_visual'])
         
         self.tooltip_manager.create(stay_on_top_label, "Stay on Top (ON)")
         
@@ -125,9 +184,9 @@ class DashboardPageBuilder:
             width=30,
             height=28,
             corner_radius=config.CustomTkinterTheme.CORNER_RADIUS,
-            font=config.get_font(config.Fonts.SIZE_MEDIUM),
-            fg_color=self.colors.BLUE_DARK_NAVY,  # Dark navy blue
-            hover_color=self.colors.BLUE_NAVY,  # Lighter navy on hover
+            font=FONT_MEDIUM,
+            fg_color=colors.BLUE_DARK_NAVY,  # Dark navy blue
+            hover_color=colors.BLUE_NAVY,  # Lighter navy on hover
             text_color="white"
         )
         minimize_button.pack(side=tk.LEFT, padx=(0, 0))  # No padding to align to right edge
@@ -138,12 +197,14 @@ class DashboardPageBuilder:
         
     def create_total_section(self):
         """Create monthly total display section - using CustomTkinter"""
+        colors = self.colors
+        
         # Monthly total display (using CTkLabel for modern appearance)
         total_label = ctk.CTkLabel(
             self.frame,
             text=f"${self.tracker.monthly_total:.2f}",
             font=config.Fonts.HERO_TOTAL,
-            text_color=self.colors.GREEN_PRIMARY
+            text_color=colors.GREEN_PRIMARY
         )
         total_label.grid(row=1, column=0, columnspan=2, pady=(0, 0))  # No spacing - bring "(Total Monthly)" very close
         self.widgets['total_label'] = total_label
@@ -153,34 +214,33 @@ class DashboardPageBuilder:
             self.frame,
             text="(Total Monthly)",
             font=config.Fonts.LABEL,
-            text_color=self.colors.TEXT_GRAY_MEDIUM
+            text_color=colors.TEXT_GRAY_MEDIUM
         ).grid(row=2, column=0, columnspan=2, pady=(0, 0))  # No spacing - bring expense count very close
         
         # Expense count display (exclude future expenses) - using CTkLabel
-        today = datetime.now().date()
-        past_expenses = [e for e in self.tracker.expenses 
-                        if (dt := DateUtils.parse_date(e['date'])) and dt.date() <= today]
-        expense_count = len(past_expenses)
+        expense_count = ExpenseAnalytics.count_past_expenses(self.tracker.expenses, self._build_time())
         count_label = ctk.CTkLabel(
             self.frame,
             text=f"{expense_count} expenses this month",
-            font=config.get_font(config.Fonts.SIZE_LARGE),
-            text_color=self.colors.TEXT_BLACK  # Explicit color for visibility
+            font=FONT_LARGE,
+            text_color=colors.TEXT_BLACK  # Explicit color for visibility
         )
         count_label.grid(row=3, column=0, columnspan=2, pady=(0, 6))  # Reduced to 6 for more compact layout
         self.widgets['count_label'] = count_label
         
-    def create_progress_section(self):
+    def create_progress_section(self, context_date=None):
         """Create current progress section with averages - using CustomTkinter"""
+        colors = self.colors
+        frame_bg = self._frame_bg
+        
         # Title label OUTSIDE the frame (like ttk.LabelFrame puts title above border)
         # ttk.LabelFrame titles use smaller font (typically 9-10pt), reduce from SIZE_NORMAL (11pt)
         # Use theme-aware text color: TEXT_BLACK (light) or TEXT_PRIMARY (dark)
         # Match parent frame background (main_frame) - BG_SECONDARY in dark, BG_LIGHT_GRAY in light
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
         style = ttk.Style()
         style.configure('SectionTitle.TLabel', 
-                       font=config.get_font(config.Fonts.SIZE_SMALL),
-                       foreground=self.colors.TEXT_BLACK,
+                       font=FONT_SMALL,
+                       foreground=colors.TEXT_BLACK,
                        background=frame_bg)
         title_label = ttk.Label(
             self.frame, 
@@ -190,112 +250,92 @@ class DashboardPageBuilder:
         title_label.grid(row=4, column=0, columnspan=2, pady=(0, 0), sticky=tk.W)  # No spacing - bring frame closer
         
         # Frame uses theme-aware background with subtle border
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
-        border_color = self.colors.BG_DARK_GRAY
-        progress_frame = ctk.CTkFrame(
-            self.frame, 
-            fg_color=frame_bg,
-            border_width=1,
-            border_color=border_color
+        border_color = colors.BG_DARK_GRAY
+        progress_frame = tk.Frame(
+            self.frame,
+            bg=frame_bg,
+            bd=0,
+            highlightthickness=1,
+            highlightbackground=border_color
         )
         progress_frame.grid(row=5, column=0, columnspan=2, pady=(0, 6), sticky=(tk.W, tk.E))  # Reduced spacing between sections
         
-        context_date = self.callbacks['get_context_date']()
-        current_day, total_days = ExpenseAnalytics.calculate_day_progress(context_date)
-        current_week, total_weeks = ExpenseAnalytics.calculate_week_progress(context_date)
-        daily_avg, days_elapsed = ExpenseAnalytics.calculate_daily_average(
-            self.tracker.expenses, context_date
-        )
-        weekly_avg, weeks_elapsed = ExpenseAnalytics.calculate_weekly_average(
-            self.tracker.expenses, context_date
-        )
+        if context_date is None:
+            context_date = self.callbacks['get_context_date']()
+        metrics = self._get_metrics(context_date)
+        current_week, total_weeks = metrics['week_progress']
+        labels = metrics['labels']
         
-        # Top row: Day and Week progress (centered and close together)
-        # Original: top_row.pack(fill=tk.X, pady=(0, 8))
-        # Configure ttk.Frame to match CTkFrame background (prevents black bar)
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
+        # Configure ttk.Frame to match the section frame background (prevents black bar)
         style = ttk.Style()
         style.configure('Progress.TFrame', background=frame_bg)
+        
+        # Top row: Day and Week progress (centered and close together).
+        # One frame per row - the caption/value labels are packed straight
+        # into it, pack's default anchor keeps the row centered.
         top_row = ttk.Frame(progress_frame, style='Progress.TFrame')
-        top_row.pack(fill=tk.X, pady=(8, 6), padx=10)  # Reduced padding - 8px top instead of 10px, 6px bottom instead of 8px
-        
-        # Centered container to hold both labels (centers Day and Week together)
-        top_center_container = ttk.Frame(top_row, style='Progress.TFrame')
-        top_center_container.pack(expand=True)  # Center the container
-        
-        # Day progress label
-        day_container = ttk.Frame(top_center_container, style='Progress.TFrame')
-        day_container.pack(side=tk.LEFT, padx=(0, 25))  # 25px gap between Day and Week
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
-        ttk.Label(day_container, text="Day: ", font=config.get_font(config.Fonts.SIZE_NORMAL, 'bold'), 
-                 foreground=self.colors.BLUE_NAVY, background=frame_bg).pack(side=tk.LEFT)
-        day_progress_label = ttk.Label(day_container, text=f"{current_day} / {total_days}", 
-                                       font=config.get_font(config.Fonts.SIZE_NORMAL),
-                                       foreground=self.colors.TEXT_BLACK, background=frame_bg)
-        day_progress_label.pack(side=tk.LEFT)
+        top_row.pack(pady=(8, 6), padx=10)
+        
+        ttk.Label(top_row, text="Day: ", font=FONT_NORMAL_BOLD, 
+                 foreground=colors.BLUE_NAVY, background=frame_bg).pack(side=tk.LEFT)
+        day_progress_label = ttk.Label(top_row, text=labels['day_progress'], 
+                                       font=FONT_NORMAL,
+                                       foreground=colors.TEXT_BLACK, background=frame_bg)
+        day_progress_label.pack(side=tk.LEFT, padx=(0, 25))  # 25px gap between Day and Week
         self.widgets['day_progress_label'] = day_progress_label
         
-        # Week progress label
-        week_container = ttk.Frame(top_center_container, style='Progress.TFrame')
-        week_container.pack(side=tk.LEFT, padx=(25, 0))  # 25px gap between Day and Week
-        ttk.Label(week_container, text="Week: ", font=config.get_font(config.Fonts.SIZE_NORMAL, 'bold'), 
-                 foreground=self.colors.BLUE_NAVY, background=frame_bg).pack(side=tk.LEFT)
+        ttk.Label(top_row, text="Week: ", font=FONT_NORMAL_BOLD, 
+                 foreground=colors.BLUE_NAVY, background=frame_bg).pack(side=tk.LEFT, padx=(25, 0))
         
         # For archive mode, show clean week numbers (no decimals for completed months)
         if self.callbacks['is_archive_mode']():
             week_display = f"{round(current_week)} / {total_weeks}"
         else:
             week_display = f"{current_week:.1f} / {total_weeks}"
-        week_progress_label = ttk.Label(week_container, text=week_display, 
-                                       font=config.get_font(config.Fonts.SIZE_NORMAL),
-                                       foreground=self.colors.TEXT_BLACK, background=frame_bg)
+        week_progress_label = ttk.Label(top_row, text=week_display, 
+                                       font=FONT_NORMAL,
+                                       foreground=colors.TEXT_BLACK, background=frame_bg)
         week_progress_label.pack(side=tk.LEFT)
         self.widgets['week_progress_label'] = week_progress_label
         
-        # Bottom row: Daily and Weekly averages (centered and close together)
-        # Original: bottom_row.pack(fill=tk.X, pady=(8, 0))
+        # Bottom row: Daily and Weekly averages (centered and close together).
+        # Gridded caption-over-value cells replace the per-average frames.
         bottom_row = ttk.Frame(progress_frame, style='Progress.TFrame')
-        bottom_row.pack(fill=tk.X, pady=(6, 8), padx=10)  # Reduced spacing - 6px top instead of 8px, 8px bottom instead of 10px
-        
-        # Centered container to hold both averages (centers Daily and Weekly together)
-        bottom_center_container = ttk.Frame(bottom_row, style='Progress.TFrame')
-        bottom_center_container.pack(expand=True)  # Center the container
+        bottom_row.pack(pady=(6, 8), padx=10)
         
         # Daily average label
-        daily_avg_frame = ttk.Frame(bottom_center_container, style='Progress.TFrame')
-        daily_avg_frame.pack(side=tk.LEFT, padx=(0, 25))  # 25px gap between Daily and Weekly
-        ttk.Label(daily_avg_frame, text="Daily Average", 
-                 font=config.get_font(config.Fonts.SIZE_NORMAL, 'bold'), 
-                 foreground=self.colors.TEAL_DARK, background=frame_bg).pack()
-        daily_avg_label = ttk.Label(daily_avg_frame, text=f"${daily_avg:.2f} /day", 
-                                   font=config.get_font(config.Fonts.SIZE_NORMAL),
-                                   foreground=self.colors.TEXT_BLACK, background=frame_bg)
-        daily_avg_label.pack()
+        ttk.Label(bottom_row, text="Daily Average", 
+                 font=FONT_NORMAL_BOLD, 
+                 foreground=colors.TEAL_DARK, background=frame_bg).grid(row=0, column=0, padx=(0, 25))
+        daily_avg_label = ttk.Label(bottom_row, text=labels['daily_average'], 
+                                   font=FONT_NORMAL,
+                                   foreground=colors.TEXT_BLACK, background=frame_bg)
+        daily_avg_label.grid(row=1, column=0, padx=(0, 25))  # 25px gap between Daily and Weekly
         self.widgets['daily_avg_label'] = daily_avg_label
         
         # Weekly average label
-        weekly_avg_frame = ttk.Frame(bottom_center_container, style='Progress.TFrame')
-        weekly_avg_frame.pack(side=tk.LEFT, padx=(25, 0))  # 25px gap between Daily and Weekly
-        ttk.Label(weekly_avg_frame, text="Weekly Average", 
-                 font=config.get_font(config.Fonts.SIZE_NORMAL, 'bold'), 
-                 foreground=self.colors.AMBER_DARK, background=frame_bg).pack()
-        weekly_avg_label = ttk.Label(weekly_avg_frame, text=f"${weekly_avg:.2f} /week", 
-                                    font=config.get_font(config.Fonts.SIZE_NORMAL),
-                                    foreground=self.colors.TEXT_BLACK, background=frame_bg)
-        weekly_avg_label.pack()
+        ttk.Label(bottom_row, text="Weekly Average", 
+                 font=FONT_NORMAL_BOLD, 
+                 foreground=colors.AMBER_DARK, background=frame_bg).grid(row=0, column=1, padx=(25, 0))
+        weekly_avg_label = ttk.Label(bottom_row, text=labels['weekly_average'], 
+                                    font=FONT_NORMAL,
+                                    foreground=colors.TEXT_BLACK, background=frame_bg)
+        weekly_avg_label.grid(row=1, column=1, padx=(25, 0))
         self.widgets['weekly_avg_label'] = weekly_avg_label
         
-    def create_analytics_section(self):
+    def create_analytics_section(self, context_date=None):
         """Create spending analysis section - using CustomTkinter"""
+        colors = self.colors
+        frame_bg = self._frame_bg
+        
         # Title label OUTSIDE the frame (like ttk.LabelFrame puts title above border)
         # ttk.LabelFrame titles use smaller font (typically 9-10pt), reduce from SIZE_NORMAL (11pt)
         # Use theme-aware text color: TEXT_BLACK (light) or TEXT_PRIMARY (dark)
         # Match parent frame background (main_frame) - BG_SECONDARY in dark, BG_LIGHT_GRAY in light
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
         style = ttk.Style()
         style.configure('SectionTitle.TLabel', 
-                       font=config.get_font(config.Fonts.SIZE_SMALL),
-                       foreground=self.colors.TEXT_BLACK,
+                       font=FONT_SMALL,
+                       foreground=colors.TEXT_BLACK,
                        background=frame_bg)
         title_label = ttk.Label(
             self.frame, 
@@ -305,38 +345,32 @@ class DashboardPageBuilder:
         title_label.grid(row=6, column=0, columnspan=2, pady=(0, 0), sticky=tk.W)  # No spacing - bring frame closer
         
         # Frame uses theme-aware background with subtle border
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
-        border_color = self.colors.BG_DARK_GRAY
-        analytics_frame = ctk.CTkFrame(
-            self.frame, 
-            fg_color=frame_bg,
-            border_width=1,
-            border_color=border_color
+        border_color = colors.BG_DARK_GRAY
+        analytics_frame = tk.Frame(
+            self.frame,
+            bg=frame_bg,
+            bd=0,
+            highlightthickness=1,
+            highlightbackground=border_color
         )
         analytics_frame.grid(row=7, column=0, columnspan=2, pady=(0, 6), sticky=(tk.W, tk.E))  # Reduced spacing between sections
         
-        context_date = self.callbacks['get_context_date']()
-        weekly_pace, pace_days = ExpenseAnalytics.calculate_weekly_pace(
-            self.tracker.expenses, context_date
-        )
+        if context_date is None:
+            context_date = self.callbacks['get_context_date']()
+        metrics = self._get_metrics(context_date)
+        pace_text = metrics['labels']['weekly_pace']
+        pace_days = metrics['weekly_pace'][1]
         
         # Calculate previous month data with comparison
         # Pass viewed_month only if truly in archive mode (not current month)
         viewed_month = self.tracker.viewed_month if self.callbacks['is_archive_mode']() else None
-        prev_month_date = datetime.now().replace(day=1) - timedelta(days=1)
-        prev_month_key = prev_month_date.strftime('%Y-%m')
-        prev_data_folder = f"data_{prev_month_key}"
-        prev_month_total, prev_month_name, comparison = ExpenseAnalytics.calculate_monthly_trend(
-            prev_data_folder,
-            self.tracker.monthly_total,
-            viewed_month
-        )
+        # Placeholders until _load_prev_month has read the previous month's file off the UI thread
+        prev_month_total = prev_month_name = PREV_MONTH_PLACEHOLDER
         
         # Side by side: Weekly Pace and Previous Month
         # Original: row = ttk.Frame(analytics_frame); row.pack(fill=tk.X)
         # padding="10" means 10px all around, but optimize for compactness
-        # Configure ttk.Frame to match CTkFrame background (prevents black bar)
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
+        # Configure ttk.Frame to match the section frame background (prevents black bar)
         style = ttk.Style()
         style.configure('Analytics.TFrame', background=frame_bg)
         row = ttk.Frame(analytics_frame, style='Analytics.TFrame')
@@ -348,15 +382,15 @@ class DashboardPageBuilder:
         
         # Label uses same background as frame
         ttk.Label(pace_frame, text="Weekly Pace", 
-                 font=config.get_font(config.Fonts.SIZE_NORMAL, 'bold'), 
-                 foreground=self.colors.ORANGE_PRIMARY, background=frame_bg).pack()
-        pace_label = ttk.Label(pace_frame, text=f"${weekly_pace:.2f} /day", 
-                              font=config.get_font(config.Fonts.SIZE_NORMAL),
-                              foreground=self.colors.TEXT_BLACK, background=frame_bg)
+                 font=FONT_NORMAL_BOLD, 
+                 foreground=colors.ORANGE_PRIMARY, background=frame_bg).pack()
+        pace_label = ttk.Label(pace_frame, text=pace_text, 
+                              font=FONT_NORMAL,
+                              foreground=colors.TEXT_BLACK, background=frame_bg)
         pace_label.pack()
         ttk.Label(pace_frame, text=f"(this week: {pace_days} day{'s' if pace_days != 1 else ''})", 
                  font=config.Fonts.LABEL, 
-                 foreground=self.colors.TEXT_GRAY_MEDIUM, background=frame_bg).pack()
+                 foreground=colors.TEXT_GRAY_MEDIUM, background=frame_bg).pack()
         self.widgets['pace_label'] = pace_label
         
         # Budget comparison label
@@ -365,21 +399,14 @@ class DashboardPageBuilder:
         
         # vs. Budget label: Use BLUE_BUDGET in dark mode (#3E6AAA), BLUE_DARK_NAVY in light mode (#1E3A8A)
         # Budget color uses theme-aware blue
-        is_dark = self.theme_manager.is_dark_mode() if self.theme_manager else False
-        budget_label_color = self.colors.BLUE_BUDGET if (is_dark and hasattr(self.colors, 'BLUE_BUDGET')) else self.colors.BLUE_DARK_NAVY
+        is_dark = self._is_dark
+        budget_label_color = colors.BLUE_BUDGET if (is_dark and hasattr(colors, 'BLUE_BUDGET')) else colors.BLUE_DARK_NAVY
         # Label uses same background as frame
-        frame_bg = self.colors.BG_SECONDARY if is_dark else self.colors.BG_LIGHT_GRAY
-        ttk.Label(budget_frame, text="vs. Budget", font=config.get_font(config.Fonts.SIZE_NORMAL, 'bold'), 
+        ttk.Label(budget_frame, text="vs. Budget", font=FONT_NORMAL_BOLD, 
                  foreground=budget_label_color, background=frame_bg).pack()
         
         # Read budget threshold from settings
-        budget_threshold = get_settings_manager().get('Budget', 'monthly_threshold', 0.0)
-        
-        # Convert to float (settings returns string)
-        try:
-            budget_threshold = float(budget_threshold)
-        except (ValueError, TypeError):
-            budget_threshold = 0.0
+        budget_threshold = get_settings_manager().get_float('Budget', 'monthly_threshold', 0.0)
         
         if budget_threshold > 0:
             difference = budget_threshold - self.tracker.monthly_total
@@ -389,8 +416,8 @@ class DashboardPageBuilder:
                 budget_amount_text = f"+${difference:,.2f}"
                 budget_status_text = "(Under)"
                 # In dark mode, GREEN_PRIMARY is already bright (#00cc66), in light mode use standard green
-                if self.theme_manager and self.theme_manager.is_dark_mode():
-                    budget_color = self.colors.GREEN_PRIMARY  # #00cc66 (bright green for dark mode)
+                if is_dark:
+                    budget_color = colors.GREEN_PRIMARY  # #00cc66 (bright green for dark mode)
                 else:
                     budget_color = config.Colors.GREEN_PRIMARY  # #107c10 (standard green for light mode)
             else:
@@ -398,19 +425,19 @@ class DashboardPageBuilder:
                 budget_amount_text = f"-${abs(difference):,.2f}"
                 budget_status_text = "(Over)"
                 # In dark mode, RED_PRIMARY is already bright (#f48771), in light mode use standard red
-                if self.theme_manager and self.theme_manager.is_dark_mode():
-                    budget_color = self.colors.RED_PRIMARY  # #f48771 (coral-red for dark mode)
+                if is_dark:
+                    budget_color = colors.RED_PRIMARY  # #f48771 (coral-red for dark mode)
                 else:
                     budget_color = config.Colors.RED_PRIMARY  # #8B0000 (standard red for light mode)
         else:
             # Not set
             budget_amount_text = "Not set"
             budget_status_text = "(Click Here)"
-            budget_color = self.colors.TEXT_GRAY_MEDIUM
+            budget_color = colors.TEXT_GRAY_MEDIUM
         
         # Amount label (clickable)
         budget_amount_label = ttk.Label(budget_frame, text=budget_amount_text, 
-                                       font=config.get_font(config.Fonts.SIZE_NORMAL),
+                                       font=FONT_NORMAL,
                                        foreground=budget_color, background=frame_bg, cursor='hand2')
         budget_amount_label.pack()
         budget_amount_label.bind('<Button-1>', self.callbacks['show_budget_dialog'])
@@ -430,10 +457,9 @@ class DashboardPageBuilder:
         prev_month_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))  # Reduced gap from 10 to 5
         
         # Label uses same background as frame
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
         ttk.Label(prev_month_frame, text="Previous Month", 
-                 font=config.get_font(config.Fonts.SIZE_NORMAL, 'bold'), 
-                 foreground=self.colors.PURPLE_PRIMARY, background=frame_bg).pack()
+                 font=FONT_NORMAL_BOLD, 
+                 foreground=colors.PURPLE_PRIMARY, background=frame_bg).pack()
         
         # Amount with comparison indicator (side-by-side)
         amount_container = ttk.Frame(prev_month_frame, style='Analytics.TFrame')
@@ -441,8 +467,8 @@ class DashboardPageBuilder:
         
         # Previous month amount (theme-aware text color)
         trend_label = ttk.Label(amount_container, text=f"{prev_month_total} ", 
-                               font=config.get_font(config.Fonts.SIZE_NORMAL),
-                               foreground=self.colors.TEXT_BLACK, background=frame_bg)
+                               font=FONT_NORMAL,
+                               foreground=colors.TEXT_BLACK, background=frame_bg)
         trend_label.pack(side=tk.LEFT)
         self.widgets['trend_label'] = trend_label
         
@@ -451,40 +477,80 @@ class DashboardPageBuilder:
             amount_container,
             text="",  # Will be updated with indicator
             font=config.Fonts.LABEL,
-            foreground=self.colors.TEXT_GRAY_MEDIUM, background=frame_bg
+            foreground=colors.TEXT_GRAY_MEDIUM, background=frame_bg
         )
         comparison_label.pack(side=tk.LEFT)
         self.widgets['comparison_label'] = comparison_label
         
-        # Update comparison indicator if available
-        if comparison:
-            indicator_text = f"{comparison['symbol']} "
-            if comparison['direction'] == 'similar':
-                indicator_text += f"+{comparison['percentage']:.1f}%"
-            else:
-                sign = "+" if comparison['direction'] == 'increase' else "-"
-                indicator_text += f"{sign}{comparison['percentage']:.0f}%"
-            
-            comparison_label.configure(foreground=comparison['color'], text=indicator_text)
-        
         # Month name context (updates dynamically)
         trend_context_label = ttk.Label(prev_month_frame, text=prev_month_name, 
                                        font=config.Fonts.LABEL, 
-                                       foreground=self.colors.TEXT_GRAY_MEDIUM, background=frame_bg)
+                                       foreground=colors.TEXT_GRAY_MEDIUM, background=frame_bg)
         trend_context_label.pack()
         self.widgets['trend_context_label'] = trend_context_label
         
+        threading.Thread(
+            target=self._load_prev_month,
+            args=(self.tracker.monthly_total, viewed_month),
+            daemon=True
+        ).start()
+        
+    def _load_prev_month(self, monthly_total, viewed_month):
+        """
+        Worker thread: compute the previous-month trend, then apply it on the Tk thread.
+        
+        The result is posted through the tracker's gui_queue, like other
+        background-thread GUI work.
+        """
+        try:
+            trend = ExpenseAnalytics.calculate_monthly_trend(monthly_total, viewed_month)
+        except Exception as e:
+            log_error("Error loading previous month trend", e)
+            return
+        self.tracker.gui_queue.put(lambda: self._apply_prev_month(*trend))
+        
+    def _apply_prev_month(self, prev_month_total, prev_month_name, comparison):
+        """
+        Replace the Previous Month placeholders with the loaded trend.
+        
+        Skipped if a display update has already filled the labels, since
+        its values are at least as recent as this build's.
+        """
+        trend_label = self.widgets['trend_label']
+        try:
+            if str(trend_label.cget('text')) != f"{PREV_MONTH_PLACEHOLDER} ":
+                return
+            
+            trend_label.configure(text=f"{prev_month_total} ")
+            self.widgets['trend_context_label'].configure(text=prev_month_name)
+            
+            # Update comparison indicator if available
+            if comparison:
+                indicator_text = f"{comparison['symbol']} "
+                if comparison['direction'] == 'similar':
+                    indicator_text += f"+{comparison['percentage']:.1f}%"
+                else:
+                    sign = "+" if comparison['direction'] == 'increase' else "-"
+                    indicator_text += f"{sign}{comparison['percentage']:.0f}%"
+                
+                self.widgets['comparison_label'].configure(foreground=comparison['color'], text=indicator_text)
+        except tk.TclError:
+            # Dashboard was destroyed before the result arrived
+            pass
+        
     def create_expenses_section(self):
         """Create recent expenses section - using CustomTkinter"""
+        colors = self.colors
+        frame_bg = self._frame_bg
+        
         # Title label OUTSIDE the frame (like ttk.LabelFrame puts title above border)
         # ttk.LabelFrame titles use smaller font (typically 9-10pt), reduce from SIZE_NORMAL (11pt)
         # Use theme-aware text color: TEXT_BLACK (light) or TEXT_PRIMARY (dark)
         # Match parent frame background (main_frame) - BG_SECONDARY in dark, BG_LIGHT_GRAY in light
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
         style = ttk.Style()
         style.configure('SectionTitle.TLabel', 
-                       font=config.get_font(config.Fonts.SIZE_SMALL),
-                       foreground=self.colors.TEXT_BLACK,
+                       font=FONT_SMALL,
+                       foreground=colors.TEXT_BLACK,
                        background=frame_bg)
         title_label = ttk.Label(
             self.frame, 
@@ -494,13 +560,13 @@ class DashboardPageBuilder:
         title_label.grid(row=8, column=0, columnspan=2, pady=(0, 0), sticky=tk.W)  # No spacing - bring frame closer
         
         # Frame uses theme-aware background with subtle border
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
-        border_color = self.colors.BG_DARK_GRAY
-        expenses_frame = ctk.CTkFrame(
-            self.frame, 
-            fg_color=frame_bg,
-            border_width=1,
-            border_color=border_color
+        border_color = colors.BG_DARK_GRAY
+        expenses_frame = tk.Frame(
+            self.frame,
+            bg=frame_bg,
+            bd=0,
+            highlightthickness=1,
+            highlightbackground=border_color
         )
         expenses_frame.grid(row=9, column=0, columnspan=2, pady=(0, 5), sticky=(tk.W, tk.E, tk.N, tk.S))  # Reduced spacing, allow expansion
         
@@ -510,8 +576,7 @@ class DashboardPageBuilder:
         expenses_frame.columnconfigure(0, weight=1)  # Original: columnconfigure(0, weight=1)
         
         # Container for expense labels with padding
-        # Match Analytics section: Use custom style to match CTkFrame background (prevents black bar)
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
+        # Match Analytics section: Use custom style to match the section frame background (prevents black bar)
         style = ttk.Style()
         style.configure('Expenses.TFrame', background=frame_bg)
         expenses_container = ttk.Frame(expenses_frame, style='Expenses.TFrame')
@@ -524,7 +589,7 @@ class DashboardPageBuilder:
             expenses_container, 
             text="No recent expenses", 
             font=config.Fonts.LABEL, 
-            foreground=self.colors.TEXT_BROWN, 
+            foreground=colors.TEXT_BROWN, 
             background=frame_bg,
             anchor='w'
         )
@@ -535,7 +600,7 @@ class DashboardPageBuilder:
             expenses_container, 
             text="", 
             font=config.Fonts.LABEL, 
-            foreground=self.colors.TEXT_BROWN, 
+            foreground=colors.TEXT_BROWN, 
             background=frame_bg,
             anchor='w'
         )
@@ -544,10 +609,11 @@ class DashboardPageBuilder:
         
     def create_buttons_section(self):
         """Create button section with proper spacing - using CustomTkinter CTkButton"""
+        colors = self.colors
+        frame_bg = self._frame_bg
+        
         # Original: button_frame.grid(row=7, column=0, columnspan=2, pady=(0, 10), sticky=(tk.W, tk.E))
         # Style button_frame to match main_frame background (BG_SECONDARY in dark, BG_LIGHT_GRAY in light)
-        is_dark = self.theme_manager.is_dark_mode() if self.theme_manager else False
-        frame_bg = self.colors.BG_SECONDARY if is_dark else self.colors.BG_LIGHT_GRAY
         style = ttk.Style()
         style.configure("ButtonSection.TFrame", background=frame_bg)
         button_frame = ttk.Frame(self.frame, style="ButtonSection.TFrame")
@@ -560,17 +626,17 @@ class DashboardPageBuilder:
         # In light mode: GREEN_PRIMARY = #107c10
         # In dark mode: GREEN_BUTTON = #107c10 (explicitly set to match light mode)
         # Use GREEN_BUTTON if available (dark mode), otherwise GREEN_PRIMARY (light mode)
-        if hasattr(self.colors, 'GREEN_BUTTON'):
-            button_color = self.colors.GREEN_BUTTON  # Dark mode: #107c10
+        if hasattr(colors, 'GREEN_BUTTON'):
+            button_color = colors.GREEN_BUTTON  # Dark mode: #107c10
         else:
-            button_color = self.colors.GREEN_PRIMARY  # Light mode: #107c10
+            button_color = colors.GREEN_PRIMARY  # Light mode: #107c10
         
         add_expense_btn = ctk.CTkButton(
             button_frame,
             text="+ Add Expense",
             command=self.tracker.add_expense,
             fg_color=button_color,
-            hover_color=self.colors.GREEN_HOVER,
+            hover_color=colors.GREEN_HOVER,
             corner_radius=config.CustomTkinterTheme.CORNER_RADIUS,
             height=30,  # Reduced from BUTTON_HEIGHT (35) to 30 for more compact appearance
             font=config.Fonts.BUTTON,
@@ -589,8 +655,8 @@ class DashboardPageBuilder:
             corner_radius=config.CustomTkinterTheme.CORNER_RADIUS,
             height=30,  # Reduced from BUTTON_HEIGHT (35) to 30 for more compact appearance
             font=config.Fonts.BUTTON,
-            fg_color=self.colors.BLUE_DARK_NAVY,  # Dark navy blue
-            hover_color=self.colors.BLUE_NAVY,  # Lighter navy on hover
+            fg_color=colors.BLUE_DARK_NAVY,  # Dark navy blue
+            hover_color=colors.BLUE_NAVY,  # Lighter navy on hover
             text_color="white"  # Explicit text color for visibility
         )
         nav_button.grid(row=0, column=1, padx=(8, 0), sticky=(tk.W, tk.E))  # Reduced padx from 10 to 8
@@ -92,7 +92,7 @@ class ExpenseDataManager:
         
         total = sum(
             expense['amount'] for expense in expenses
-            if (dt := DateUtils.parse_date(expense['date'])) and dt.date() <= today
+            if (d := DateUtils.parse_date_only(expense['date'])) and d <= today
         )
         
         return total
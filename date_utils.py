@@ -1,8 +1,76 @@
 """Date utility functions. All dates use ISO 8601 format (YYYY-MM-DD) internally."""
 
-from datetime import datetime, timedelta
-from calendar import monthrange
-from typing import Optional, Tuple
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+
+# Full month names indexed by month number (index 0 unused), built once instead of per strftime("%B") call
+_MONTH_NAMES = ("", *(datetime(2000, month, 1).strftime("%B") for month in range(1, 13)))
+
+# Days per month in a common year (index 0 unused); February of leap years is handled by _days_in
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in(year: int, month: int) -> int:
+    """Number of days in a month (calendar.monthrange(year, month)[1] without the tuple)."""
+    if not 1 <= month <= 12:
+        raise ValueError(f"bad month number {month}; must be 1-12")
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+# Today's date/month strings and the monotonic time they were read - see _current_strings
+_CURRENT_TTL = 1.0  # seconds
+_current_cache = {"t": None, "d": "", "m": ""}
+
+
+def _current_strings() -> dict:
+    """Today's "YYYY-MM-DD"/"YYYY-MM" strings, re-read from the clock at most once per _CURRENT_TTL."""
+    now_ts = time.monotonic()
+    cache = _current_cache
+    if cache["t"] is None or now_ts - cache["t"] > _CURRENT_TTL:
+        now = datetime.now()
+        cache["d"] = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        cache["m"] = f"{now.year:04d}-{now.month:02d}"
+        cache["t"] = now_ts
+    return cache
+
+
+def _parse_iso_bytes(b: bytes) -> Tuple[int, int, int]:
+    """Year, month and day of an ASCII b"YYYY-MM-DD" whose digit positions are already checked."""
+    # Indexing bytes yields ints, so no one-character strings or int() calls are involved
+    return ((b[0] - 48) * 1000 + (b[1] - 48) * 100 + (b[2] - 48) * 10 + (b[3] - 48),
+            (b[5] - 48) * 10 + (b[6] - 48),
+            (b[8] - 48) * 10 + (b[9] - 48))
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(date_str) -> Optional[datetime]:
+    """Memoized body of DateUtils.parse_date (invalid strings cache as None)."""
+    # Fast path: well-formed YYYY-MM-DD is read as ASCII bytes straight into the datetime
+    # constructor, skipping strptime's locale and format-string handling
+    if isinstance(date_str, bytes):
+        raw = date_str
+        date_str = raw.decode('ascii', 'replace')
+    elif isinstance(date_str, str) and date_str.isascii():
+        raw = date_str.encode('ascii')
+    else:
+        raw = b''  # Non-ASCII text or a non-string: left to strptime
+    if (len(raw) == 10 and raw[4:5] == b'-' and raw[7:8] == b'-'
+            and raw[:4].isdigit() and raw[5:7].isdigit() and raw[8:].isdigit()):
+        try:
+            return datetime(*_parse_iso_bytes(raw))
+        except ValueError:
+            return None
+    
+    # Anything else (e.g. unpadded "2025-1-5") keeps strptime's lenient parsing
+    try:
+        return datetime.strptime(date_str, DateUtils.DATE_FORMAT)
+    except ValueError:
+        return None
 
 
 class DateUtils:
@@ -15,12 +83,20 @@ class DateUtils:
     
     @staticmethod
     def parse_date(date_str: str) -> Optional[datetime]:
-        """Parse YYYY-MM-DD date string to datetime. Returns None if invalid."""
+        """Parse YYYY-MM-DD date string (or ASCII bytes) to datetime. Returns None if invalid."""
+        # Expense lists repeat the same dates, so parses are memoized (datetimes are immutable)
         try:
-            return datetime.strptime(date_str, DateUtils.DATE_FORMAT)
-        except (ValueError, TypeError):
+            return _parse_cached(date_str)
+        except TypeError:
+            # Non-string or unhashable input
             return None
     
+    @staticmethod
+    def parse_date_only(date_str: str) -> Optional[date]:
+        """Parse YYYY-MM-DD date string to a date (no time component). Returns None if invalid."""
+        dt = DateUtils.parse_date(date_str)
+        return dt.date() if dt else None
+    
     @staticmethod
     def is_valid_date(date_str: str) -> bool:
         """Check if date string is valid YYYY-MM-DD format."""
@@ -29,22 +105,23 @@ class DateUtils:
     @staticmethod
     def format_date(dt: datetime) -> str:
         """Format datetime as YYYY-MM-DD string."""
-        return dt.strftime(DateUtils.DATE_FORMAT)
+        # f-string assembly of the fields avoids strftime's C/locale round-trip
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
     
     @staticmethod
     def get_current_date_str() -> str:
-        """Get current date as YYYY-MM-DD string."""
-        return datetime.now().strftime(DateUtils.DATE_FORMAT)
+        """Get current date as YYYY-MM-DD string (cached for up to a second)."""
+        return _current_strings()["d"]
     
     @staticmethod
     def get_current_month_str() -> str:
-        """Get current month as YYYY-MM string."""
-        return datetime.now().strftime(DateUtils.MONTH_FORMAT)
+        """Get current month as YYYY-MM string (cached for up to a second)."""
+        return _current_strings()["m"]
     
     @staticmethod
     def get_month_folder_name(dt: datetime) -> str:
         """Get data folder name for date (format: "data_YYYY-MM")."""
-        return f"data_{dt.strftime(DateUtils.MONTH_FORMAT)}"
+        return f"data_{dt.year:04d}-{dt.month:02d}"
     
     @staticmethod
     def get_month_folder_from_string(date_str: str) -> Optional[str]:
@@ -57,6 +134,14 @@ class DateUtils:
     @staticmethod
     def parse_month_folder_name(folder_name: str) -> Optional[Tuple[int, int]]:
         """Parse "data_YYYY-MM" folder name to (year, month) tuple. Returns None if invalid."""
+        # Fast path for the canonical 12-character name: slice and convert, no split/map
+        if (type(folder_name) is str and len(folder_name) == 12
+                and folder_name[9] == '-' and folder_name.startswith("data_")):
+            year_str, month_str = folder_name[5:9], folder_name[10:]
+            if year_str.isdigit() and month_str.isdigit() and (year_str + month_str).isascii():
+                month = int(month_str)
+                return (int(year_str), month) if 1 <= month <= 12 else None
+        
         try:
             if folder_name.startswith("data_"):
                 month_str = folder_name[5:]  # Remove "data_" prefix
@@ -70,32 +155,29 @@ class DateUtils:
     @staticmethod
     def get_previous_month(dt: datetime) -> datetime:
         """Get first day of previous month from given date."""
-        # Go to first day of current month, then subtract one day
-        first_of_month = dt.replace(day=1)
-        last_of_prev_month = first_of_month - timedelta(days=1)
-        return last_of_prev_month.replace(day=1)
+        # Integer month arithmetic; no timedelta or days-in-month lookup needed
+        if dt.month == 1:
+            return dt.replace(year=dt.year - 1, month=12, day=1)
+        return dt.replace(month=dt.month - 1, day=1)
     
     @staticmethod
     def get_next_month(dt: datetime) -> datetime:
         """Get first day of next month from given date."""
-        # Get the last day of current month, then add one day
-        last_day = monthrange(dt.year, dt.month)[1]
-        last_of_month = dt.replace(day=last_day)
-        first_of_next = last_of_month + timedelta(days=1)
-        return first_of_next
+        if dt.month == 12:
+            return dt.replace(year=dt.year + 1, month=1, day=1)
+        return dt.replace(month=dt.month + 1, day=1)
     
     @staticmethod
     def format_month_display(dt: datetime) -> str:
         """Format datetime as display-friendly month name (e.g., "October 2025")."""
-        return dt.strftime(DateUtils.DISPLAY_FORMAT)
+        return f"{_MONTH_NAMES[dt.month]} {dt.year}"
     
     @staticmethod
     def get_month_name(month: int) -> str:
         """Get full month name from month number (1-12)."""
         try:
-            dt = datetime(2000, month, 1)  # Use year 2000 as dummy
-            return dt.strftime("%B")
-        except ValueError:
+            return _MONTH_NAMES[month] if 1 <= month <= 12 else ""
+        except TypeError:
             return ""
     
     @staticmethod
@@ -107,8 +189,7 @@ class DateUtils:
     @staticmethod
     def get_last_day_of_month(year: int, month: int) -> str:
         """Get last day of month as YYYY-MM-DD string."""
-        last_day = monthrange(year, month)[1]
-        dt = datetime(year, month, last_day)
+        dt = datetime(year, month, _days_in(year, month))
         return DateUtils.format_date(dt)
     
     @staticmethod
@@ -118,4 +199,33 @@ class DateUtils:
         if dt:
             return (dt.year, dt.month)
         return None
-
+    
+    @staticmethod
+    def parse_dates_batch(date_strs: Iterable[str]) -> List[int]:
+        """
+        Parse many YYYY-MM-DD strings to proleptic ordinals (date.toordinal()) in one call.
+        
+        Distinct strings are parsed once per batch, and the int results compare
+        faster than datetimes when used as sort keys.
+        
+        Args:
+            date_strs: Date strings (invalid entries are allowed)
+        
+        Returns:
+            List of ordinals in input order; 0 for invalid dates, which sorts them first
+        """
+        parse = DateUtils.parse_date
+        seen = {}
+        ordinals = []
+        append = ordinals.append
+        for date_str in date_strs:
+            try:
+                ordinal = seen[date_str]
+            except KeyError:
+                dt = parse(date_str)
+                ordinal = seen[date_str] = dt.toordinal() if dt else 0
+            except TypeError:
+                # Unhashable entry - never a valid date
+                ordinal = 0
+            append(ordinal)
+        return ordinals
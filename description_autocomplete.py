@@ -1,134 +1,292 @@
 """Smart description suggestions based on expense history for auto-complete."""
 
+import atexit
 import json
 import os
+import threading
+import time
+from operator import attrgetter
 from typing import List, Dict, Optional
-from datetime import datetime
+from date_utils import DateUtils
 from settings_manager import get_settings_manager
 
+try:
+    # Optional faster C encoder/parser; falls back to the stdlib json module
+    import orjson
+    
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _json_loads = json.loads
+
+
+class DescriptionEntry:
+    """
+    One remembered description and its usage.
+    
+    Slotted instead of a dict; converted to/from dicts only when the history
+    file is read or written. Item access (entry['text']) is kept for callers
+    of get_suggestions.
+    """
+    
+    __slots__ = ('text', 'lower', 'count', 'last_used', 'last_amount')
+    
+    def __init__(self, text: str, count: int, last_used: str, last_amount: Optional[float]):
+        self.text = text
+        self.lower = text.lower()  # Lookup/prefix-match key; text never changes after creation
+        self.count = count
+        self.last_used = last_used
+        self.last_amount = last_amount
+    
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DescriptionEntry':
+        """Build an entry from its JSON dict (missing fields get neutral defaults)."""
+        return cls(data.get('text', ''), data.get('count', 0), data.get('last_used', ''),
+                   data.get('last_amount'))
+    
+    def to_dict(self) -> Dict:
+        """JSON dict for the history file."""
+        return {
+            'text': self.text,
+            'count': self.count,
+            'last_used': self.last_used,
+            'last_amount': self.last_amount
+        }
+
 
 class DescriptionHistory:
     """Manage description history for auto-complete suggestions."""
     
+    # Minimum seconds between history writes from add_or_update (see maybe_save)
+    SAVE_INTERVAL = 5.0
+    
     def __init__(self, file_path="description_history.json"):
         """Initialize description history manager with file path."""
         self.file_path = file_path
-        self.descriptions = []
+        self.descriptions = []  # DescriptionEntry objects, most used first
+        self._by_key = {}  # Lowercased text -> entry in self.descriptions
+        self._buckets = None  # First lowercased char -> [entry], see _first_char_buckets
+        # Last prefix and all its matches, so a typed-on prefix filters these instead of its bucket
+        self._last_prefix = None
+        self._last_matches = None
         self.settings = get_settings_manager()
-        self.load()
+        self.reload_settings()
+        self._dirty = False  # Changes not yet written to file_path
+        self._last_save_ts = 0.0
+        # The history file is read off the UI thread; methods that use the list wait for it
+        self._loaded = threading.Event()
+        threading.Thread(target=self._load_async, daemon=True).start()
+        # Pending changes are written on interpreter exit as well as on quit_app
+        atexit.register(self.flush)
+    
+    def reload_settings(self):
+        """
+        Read the AutoComplete settings into attributes.
+        
+        They are looked up on every keystroke, so they are cached here; call
+        this again after changing the AutoComplete section of settings.ini.
+        """
+        settings = self.settings
+        self._max_desc = settings.get('AutoComplete', 'max_descriptions', 50, value_type=int)
+        self._max_sugg = settings.get('AutoComplete', 'max_suggestions', 5, value_type=int)
+        self._show_on_focus = settings.get('AutoComplete', 'show_on_focus', True, value_type=bool)
+        self._min_chars = settings.get('AutoComplete', 'min_chars', 2, value_type=int)
+    
+    def _load_async(self):
+        """Background-thread load started by __init__."""
+        try:
+            self.load()
+        finally:
+            self._loaded.set()
+    
+    def _wait_loaded(self):
+        """Block until the initial background load has finished (normally long done)."""
+        self._loaded.wait()
     
     def load(self):
         """Load description history from JSON file."""
         if os.path.exists(self.file_path):
             try:
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.descriptions = data.get('descriptions', [])
+                with open(self.file_path, 'rb') as f:
+                    data = _json_loads(f.read())
+                    self.descriptions = [DescriptionEntry.from_dict(d) for d in data.get('descriptions', [])]
+                    # add_or_update relies on this order (count, then last_used, both descending).
+                    # Both keys descend, so one reversed (still stable) sort on the pair does it.
+                    self.descriptions.sort(key=attrgetter('count', 'last_used'), reverse=True)
             except (json.JSONDecodeError, IOError):
                 self.descriptions = []
         else:
             self.descriptions = []
+        self._rebuild_index()
+    
+    def _rebuild_index(self):
+        """Rebuild the lowercased-text index (the first entry wins for duplicate texts)."""
+        by_key = {}
+        for d in self.descriptions:
+            by_key.setdefault(d.lower, d)
+        self._by_key = by_key
+        self._reset_lookup()
     
     def save(self):
         """Save description history to JSON file."""
         try:
-            data = {'descriptions': self.descriptions}
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            data = {'descriptions': [d.to_dict() for d in self.descriptions]}
+            payload = _json_dumps(data)
+            # Encoded up front and written in one call
+            with open(self.file_path, 'wb') as f:
+                f.write(payload)
+            self._dirty = False
+            self._last_save_ts = time.monotonic()
         except IOError:
             pass
     
+    def maybe_save(self, min_interval: float = None):
+        """Save pending changes unless the last save was less than min_interval seconds ago."""
+        if min_interval is None:
+            min_interval = self.SAVE_INTERVAL
+        if self._dirty and time.monotonic() - self._last_save_ts >= min_interval:
+            self.save()
+    
+    def flush(self):
+        """Save pending changes now (call on shutdown)."""
+        if self._dirty:
+            self.save()
+    
     def add_or_update(self, description: str, amount: float):
         """Add new description or update existing one with usage tracking."""
         normalized = description.strip()
         if not normalized:
             return
         
-        existing = next(
-            (d for d in self.descriptions if d['text'].lower() == normalized.lower()),
-            None
-        )
+        self._wait_loaded()
+        key = normalized.lower()
+        existing = self._by_key.get(key)
         
+        today = DateUtils.get_current_date_str()
         if existing:
-            existing['count'] += 1
-            existing['last_used'] = datetime.now().strftime('%Y-%m-%d')
-            existing['last_amount'] = amount
+            existing.count += 1
+            existing.last_used = today
+            existing.last_amount = amount
+            # The key only grows, so the entry moves up past the neighbours it now
+            # outranks - usually none (it is already first) or one
+            descriptions = self.descriptions
+            i = start = descriptions.index(existing)
+            count = existing.count
+            while i > 0:
+                d = descriptions[i - 1]
+                if count > d.count or (count == d.count and today > d.last_used):
+                    descriptions[i] = d
+                    i -= 1
+                else:
+                    break
+            if i != start:
+                descriptions[i] = existing
+                self._reset_lookup()
         else:
-            self.descriptions.append({
-                'text': normalized,
-                'count': 1,
-                'last_used': datetime.now().strftime('%Y-%m-%d'),
-                'last_amount': amount
-            })
-        
-        self.descriptions.sort(
-            key=lambda x: (-x['count'], x['last_used']),
-            reverse=False
-        )
-        
-        current_count = None
-        group_start = 0
-        for i in range(len(self.descriptions)):
-            desc = self.descriptions[i]
-            if current_count is None:
-                current_count = desc['count']
-            elif desc['count'] != current_count:
-                self.descriptions[group_start:i] = sorted(
-                    self.descriptions[group_start:i],
-                    key=lambda x: x['last_used'],
-                    reverse=True
-                )
-                group_start = i
-                current_count = desc['count']
-        
-        self.descriptions[group_start:] = sorted(
-            self.descriptions[group_start:],
-            key=lambda x: x['last_used'],
-            reverse=True
-        )
+            entry = DescriptionEntry(normalized, 1, today, amount)
+            self._by_key[key] = entry
+            self.descriptions.insert(self._insert_position(entry.count, entry.last_used), entry)
+            self._reset_lookup()
         
         # Keep only top N descriptions (limit memory usage)
-        max_descriptions = self.settings.get(
-            'AutoComplete', 'max_descriptions', 50, value_type=int
-        )
-        self.descriptions = self.descriptions[:max_descriptions]
+        max_descriptions = self._max_desc
+        if len(self.descriptions) > max_descriptions:
+            self.descriptions = self.descriptions[:max_descriptions]
+            self._rebuild_index()
         
-        self.save()
+        # Writes are coalesced; flush() (quit_app/atexit) writes whatever is left
+        self._dirty = True
+        self.maybe_save()
     
-    def get_suggestions(self, partial_text: str = "", limit: int = None) -> List[Dict]:
+    def _insert_position(self, count: int, last_used: str) -> int:
+        """
+        Binary-search where an entry belongs in the sorted descriptions list.
+        
+        The list is kept ordered by count (descending), then last_used (descending);
+        the entry goes after any with an equal key, matching a stable re-sort.
+        """
+        descriptions = self.descriptions
+        lo, hi = 0, len(descriptions)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            d = descriptions[mid]
+            if count > d.count or (count == d.count and last_used > d.last_used):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+    
+    def get_suggestions(self, partial_text: str = "", limit: int = None) -> List[DescriptionEntry]:
         """Get suggestions based on partial text input. Returns list sorted by usage count."""
+        self._wait_loaded()
         if limit is None:
-            limit = self.settings.get(
-                'AutoComplete', 'max_suggestions', 5, value_type=int
-            )
+            limit = self._max_sugg
         
         if not partial_text:
             # No text typed - return most frequently used descriptions
             return self.descriptions[:limit]
         
-        # Case-insensitive prefix matching
+        # Case-insensitive prefix matching, only scanning entries that share the first character
         partial_lower = partial_text.lower().strip()
-        matches = [
-            d for d in self.descriptions
-            if d['text'].lower().startswith(partial_lower)
-        ]
+        if not partial_lower:
+            return self.descriptions[:limit]
+        
+        # Extending the previous prefix (the usual keystroke) can only narrow its matches
+        last_prefix = self._last_prefix
+        if last_prefix is not None and partial_lower.startswith(last_prefix):
+            candidates = self._last_matches
+        else:
+            candidates = self._first_char_buckets().get(partial_lower[0], ())
+        matches = [d for d in candidates if d.lower.startswith(partial_lower)]
+        self._last_prefix = partial_lower
+        self._last_matches = matches
         
         return matches[:limit]
     
+    def _reset_lookup(self):
+        """Drop the prefix buckets and last-match cache after the descriptions list changes."""
+        self._buckets = None
+        self._last_prefix = None
+        self._last_matches = None
+    
+    def _first_char_buckets(self) -> Dict[str, list]:
+        """
+        Group entries by the first character of their lowercased text (built lazily).
+        
+        Each bucket keeps the descriptions order, so keystrokes only scan
+        entries that can match. Any change to the list resets the buckets to None.
+        """
+        if self._buckets is None:
+            buckets = {}
+            for d in self.descriptions:
+                buckets.setdefault(d.lower[:1], []).append(d)
+            self._buckets = buckets
+        return self._buckets
+    
     def should_show_on_focus(self) -> bool:
         """Check if auto-complete should show when field receives focus."""
-        return self.settings.get(
-            'AutoComplete', 'show_on_focus', True, value_type=bool
-        )
+        return self._show_on_focus
     
     def get_min_chars(self) -> int:
         """Get minimum characters required before showing suggestions."""
-        return self.settings.get(
-            'AutoComplete', 'min_chars', 2, value_type=int
-        )
+        return self._min_chars
     
     def clear_history(self):
         """Clear all description history (useful for privacy/reset)."""
+        self._wait_loaded()
         self.descriptions = []
+        self._by_key = {}
+        self._reset_lookup()
         self.save()
 
@@ -1,10 +1,48 @@
 """UI construction for expense list page, separated from update logic."""
 
 import tkinter as tk
-from tkinter import ttk
+from functools import lru_cache
 import customtkinter as ctk
 import config
 from analytics import ExpenseAnalytics
+from error_logger import log_warning
+
+
+# Font tuples used by the page sections (invariant, so built once)
+FONT_SMALL = config.get_font(config.Fonts.SIZE_SMALL)
+FONT_SMALL_BOLD = config.get_font(config.Fonts.SIZE_SMALL, 'bold')
+FONT_NORMAL = config.get_font(config.Fonts.SIZE_NORMAL)
+FONT_LARGE = config.get_font(config.Fonts.SIZE_LARGE)
+
+# grid() sticky values in Tk's string form (no per-call tuple of tk.W/tk.E/... lookups)
+STICKY_NSEW = 'nsew'
+STICKY_WE = 'we'
+
+
+@lru_cache(maxsize=256)
+def format_expense_count(count):
+    """Subtitle for the Total Amount metric, e.g. "(3 expenses)" (memoized; counts repeat)."""
+    return f"({count} expense)" if count == 1 else f"({count} expenses)"
+
+
+@lru_cache(maxsize=256)
+def format_median_count(count):
+    """Subtitle for the Typical Expense metric, e.g. "(median of 3 expenses)"."""
+    return f"(median of {count} expense)" if count == 1 else f"(median of {count} expenses)"
+
+
+class ExpenseCount:
+    """
+    Expense count shared by the page builder and QuickAddHelper.
+    
+    Both update .value so the table change callback can tell deletes from
+    edits; slotted, so reads and writes are plain attribute access.
+    """
+    
+    __slots__ = ('value',)
+    
+    def __init__(self, value: int = 0):
+        self.value = value
 
 
 class ExpenseListPageBuilder:
@@ -17,38 +55,85 @@ class ExpenseListPageBuilder:
         self.callbacks = callbacks
         self.theme_manager = theme_manager
         
+        # Callbacks used on every table change, looked up once
+        self._status_manager = callbacks['status_manager']
+        self._update_display = callbacks['update_display']
+        self._update_metrics = callbacks['update_expense_metrics']
+        # Status bar message/icon pairs shown by _on_expense_change
+        self._deleted_status = (config.Messages.EXPENSE_DELETED, config.StatusBar.SUCCESS_ICON)
+        self._edited_status = (config.Messages.EXPENSE_EDITED, config.StatusBar.SUCCESS_ICON)
+        # Created by the tracker before the GUI and never replaced
+        self._description_history = getattr(expense_tracker, 'description_history', None)
+        
         self.colors = theme_manager.get_colors() if theme_manager else config.Colors
+        self._is_dark = theme_manager.is_dark_mode() if theme_manager else False
+        self._frame_bg = self.colors.BG_SECONDARY if self._is_dark else self.colors.BG_LIGHT_GRAY
+        
+        self._previous_expense_count = ExpenseCount(len(self.expense_tracker.expenses))
         
-        self._previous_expense_count = [len(self.expense_tracker.expenses)]
+        self._frame = None
+        self._table_manager = None
+        self._contents = None  # Widget references from build_contents, once built
         
-    def build_all(self):
-        """Build complete expense list page and return widget references."""
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
-        expense_list_frame = ctk.CTkFrame(self.parent_frame, fg_color=frame_bg)
-        expense_list_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=15, pady=(8, 2))
+    def build_shell(self):
+        """
+        Build the empty, hidden expense list page frame and return its references.
+        
+        The page sections (and the expense_table/quick_add_helper imports behind
+        them) are left to build_contents, called when the page is first shown.
+        The page is hidden and shown with grid_remove()/grid(), never rebuilt, so
+        a repeated call returns the existing frame.
+        """
+        if self._frame is not None:
+            log_warning("ExpenseListPageBuilder.build_shell called again; reusing the existing page")
+            return {
+                'expense_list_frame': self._frame,
+                'count_tracker': self._previous_expense_count
+            }
+        
+        expense_list_frame = ctk.CTkFrame(self.parent_frame, fg_color=self._frame_bg)
+        expense_list_frame.grid(row=0, column=0, sticky=STICKY_NSEW, padx=15, pady=(8, 2))
         
         expense_list_frame.columnconfigure(0, weight=1)
         expense_list_frame.rowconfigure(3, weight=1)
         
-        self._create_header(expense_list_frame)
-        metric_labels = self._create_metrics_section(expense_list_frame)
-        table_manager = self._create_table_section(expense_list_frame)
-        quick_add_helper = self._create_quick_add_section(expense_list_frame, table_manager)
-        
         expense_list_frame.grid_remove()
+        self._frame = expense_list_frame
         
         return {
             'expense_list_frame': expense_list_frame,
-            'metric_labels': metric_labels,
-            'table_manager': table_manager,
-            'count_tracker': self._previous_expense_count,
-            'quick_add_helper': quick_add_helper
+            'count_tracker': self._previous_expense_count
         }
     
+    @property
+    def is_built(self):
+        """Whether build_contents has run."""
+        return self._contents is not None
+    
+    def build_contents(self):
+        """Build the page sections on first call and return widget references (cached afterwards)."""
+        if self._contents is None:
+            expense_list_frame = self._frame
+            self._create_header(expense_list_frame)
+            metric_labels = self._create_metrics_section(expense_list_frame)
+            table_manager = self._create_table_section(expense_list_frame)
+            quick_add_helper = self._create_quick_add_section(expense_list_frame, table_manager)
+            
+            self._contents = {
+                'metric_labels': metric_labels,
+                'table_manager': table_manager,
+                'quick_add_helper': quick_add_helper
+            }
+        return self._contents
+    
     def _create_header(self, parent):
         """Create header with back button, title, and export/import buttons."""
+        colors = self.colors
+        navy = colors.BLUE_DARK_NAVY  # Dark navy blue
+        navy_hover = colors.BLUE_NAVY  # Lighter navy on hover
+        
         header_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        header_frame.grid(row=0, column=0, pady=(0, 5), sticky=(tk.W, tk.E))
+        header_frame.grid(row=0, column=0, pady=(0, 5), sticky=STICKY_WE)
         header_frame.columnconfigure(1, weight=1)
         
         back_button = ctk.CTkButton(
@@ -58,9 +143,9 @@ class ExpenseListPageBuilder:
             width=40,
             height=30,  # Match other buttons
             corner_radius=config.CustomTkinterTheme.CORNER_RADIUS,
-            font=config.get_font(config.Fonts.SIZE_LARGE),  # Larger font for bigger arrow
-            fg_color=self.colors.BLUE_DARK_NAVY,  # Dark navy blue
-            hover_color=self.colors.BLUE_NAVY,  # Lighter navy on hover
+            font=FONT_LARGE,  # Larger font for bigger arrow
+            fg_color=navy,
+            hover_color=navy_hover,
             text_color="white"
         )
         back_button.grid(row=0, column=0, sticky=tk.W, padx=(0, 15))
@@ -69,9 +154,9 @@ class ExpenseListPageBuilder:
             header_frame, 
             text="Expense List", 
             font=config.Fonts.TITLE,
-            text_color=self.colors.TEXT_BLACK
+            text_color=colors.TEXT_BLACK
         )
-        title_label.grid(row=0, column=1, sticky=(tk.W, tk.E))
+        title_label.grid(row=0, column=1, sticky=STICKY_WE)
         
         button_frame = ctk.CTkFrame(header_frame, fg_color="transparent")
         button_frame.grid(row=0, column=2, sticky=tk.E, padx=(15, 0))
@@ -84,8 +169,8 @@ class ExpenseListPageBuilder:
             height=30,  # Compact height like dashboard buttons
             corner_radius=config.CustomTkinterTheme.CORNER_RADIUS,
             font=config.Fonts.BUTTON,
-            fg_color=self.colors.BLUE_DARK_NAVY,  # Dark navy blue
-            hover_color=self.colors.BLUE_NAVY,  # Lighter navy on hover
+            fg_color=navy,
+            hover_color=navy_hover,
             text_color="white"
         )
         export_button.pack(pady=(0, 3))  # Reduced spacing
@@ -99,8 +184,8 @@ class ExpenseListPageBuilder:
             height=30,  # Compact height like dashboard buttons
             corner_radius=config.CustomTkinterTheme.CORNER_RADIUS,
             font=config.Fonts.BUTTON,
-            fg_color=self.colors.BLUE_DARK_NAVY,  # Dark navy blue
-            hover_color=self.colors.BLUE_NAVY,  # Lighter navy on hover
+            fg_color=navy,
+            hover_color=navy_hover,
             text_color="white"
         )
         import_button.pack()
@@ -110,153 +195,116 @@ class ExpenseListPageBuilder:
         # Title label OUTSIDE the frame (like dashboard sections)
         # Use theme-aware text color: TEXT_BLACK (light) or TEXT_PRIMARY (dark)
         # Match parent background to avoid light gray background
-        parent_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
-        title_label = ttk.Label(
+        colors = self.colors
+        frame_bg = self._frame_bg
+        title_label = tk.Label(
             parent, 
             text="Expense Insights", 
-            font=config.get_font(config.Fonts.SIZE_SMALL),
-            foreground=self.colors.TEXT_BLACK,  # Theme-aware: TEXT_BLACK in light, TEXT_PRIMARY in dark
-            background=parent_bg  # Match parent container background
+            font=FONT_SMALL,
+            fg=colors.TEXT_BLACK,  # Theme-aware: TEXT_BLACK in light, TEXT_PRIMARY in dark
+            bg=frame_bg  # Match parent container background
         )
         title_label.grid(row=1, column=0, pady=(0, 0), sticky=tk.W)  # Title above frame
         
         # Frame uses theme-aware background with subtle border
-        frame_bg = parent_bg
-        border_color = self.colors.BG_DARK_GRAY
+        border_color = colors.BG_DARK_GRAY
         metrics_frame = ctk.CTkFrame(
             parent,
             fg_color=frame_bg,
             border_width=1,
             border_color=border_color
         )
-        metrics_frame.grid(row=2, column=0, pady=(0, 0), sticky=(tk.W, tk.E))  # No spacing to move table closer
+        metrics_frame.grid(row=2, column=0, pady=(0, 0), sticky=STICKY_WE)  # No spacing to move table closer
         
-        # Get initial metrics data
-        median_expense, expense_count = ExpenseAnalytics.calculate_median_expense(
-            self.expense_tracker.expenses
-        )
-        largest_expense, largest_desc = ExpenseAnalytics.calculate_largest_expense(
-            self.expense_tracker.expenses
-        )
+        # Get initial metrics data (median, largest and count of past expenses from one pass)
+        stats = ExpenseAnalytics.calculate_past_stats(self.expense_tracker.expenses)
+        median_expense, expense_count = stats.median, stats.count
+        largest_expense, largest_desc = stats.largest_amount, stats.largest_description
+        # Total Amount shows the month's total, not the past-only stats.total
         total_amount = self.expense_tracker.monthly_total
         
         # Three columns: Typical Expense | Total Amount | Largest Expense
-        # Match Analytics section: Use custom style to match CTkFrame background (prevents black bar)
-        frame_bg = self.colors.BG_SECONDARY if self.theme_manager.is_dark_mode() else self.colors.BG_LIGHT_GRAY
-        style = ttk.Style()
-        style.configure('Metrics.TFrame', background=frame_bg)
-        row = ttk.Frame(metrics_frame, style='Metrics.TFrame')  # Use ttk.Frame for internal layout like dashboard
+        # Plain tk widgets with explicit colors: no ttk style lookups, and the archive
+        # restyle tints their standard background like the dashboard's tk.Frames
+        row = tk.Frame(metrics_frame, bg=frame_bg)
         row.pack(fill=tk.X, padx=10, pady=(8, 8))  # Match dashboard padding
         
-        # Typical expense (left) - using ttk.Label with Analytics.TLabel style for values (matches dashboard)
-        # Use accent color for label, Analytics.TLabel style for value (theme-aware)
-        # Frame uses same background as parent
-        typical_frame = ttk.Frame(row, style='Metrics.TFrame')
-        typical_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
-        # Label uses same background as frame
-        ttk.Label(typical_frame, text="Typical Expense", 
-                 font=config.get_font(config.Fonts.SIZE_SMALL, 'bold'), 
-                 foreground=self.colors.TEXT_GRAY_DARK,
-                 background=frame_bg).pack()
-        list_median_label = ttk.Label(typical_frame, text=f"${median_expense:.2f}", 
-                                     font=config.get_font(config.Fonts.SIZE_NORMAL),  # Match Analytics.TLabel font size
-                                     foreground=self.colors.TEXT_BLACK,  # Match main window value colors
-                                     background=frame_bg)  # Explicit background
-        list_median_label.pack()
-        median_count_label = ttk.Label(typical_frame, 
-                                      text=f"(median of {expense_count} expense{'s' if expense_count != 1 else ''})", 
-                                      font=config.Fonts.LABEL_SMALL, 
-                                      foreground=self.colors.TEXT_GRAY_MEDIUM,
-                                      background=frame_bg)
-        median_count_label.pack()
-        
-        total_frame = ttk.Frame(row, style='Metrics.TFrame')
-        total_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-        
-        ttk.Label(total_frame, text="Total Amount", 
-                 font=config.get_font(config.Fonts.SIZE_SMALL, 'bold'), 
-                 foreground=self.colors.GREEN_PRIMARY,
-                 background=frame_bg).pack()
-        list_total_label = ttk.Label(total_frame, text=f"${total_amount:.2f}", 
-                                    style='Analytics.TLabel',  # Use Analytics.TLabel style (theme-aware)
-                                    foreground=self.colors.GREEN_PRIMARY,  # Override with green for total
-                                    background=frame_bg)  # Explicit background
-        list_total_label.pack()
-        expense_count_total = len(self.expense_tracker.expenses)
-        total_count_label = ttk.Label(total_frame, 
-                                     text=f"({expense_count_total} expense{'s' if expense_count_total != 1 else ''})", 
-                                     font=config.Fonts.LABEL_SMALL, 
-                                     foreground=self.colors.TEXT_GRAY_MEDIUM,
-                                     background=frame_bg)  # Explicit background
-        total_count_label.pack()
-        
-        # Largest expense (right) - using ttk.Label with Analytics.TLabel style for values (matches dashboard)
-        # Frame uses same background as parent
-        largest_frame = ttk.Frame(row, style='Metrics.TFrame')
-        largest_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
-        
-        # Label uses same background as frame
-        ttk.Label(largest_frame, text="Largest Expense", 
-                 font=config.get_font(config.Fonts.SIZE_SMALL, 'bold'), 
-                 foreground=self.colors.RED_PRIMARY,
-                 background=frame_bg).pack()
-        largest_label = ttk.Label(largest_frame, text=f"${largest_expense:.2f}", 
-                                 font=config.get_font(config.Fonts.SIZE_NORMAL),  # Match Analytics.TLabel font size
-                                 foreground=self.colors.TEXT_BLACK,  # Match main window value colors
-                                 background=frame_bg)  # Explicit background
-        largest_label.pack()
-        largest_desc_label = ttk.Label(largest_frame, text=f"({largest_desc})", 
-                                      font=config.Fonts.LABEL_SMALL, 
-                                      foreground=self.colors.TEXT_GRAY_MEDIUM,
-                                      background=frame_bg)  # Explicit background
-        largest_desc_label.pack()
+        # Each column is a caption, a value and a gray subtitle; values use the
+        # Analytics.TLabel font size
+        title_kw = {'font': FONT_SMALL_BOLD, 'bg': frame_bg}
+        value_kw = {'font': FONT_NORMAL, 'fg': colors.TEXT_BLACK, 'bg': frame_bg}
+        total_kw = {'font': FONT_NORMAL, 'fg': colors.GREEN_PRIMARY, 'bg': frame_bg}
+        sub_kw = {'font': config.Fonts.LABEL_SMALL, 'fg': colors.TEXT_GRAY_MEDIUM, 'bg': frame_bg}
         
-        return {
-            'list_median_label': list_median_label,
-            'median_count_label': median_count_label,
-            'list_total_label': list_total_label,
-            'total_count_label': total_count_label,
-            'largest_label': largest_label,
-            'largest_desc_label': largest_desc_label
-        }
+        expense_count_total = stats.count
+        # (caption, caption color, value, value kwargs, subtitle, pack side, padx, value key, subtitle key)
+        columns = (
+            ("Typical Expense", colors.TEXT_GRAY_DARK, f"${median_expense:.2f}", value_kw,
+             format_median_count(expense_count),
+             tk.LEFT, (0, 5), 'list_median_label', 'median_count_label'),
+            ("Total Amount", colors.GREEN_PRIMARY, f"${total_amount:.2f}", total_kw,
+             format_expense_count(expense_count_total),
+             tk.LEFT, 5, 'list_total_label', 'total_count_label'),
+            ("Largest Expense", colors.RED_PRIMARY, f"${largest_expense:.2f}", value_kw,
+             f"({largest_desc})",
+             tk.RIGHT, (5, 0), 'largest_label', 'largest_desc_label'),
+        )
+        
+        labels = {}
+        for caption, caption_color, value_text, kw, sub_text, side, padx, value_key, sub_key in columns:
+            column = tk.Frame(row, bg=frame_bg)
+            column.pack(side=side, fill=tk.BOTH, expand=True, padx=padx)
+            tk.Label(column, text=caption, fg=caption_color, **title_kw).pack()
+            value_label = tk.Label(column, text=value_text, **kw)
+            value_label.pack()
+            sub_label = tk.Label(column, text=sub_text, **sub_kw)
+            sub_label.pack()
+            labels[value_key] = value_label
+            labels[sub_key] = sub_label
+        
+        return labels
     
-    def _create_table_section(self, parent):
-        """Create expense table manager."""
-        # Create callback for expense changes
-        def on_expense_change():
-            status_manager = self.callbacks['status_manager']
-            update_display = self.callbacks['update_display']
-            update_metrics = self.callbacks['update_expense_metrics']
-            
-            from expense_table import ExpenseTableManager
-            table_expenses = table_manager.get_expenses()
-            current_count = len(table_expenses)
-            
-            self.expense_tracker.expenses = [exp.to_dict() for exp in table_expenses]
-            self.expense_tracker.monthly_total = sum(exp['amount'] for exp in self.expense_tracker.expenses)
-            
-            self.expense_tracker.save_data()
-            
-            if current_count < self._previous_expense_count[0]:
-                status_manager.show(config.Messages.EXPENSE_DELETED, config.StatusBar.SUCCESS_ICON)
-            elif current_count == self._previous_expense_count[0]:
-                status_manager.show(config.Messages.EXPENSE_EDITED, config.StatusBar.SUCCESS_ICON)
-            
-            self._previous_expense_count[0] = current_count
-            
-            update_display()
-            update_metrics()
-            self.expense_tracker.tray_icon_manager.update_tooltip()
+    def _on_expense_change(self):
+        """Table edit/delete/add callback: sync the tracker, report the change and refresh views."""
+        table_expenses = self._table_manager.get_expenses()
+        current_count = len(table_expenses)
+        
+        # One pass builds the saved dicts and the total (same order and sum as before)
+        expenses = []
+        append = expenses.append
+        total = 0
+        for exp in table_expenses:
+            append(exp.to_dict())
+            total += exp.amount
+        tracker = self.expense_tracker
+        tracker.expenses = expenses
+        tracker.monthly_total = total
+        
+        # Debounced: rapid edits/deletes are written (and the tray tooltip refreshed) once;
+        # flushed on month switch and quit
+        tracker.schedule_save()
         
-        table_container = ctk.CTkFrame(parent, fg_color="transparent")
-        table_container.grid(row=3, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 0))
-        table_container.columnconfigure(0, weight=1)
-        table_container.rowconfigure(0, weight=1)
+        previous_count = self._previous_expense_count.value
+        if current_count < previous_count:
+            self._status_manager.show(*self._deleted_status)
+        elif current_count == previous_count:
+            self._status_manager.show(*self._edited_status)
         
+        self._previous_expense_count.value = current_count
+        
+        self._update_display()
+        self._update_metrics()
+    
+    def _create_table_section(self, parent):
+        """Create expense table manager."""
+        # Imported here (once, on the page's first visit) rather than at module load
         from expense_table import ExpenseTableManager
-        table_manager = ExpenseTableManager(table_container, on_expense_change, theme_manager=self.theme_manager)
+        # The table grids straight into row 3 of the page (no wrapper frame)
+        table_manager = ExpenseTableManager(parent, self._on_expense_change, theme_manager=self.theme_manager,
+                                            grid_row=3)
+        self._table_manager = table_manager
         
-        self._previous_expense_count[0] = len(self.expense_tracker.expenses)
+        self._previous_expense_count.value = len(self.expense_tracker.expenses)
         
         return table_manager
     
@@ -264,8 +312,6 @@ class ExpenseListPageBuilder:
         """Create quick add section at the bottom."""
         from quick_add_helper import QuickAddHelper
         
-        description_history = getattr(self.expense_tracker, 'description_history', None)
-        
         quick_add_helper = QuickAddHelper(
             parent_widget=parent,
             expense_tracker=self.expense_tracker,
@@ -276,11 +322,11 @@ class ExpenseListPageBuilder:
             update_metrics_callback=self.callbacks['update_expense_metrics'],
             count_tracker=self._previous_expense_count,
             gui_instance=self.callbacks['gui_instance'],
-            description_history=description_history,
+            description_history=self._description_history,
             theme_manager=self.theme_manager
         )
         quick_add_frame = quick_add_helper.create_ui()
-        quick_add_frame.grid(row=4, column=0, pady=(5, 0), sticky=(tk.W, tk.E))  # Reduced spacing
+        quick_add_frame.grid(row=4, column=0, pady=(5, 0), sticky=STICKY_WE)  # Reduced spacing
         
         # Store reference for later use (e.g., archive mode)
         return quick_add_helper
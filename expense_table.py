@@ -5,6 +5,7 @@ from tkinter import ttk, messagebox
 import json
 import os
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Dict, Optional, Callable
 from validation import InputValidation, ValidationPresets, ValidationResult
 import config
@@ -17,6 +18,8 @@ from settings_manager import get_settings_manager
 class ExpenseData:
     """Data model for expense entries"""
     
+    __slots__ = ('date', 'amount', 'description')
+    
     def __init__(self, date: str, amount: float, description: str):
         self.date = date
         self.amount = amount
@@ -42,8 +45,10 @@ class ExpenseData:
 class ExpenseTableManager:
     """Manages the expense table display and operations"""
     
-    def __init__(self, parent_frame: ttk.Frame, on_expense_change: Optional[Callable] = None, theme_manager=None):
+    def __init__(self, parent_frame: ttk.Frame, on_expense_change: Optional[Callable] = None, theme_manager=None,
+                 grid_row: int = 0):
         self.parent_frame = parent_frame
+        self.grid_row = grid_row  # Row of parent_frame's grid that the table fills (column 0)
         self.on_expense_change = on_expense_change
         self.theme_manager = theme_manager
         self.expenses: List[ExpenseData] = []
@@ -57,6 +62,9 @@ class ExpenseTableManager:
         self.current_page = 1
         self.items_per_page = 15
         
+        # (today, row tuples) from the last load_expenses; None after local edits
+        self._loaded_snapshot = None
+        
         self.setup_table()
         
     def setup_table(self):
@@ -73,10 +81,10 @@ class ExpenseTableManager:
                        background=frame_bg)
         
         self.table_frame = ttk.LabelFrame(self.parent_frame, text="", padding="10", style="TableContainer.TLabelframe")
-        self.table_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        self.table_frame.grid(row=self.grid_row, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         
         self.parent_frame.columnconfigure(0, weight=1)
-        self.parent_frame.rowconfigure(0, weight=1)
+        self.parent_frame.rowconfigure(self.grid_row, weight=1)
         self.table_frame.columnconfigure(0, weight=1)
         self.table_frame.rowconfigure(0, weight=1)
         
@@ -186,9 +194,9 @@ class ExpenseTableManager:
     
     def _save_sort_preferences(self):
         """Save sort preferences to settings"""
-        settings = get_settings_manager()
-        settings.set('Table', 'sort_column', self.sort_column)
-        settings.set('Table', 'sort_order', self.sort_order)
+        get_settings_manager().update_many({
+            'Table': {'sort_column': self.sort_column, 'sort_order': self.sort_order}
+        })
     
     def _on_column_click(self, column: str):
         """Handle column header click for sorting"""
@@ -222,14 +230,17 @@ class ExpenseTableManager:
         """Sort expenses based on current sort column and order"""
         reverse = (self.sort_order == 'desc')
         
-        if self.sort_column == "Date":
-            return sorted(expenses, key=lambda x: DateUtils.parse_date(x.date) or datetime.min, reverse=reverse)
-        elif self.sort_column == "Amount":
-            return sorted(expenses, key=lambda x: x.amount, reverse=reverse)
+        if self.sort_column == "Amount":
+            return sorted(expenses, key=attrgetter('amount'), reverse=reverse)
         elif self.sort_column == "Description":
             return sorted(expenses, key=lambda x: x.description.lower(), reverse=reverse)
-        else:
-            return sorted(expenses, key=lambda x: DateUtils.parse_date(x.date) or datetime.min, reverse=True)
+        
+        if self.sort_column != "Date":
+            reverse = True
+        # Dates are parsed in one batch to int ordinals (invalid dates sort like datetime.min)
+        ordinals = DateUtils.parse_dates_batch([e.date for e in expenses])
+        order = sorted(range(len(expenses)), key=ordinals.__getitem__, reverse=reverse)
+        return [expenses[i] for i in order]
     
     def _update_pagination_controls(self, total_pages: int):
         """Update pagination control visibility and state"""
@@ -287,13 +298,19 @@ class ExpenseTableManager:
         self.current_page = total_pages
         self.refresh_display()
         
-    def load_expenses(self, expenses_data: List[Dict]):
-        """Load expenses from data"""
+    def load_expenses(self, expenses_data: List[Dict], force: bool = False):
+        """Load expenses from data (skipped if the rows and today's date are unchanged, unless force)"""
+        snapshot = (datetime.now().date(),
+                    [(exp['date'], exp['amount'], exp['description']) for exp in expenses_data])
+        if not force and snapshot == self._loaded_snapshot:
+            return
+        self._loaded_snapshot = snapshot
         self.expenses = [ExpenseData.from_dict(exp) for exp in expenses_data]
         self.refresh_display()
         
     def add_expense(self, expense: ExpenseData):
         """Add a new expense"""
+        self._loaded_snapshot = None
         self.expenses.append(expense)
         self.refresh_display()
         if self.on_expense_change:
@@ -302,6 +319,7 @@ class ExpenseTableManager:
     def update_expense(self, index: int, expense: ExpenseData):
         """Update an existing expense"""
         if 0 <= index < len(self.expenses):
+            self._loaded_snapshot = None
             self.expenses[index] = expense
             self.refresh_display()
             if self.on_expense_change:
@@ -310,6 +328,7 @@ class ExpenseTableManager:
     def delete_expense(self, index: int):
         """Delete an expense by index"""
         if 0 <= index < len(self.expenses):
+            self._loaded_snapshot = None
             del self.expenses[index]
             self.refresh_display()
             if self.on_expense_change:
@@ -371,10 +390,10 @@ class ExpenseTableManager:
                     ))
             
             total = sum(e.amount for e in self.expenses 
-                       if (dt := DateUtils.parse_date(e.date)) and dt.date() <= today)
+                       if (d := DateUtils.parse_date_only(e.date)) and d <= today)
             count = len(self.expenses)
             future_count = sum(1 for e in self.expenses 
-                             if (dt := DateUtils.parse_date(e.date)) and dt.date() > today)
+                             if (d := DateUtils.parse_date_only(e.date)) and d > today)
             
             is_dark = self.theme_manager.is_dark_mode() if self.theme_manager else False
             status_text_color = self.colors.TEXT_BLACK
@@ -6,6 +6,7 @@ import json
 import hashlib
 import stat
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Optional
 from tkinter import messagebox, filedialog
 from error_logger import log_export_attempt, log_export_success, log_export_error, log_library_check, log_info, log_error, log_warning, log_debug
@@ -60,7 +61,9 @@ class DataExporterV2:
     def _save_export_location(self, location: str):
         """Save the export location to settings"""
         settings = get_settings_manager()
-        if not settings.set('Export', 'default_save_location', location):
+        # Saved now rather than by the delayed auto-save, so a failed write is reported here
+        if not (settings.set('Export', 'default_save_location', location, auto_save=False)
+                and settings.save()):
             log_error("Failed to save export location", None)
     
     def _get_shortened_path(self, path: str) -> str:
@@ -178,7 +181,7 @@ class DataExporterV2:
             for col, header in enumerate(headers):
                 worksheet.write(0, col, header, header_format)
             
-            sorted_expenses = sorted(self.expenses, key=lambda x: x['date'], reverse=True)
+            sorted_expenses = sorted(self.expenses, key=itemgetter('date'), reverse=True)
             
             total_amount = 0.0
             row = 1
@@ -301,7 +304,7 @@ class DataExporterV2:
             
             pdf.set_text_color(0, 0, 0)
             
-            sorted_expenses = sorted(self.expenses, key=lambda x: x['date'], reverse=True)
+            sorted_expenses = sorted(self.expenses, key=itemgetter('date'), reverse=True)
             
             pdf.set_font('Helvetica', 'B', 11)
             pdf.set_fill_color(0, 120, 212)  # #0078D4
@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 import customtkinter as ctk
-from datetime import datetime, timedelta
+from datetime import datetime
 import calendar
 import webbrowser
 import config
@@ -10,11 +10,10 @@ from analytics import ExpenseAnalytics
 from widgets import CollapsibleDateCombobox, NumberPadWidget
 from status_bar_manager import StatusBarManager
 from page_manager import PageManager
-from quick_add_helper import QuickAddHelper
 from archive_mode_manager import ArchiveModeManager
 from tooltip_manager import TooltipManager
 from dashboard_page_builder import DashboardPageBuilder
-from expense_list_page_builder import ExpenseListPageBuilder
+from expense_list_page_builder import ExpenseListPageBuilder, format_expense_count, format_median_count
 from validation import InputValidation
 from date_utils import DateUtils
 from settings_manager import get_settings_manager
@@ -35,6 +34,14 @@ class LiteFinPadGUI:
         self.page_manager = PageManager()
         self.tooltip_manager = TooltipManager()
         
+        # id(label) -> options last applied through _set_label (skips no-op configures on refresh)
+        self._rendered_options = {}
+        
+        # Expense list, (length, day) and the PastStats computed for them (see _get_past_stats)
+        self._past_stats_list = None
+        self._past_stats_key = None
+        self._past_stats = None
+        
         self.create_widgets()
         
     def setup_window(self):
@@ -203,7 +210,7 @@ class LiteFinPadGUI:
         self.update_recent_expenses()
         
     
-    def toggle_stay_on_top_visual(self):
+    def toggle_stay_on_top_visual(self, event=None):
         """Toggle stay on top with visual feedback."""
         current_state = self.stay_on_top_var.get()
         new_state = not current_state
@@ -224,7 +231,7 @@ class LiteFinPadGUI:
     # DIALOG & MENU METHODS
     # ==========================================
     
-    def show_about_dialog(self):
+    def show_about_dialog(self, event=None):
         """Show About dialog with version and credits."""
         colors = self.theme_manager.get_colors()
         
@@ -320,7 +327,7 @@ class LiteFinPadGUI:
         """Show dialog to set monthly budget threshold."""
         colors = self.theme_manager.get_colors()
         
-        current_budget = get_settings_manager().get('Budget', 'monthly_threshold', 0.0, value_type=float)
+        current_budget = get_settings_manager().get_float('Budget', 'monthly_threshold', 0.0)
         
         dialog = DialogHelper.create_dialog(
             self.root,
@@ -533,7 +540,7 @@ class LiteFinPadGUI:
             # Re-read budget and recalculate using past expenses only (same as update_display)
             from datetime import datetime
             from data_manager import ExpenseDataManager
-            budget_threshold = get_settings_manager().get('Budget', 'monthly_threshold', 0.0, value_type=float)
+            budget_threshold = get_settings_manager().get_float('Budget', 'monthly_threshold', 0.0)
             
             # Calculate monthly total excluding future expenses (same logic as update_display)
             # Calculate monthly total (same logic as update_display)
@@ -544,7 +551,7 @@ class LiteFinPadGUI:
                 # Current mode: exclude future expenses
                 today = datetime.now().date()
                 expenses_for_budget = [e for e in self.expense_tracker.expenses 
-                                      if (dt := DateUtils.parse_date(e['date'])) and dt.date() <= today]
+                                      if (d := DateUtils.parse_date_only(e['date'])) and d <= today]
             monthly_total_for_budget = ExpenseDataManager.calculate_monthly_total(expenses_for_budget)
             
             if budget_threshold > 0:
@@ -569,7 +576,8 @@ class LiteFinPadGUI:
             # Update labels if they exist and are valid widgets (ttk.Label uses foreground, not text_color)
             if hasattr(self, 'budget_amount_label') and self.budget_amount_label:
                 try:
-                    self.budget_amount_label.configure(
+                    self._set_label(
+                        self.budget_amount_label,
                         text=budget_amount_text,
                         foreground=budget_color  # ttk.Label uses foreground
                     )
@@ -578,7 +586,8 @@ class LiteFinPadGUI:
             
             if hasattr(self, 'budget_status_label') and self.budget_status_label:
                 try:
-                    self.budget_status_label.configure(
+                    self._set_label(
+                        self.budget_status_label,
                         text=budget_status_text,
                         foreground=budget_color  # ttk.Label uses foreground
                     )
@@ -643,6 +652,14 @@ class LiteFinPadGUI:
     # ==========================================
     # DASHBOARD UPDATE METHODS
     # ==========================================
+    
+    def _set_label(self, label, **options):
+        """Configure a dashboard label, skipping the call if these options are already displayed."""
+        key = id(label)
+        if self._rendered_options.get(key) == options:
+            return
+        label.configure(**options)
+        self._rendered_options[key] = options
         
     def update_display(self):
         """Update all display elements."""
@@ -650,6 +667,9 @@ class LiteFinPadGUI:
         from data_manager import ExpenseDataManager
         from error_logger import log_info
         
+        # Single clock reading shared by every calculation in this update
+        now = datetime.now()
+        
         # In archive mode, show ALL expenses for that month
         # In current mode, exclude future expenses
         if self._is_archive_mode():
@@ -660,9 +680,9 @@ class LiteFinPadGUI:
             log_info(f"[UPDATE_DISPLAY] Archive mode: {expense_count} expenses, total=${monthly_total:.2f}")
         else:
             # Current mode: exclude future expenses
-            today = datetime.now().date()
+            today = now.date()
             past_expenses = [e for e in self.expense_tracker.expenses 
-                            if (dt := DateUtils.parse_date(e['date'])) and dt.date() <= today]
+                            if (d := DateUtils.parse_date_only(e['date'])) and d <= today]
             monthly_total = ExpenseDataManager.calculate_monthly_total(past_expenses)
             expense_count = len(past_expenses)
             log_info(f"[UPDATE_DISPLAY] Current mode: {expense_count} expenses, total=${monthly_total:.2f}")
@@ -670,7 +690,7 @@ class LiteFinPadGUI:
         # Update total - ensure label exists and is a CTkLabel
         if hasattr(self, 'total_label') and self.total_label:
             try:
-                self.total_label.configure(text=f"${monthly_total:.2f}")
+                self._set_label(self.total_label, text=f"${monthly_total:.2f}")
                 log_info(f"[UPDATE_DISPLAY] Updated total_label to ${monthly_total:.2f}")
             except Exception as e:
                 log_info(f"[UPDATE_DISPLAY] Error updating total_label: {e}")
@@ -680,20 +700,22 @@ class LiteFinPadGUI:
         # Update count - ensure label exists and is a CTkLabel
         if hasattr(self, 'count_label') and self.count_label:
             try:
-                self.count_label.configure(text=f"{expense_count} expenses this month")
+                self._set_label(self.count_label, text=f"{expense_count} expenses this month")
                 log_info(f"[UPDATE_DISPLAY] Updated count_label to {expense_count} expenses")
             except Exception as e:
                 log_info(f"[UPDATE_DISPLAY] Error updating count_label: {e}")
         else:
             log_info(f"[UPDATE_DISPLAY] count_label not found or None")
         
-        context_date = self._get_context_date()
+        context_date = now if not self._is_archive_mode() else self._get_context_date()
+        expenses_for_analytics = expenses_to_use if self._is_archive_mode() else self.expense_tracker.expenses
+        analytics = ExpenseAnalytics.calculate_all(expenses_for_analytics, context_date)
         
-        current_day, total_days = ExpenseAnalytics.calculate_day_progress(context_date)
-        current_week, total_weeks = ExpenseAnalytics.calculate_week_progress(context_date)
+        labels = analytics['labels']
+        current_week, total_weeks = analytics['week_progress']
         if hasattr(self, 'day_progress_label') and self.day_progress_label:
             try:
-                self.day_progress_label.configure(text=f"{current_day} / {total_days}")
+                self._set_label(self.day_progress_label, text=labels['day_progress'])
             except Exception as e:
                 log_info(f"[UPDATE_DISPLAY] Error updating day_progress_label: {e}")
         
@@ -706,53 +728,35 @@ class LiteFinPadGUI:
             week_display = f"{current_week:.1f} / {total_weeks}"
         if hasattr(self, 'week_progress_label') and self.week_progress_label:
             try:
-                self.week_progress_label.configure(text=week_display)
+                self._set_label(self.week_progress_label, text=week_display)
             except Exception as e:
                 log_info(f"[UPDATE_DISPLAY] Error updating week_progress_label: {e}")
         
-        expenses_for_analytics = expenses_to_use if self._is_archive_mode() else self.expense_tracker.expenses
-        daily_avg, days_elapsed = ExpenseAnalytics.calculate_daily_average(
-            expenses_for_analytics, context_date
-        )
-        weekly_avg, weeks_elapsed = ExpenseAnalytics.calculate_weekly_average(
-            expenses_for_analytics, context_date
-        )
-        
-        self.daily_avg_label.configure(text=f"${daily_avg:.2f} /day")
-        self.weekly_avg_label.configure(text=f"${weekly_avg:.2f} /week")
-        
-        context_date = self._get_context_date()
-        expenses_for_pace = expenses_to_use if self._is_archive_mode() else self.expense_tracker.expenses
-        weekly_pace, pace_days = ExpenseAnalytics.calculate_weekly_pace(
-            expenses_for_pace, context_date
-        )
+        self._set_label(self.daily_avg_label, text=labels['daily_average'])
+        self._set_label(self.weekly_avg_label, text=labels['weekly_average'])
         
         # Calculate previous month data with comparison
         # Pass viewed_month only if truly in archive mode (not current month)
         viewed_month = self.expense_tracker.viewed_month if self._is_archive_mode() else None
-        prev_month_date = datetime.now().replace(day=1) - timedelta(days=1)
-        prev_month_key = prev_month_date.strftime('%Y-%m')
-        prev_data_folder = f"data_{prev_month_key}"
         # Use calculated monthly total for comparison
         trend_text, trend_context, comparison = ExpenseAnalytics.calculate_monthly_trend(
-            prev_data_folder,
             monthly_total,  # Use calculated monthly total (already filtered for archive/current mode)
             viewed_month
         )
         
         if hasattr(self, 'pace_label') and self.pace_label:
             try:
-                self.pace_label.configure(text=f"${weekly_pace:.2f} /day")
+                self._set_label(self.pace_label, text=labels['weekly_pace'])
             except Exception as e:
                 log_info(f"[UPDATE_DISPLAY] Error updating pace_label: {e}")
         if hasattr(self, 'trend_label') and self.trend_label:
             try:
-                self.trend_label.configure(text=f"{trend_text} ")
+                self._set_label(self.trend_label, text=f"{trend_text} ")
             except Exception as e:
                 log_info(f"[UPDATE_DISPLAY] Error updating trend_label: {e}")
         if hasattr(self, 'trend_context_label') and self.trend_context_label:
             try:
-                self.trend_context_label.configure(text=trend_context)  # Update month name
+                self._set_label(self.trend_context_label, text=trend_context)  # Update month name
             except Exception as e:
                 log_info(f"[UPDATE_DISPLAY] Error updating trend_context_label: {e}")
         
@@ -765,23 +769,20 @@ class LiteFinPadGUI:
                 sign = "+" if comparison['direction'] == 'increase' else "-"
                 indicator_text += f"{sign}{comparison['percentage']:.0f}%"
             
-            self.comparison_label.configure(
+            self._set_label(
+                self.comparison_label,
                 text=indicator_text,
                 foreground=comparison['color']  # ttk.Label uses foreground, not text_color
             )
         elif hasattr(self, 'comparison_label'):
             # Clear indicator if no comparison available
-            self.comparison_label.configure(text="")
+            self._set_label(self.comparison_label, text="")
         
         # Update budget comparison (budget display updates based on monthly_total_past)
         if hasattr(self, 'budget_amount_label') and self.budget_amount_label:
             from settings_manager import get_settings_manager
             try:
-                budget_threshold = get_settings_manager().get('Budget', 'monthly_threshold', 0.0)
-                try:
-                    budget_threshold = float(budget_threshold) if budget_threshold else 0.0
-                except (ValueError, TypeError):
-                    budget_threshold = 0.0
+                budget_threshold = get_settings_manager().get_float('Budget', 'monthly_threshold', 0.0)
                 
                 # Get theme-aware colors
                 is_dark = self.theme_manager.is_dark_mode() if self.theme_manager else False
@@ -811,9 +812,9 @@ class LiteFinPadGUI:
                     budget_color = colors.TEXT_GRAY_MEDIUM
 
                 # Budget labels are ttk.Label widgets, use foreground
-                self.budget_amount_label.configure(text=budget_amount_text, foreground=budget_color)
+                self._set_label(self.budget_amount_label, text=budget_amount_text, foreground=budget_color)
                 if hasattr(self, 'budget_status_label') and self.budget_status_label:
-                    self.budget_status_label.configure(text=budget_status_text, foreground=budget_color)
+                    self._set_label(self.budget_status_label, text=budget_status_text, foreground=budget_color)
             except Exception as e:
                 from error_logger import log_error
                 log_error(f"Error updating budget display", e)
@@ -828,7 +829,7 @@ class LiteFinPadGUI:
         # Filter out future expenses and get last 2 (not 3)
         today = datetime.now().date()
         past_expenses = [e for e in self.expense_tracker.expenses 
-                        if (dt := DateUtils.parse_date(e['date'])) and dt.date() <= today]
+                        if (d := DateUtils.parse_date_only(e['date'])) and d <= today]
         recent_expenses = past_expenses[-2:] if past_expenses else []
         
         expense_labels = [self.recent_expense_1, self.recent_expense_2]
@@ -867,50 +868,72 @@ class LiteFinPadGUI:
             theme_manager=self.theme_manager
         )
         
-        # Build the page and get widget references
-        widgets = builder.build_all()
+        # Build the (empty) page frame; its sections are built on first visit
+        widgets = builder.build_shell()
+        self._expense_list_builder = builder
         
         # Store references needed for updates
         self.expense_list_frame = widgets['expense_list_frame']
-        self.table_manager = widgets['table_manager']
         self._expense_count_tracker = widgets['count_tracker']
+        self.table_manager = None
+        self.quick_add_helper = None
+    
+    def _ensure_expense_list_built(self):
+        """Build the expense list page sections the first time the page is shown."""
+        builder = self._expense_list_builder
+        if builder.is_built:
+            return
+        
+        widgets = builder.build_contents()
+        self.table_manager = widgets['table_manager']
         self.quick_add_helper = widgets['quick_add_helper']
         
         # Store metric label references for update_expense_metrics()
         for label_name, label_widget in widgets['metric_labels'].items():
             setattr(self, label_name, label_widget)
+        
+        self.archive_mode_manager.attach_expense_list(self.table_manager, self.quick_add_helper)
     
     # ==========================================
     # EXPENSE LIST UPDATE METHODS
     # ==========================================
         
+    def _get_past_stats(self):
+        """
+        Median, largest, total and count of past expenses (future excluded) from one pass.
+        
+        Memoized on the expense list object, its length and today's date: the tracker
+        replaces or grows the list when expenses change, so page switches and archive
+        refreshes with unchanged data reuse the last result.
+        """
+        expenses = self.expense_tracker.expenses
+        key = (len(expenses), datetime.now().date())
+        if expenses is not self._past_stats_list or key != self._past_stats_key:
+            self._past_stats = ExpenseAnalytics.calculate_past_stats(expenses)
+            self._past_stats_list = expenses
+            self._past_stats_key = key
+        return self._past_stats
+    
     def update_expense_metrics(self):
         """Update expense metrics on the expense list page."""
-        from datetime import datetime
-        from data_manager import ExpenseDataManager
+        if self.table_manager is None:
+            # Page not built yet; its metrics are filled in when it is first shown
+            return
         
-        # Filter out future expenses for calculations
-        today = datetime.now().date()
-        past_expenses = [e for e in self.expense_tracker.expenses 
-                        if (dt := DateUtils.parse_date(e['date'])) and dt.date() <= today]
-        
-        # Calculate metrics using only past expenses
-        median_expense, expense_count = ExpenseAnalytics.calculate_median_expense(
-            past_expenses  # Use past expenses only
-        )
-        largest_expense, largest_desc = ExpenseAnalytics.calculate_largest_expense(
-            past_expenses  # Use past expenses only
-        )
+        from data_manager import ExpenseDataManager
         
+        stats = self._get_past_stats()
+        median_expense, expense_count = stats.median, stats.count
+        largest_expense, largest_desc = stats.largest_amount, stats.largest_description
         # Calculate total excluding future expenses
         total_amount = ExpenseDataManager.calculate_monthly_total(self.expense_tracker.expenses)
         
         self.list_median_label.configure(text=f"${median_expense:.2f}")
-        self.median_count_label.configure(text=f"(median of {expense_count} expense{'s' if expense_count != 1 else ''})")
+        self.median_count_label.configure(text=format_median_count(expense_count))
         self.list_total_label.configure(text=f"${total_amount:.2f}")
         # Count only past expenses for display
-        expense_count_total = len(past_expenses)
-        self.total_count_label.configure(text=f"({expense_count_total} expense{'s' if expense_count_total != 1 else ''})")
+        expense_count_total = stats.count
+        self.total_count_label.configure(text=format_expense_count(expense_count_total))
         self.largest_label.configure(text=f"${largest_expense:.2f}")
         self.largest_desc_label.configure(text=f"({largest_desc})")
     
@@ -920,13 +943,16 @@ class LiteFinPadGUI:
     
     def show_expense_list_page(self):
         """Show the expense list page."""
+        self._ensure_expense_list_built()
         self.page_manager.show_expense_list_page(
             status_manager=self.status_manager,
             table_manager=self.table_manager,
             expense_tracker=self.expense_tracker,
             update_metrics_callback=self.update_expense_metrics
         )
+        self.archive_mode_manager.restyle_visible_page()
         
     def show_main_page(self):
         """Show the main dashboard page."""
         self.page_manager.show_main_page(status_manager=self.status_manager)
+        self.archive_mode_manager.restyle_visible_page()
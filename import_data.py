@@ -297,7 +297,7 @@ class DataImporter:
                 today = datetime.now().date()
                 monthly_total = sum(
                     expense['amount'] for expense in merged_expenses
-                    if (dt := DateUtils.parse_date(expense['date'])) and dt.date() <= today
+                    if (d := DateUtils.parse_date_only(expense['date'])) and d <= today
                 )
                 
                 # Save merged data
@@ -27,6 +27,7 @@ from month_viewer import MonthViewer
 import config
 from date_utils import DateUtils
 from description_autocomplete import DescriptionHistory
+from settings_manager import get_settings_manager
 from widgets import AutoCompleteEntry
 
 def _configure_process_dpi_awareness():
@@ -56,6 +57,9 @@ _configure_process_dpi_awareness()
 
 
 class ExpenseTracker:
+    # Delay before a schedule_save() write; edits within it are coalesced
+    SAVE_DELAY_MS = 400
+    
     def __init__(self):
         error_logger.log_application_start()
         
@@ -74,6 +78,7 @@ class ExpenseTracker:
         self.open_dialogs = []
         self.gui_queue = queue.Queue()
         self._shutting_down = False
+        self._save_after_id = None  # Pending schedule_save() write
         
         self.description_history = DescriptionHistory()
         
@@ -202,7 +207,13 @@ class ExpenseTracker:
             if hasattr(self, 'tray_icon_manager') and self.tray_icon_manager:
                 self.tray_icon_manager.stop()
             
-            # 3. Destroy the GUI window
+            # 3. Write changes held back by the save debounces
+            self.flush_save()
+            if hasattr(self, 'description_history') and self.description_history:
+                self.description_history.flush()
+            get_settings_manager().flush()
+            
+            # 4. Destroy the GUI window
             self.root.quit()
             self.root.destroy()
             
@@ -222,6 +233,9 @@ class ExpenseTracker:
         data_folder = f"data_{month_key}"
         expenses_file = os.path.join(data_folder, "expenses.json")
         
+        # A pending save must write the expenses it was scheduled for, not the reloaded ones
+        self.flush_save()
+        
         self.expenses, self.monthly_total = ExpenseDataManager.load_expenses(
             expenses_file,
             data_folder,
@@ -234,13 +248,16 @@ class ExpenseTracker:
         
         self.load_data(month_key)
         
-        self.gui.archive_mode_manager.refresh_ui()
+        self.gui.archive_mode_manager.request_refresh()
         
         # Log the switch
         log_info(f"Switched to {month_key} ({self.viewing_mode} mode)")
             
     def save_data(self):
-        """Save expense data to JSON file"""
+        """Save expense data to JSON file (this also covers any save pending from schedule_save)."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         ExpenseDataManager.save_expenses(
             self.data_folder,
             self.expenses_file,
@@ -250,6 +267,19 @@ class ExpenseTracker:
         # Also save calculations metadata
         self._save_calculations(self.calculations_file, self.current_month, self.monthly_total)
     
+    def schedule_save(self):
+        """Save data and refresh the tray tooltip after SAVE_DELAY_MS, so a burst of table edits is handled once."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(self.SAVE_DELAY_MS, self.flush_save)
+    
+    def flush_save(self):
+        """Run a save still pending from schedule_save now (call before reloading or quitting)."""
+        if self._save_after_id is not None:
+            self.save_data()
+            if not self._shutting_down:
+                self.tray_icon_manager.update_tooltip()
+    
     def add_expense_to_correct_month(self, expense_dict):
         """Add expense to the correct month's data folder based on expense date."""
         from datetime import datetime
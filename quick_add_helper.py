@@ -221,7 +221,7 @@ class QuickAddHelper:
                     self.update_metrics_callback()
                 
                 if self.count_tracker:
-                    self.count_tracker[0] = len(self.expense_tracker.expenses)
+                    self.count_tracker.value = len(self.expense_tracker.expenses)
         
         if self.on_add_callback:
             self.on_add_callback()
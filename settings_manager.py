@@ -1,137 +1,373 @@
 """Centralized, thread-safe settings management with validation and atomic writes."""
 
-import configparser
+import atexit
+import hashlib
+import locale
 import os
-import tempfile
-import shutil
-from typing import Any, Optional, Dict, List
-from threading import Lock
+from contextlib import contextmanager
+from typing import Any, Optional, Dict, Iterable, List
+from threading import Lock, Timer
+from types import MappingProxyType
 from error_logger import log_info, log_warning, log_error
 
 
+# Cache marker for a setting that is not present
+_MISSING = object()
+
+# Strings get(..., value_type=bool) reads as True (case-insensitive)
+_TRUE_STRINGS = frozenset(('true', '1', 'yes', 'on'))
+
+# value_type -> conversion applied by get(); other types get the string unchanged
+_CONVERTERS = {
+    bool: lambda value: value.lower() in _TRUE_STRINGS,
+    int: int,
+    float: float,
+}
+
+# Flags for the save temp file: must be new (a leftover is removed first), raw bytes on Windows
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _parse_ini(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse settings.ini text into {section: {key: value}}.
+    
+    Reads the subset of INI that configparser writes and users hand-edit:
+    [section] headers, "key = value" or "key: value" lines (keys lowercased,
+    both sides stripped), indented continuation lines, and full-line # or ;
+    comments. Values are taken as written (no % interpolation). Options before
+    the first header are ignored; repeated sections/keys merge, last value wins.
+    """
+    data: Dict[str, Dict[str, str]] = {}
+    options = None
+    key = None
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped[0] in '#;':
+            continue
+        if line[0].isspace() and key is not None:
+            # Continuation of a multi-line value
+            options[key] += '\n' + stripped
+            continue
+        if stripped[0] == '[' and stripped[-1] == ']':
+            options = data.setdefault(stripped[1:-1], {})
+            key = None
+            continue
+        if options is None:
+            continue
+        eq, colon = stripped.find('='), stripped.find(':')
+        sep = eq if colon < 0 or 0 <= eq < colon else colon
+        if sep <= 0:
+            continue
+        key = stripped[:sep].strip().lower()
+        options[key] = stripped[sep + 1:].strip()
+    return data
+
+
+def _format_ini(data: Dict[str, Dict[str, str]]) -> str:
+    """Serialize {section: {key: value}} in configparser's layout (blank line after each section)."""
+    parts = []
+    for section, options in data.items():
+        parts.append(f"[{section}]\n")
+        for key, value in options.items():
+            value = value.replace('\n', '\n\t')  # Multi-line values continue on indented lines
+            parts.append(f"{key} = {value}\n")
+        parts.append("\n")
+    return ''.join(parts)
+
+
 class SettingsManager:
-    """Thread-safe settings manager with validation and atomic writes."""
+    """
+    Thread-safe settings manager with validation and atomic writes.
+    
+    Writes hold the lock and then publish an immutable snapshot
+    of the settings. Reads (get() and the section/key queries) use the
+    snapshot and the typed-value cache and take no lock at all.
+    """
+    
+    # Seconds an auto-saved set()/delete() waits for further changes before writing
+    FLUSH_DELAY = 0.25
     
     def __init__(self, settings_file: str = "settings.ini"):
         """Initialize settings manager with settings file path."""
         self.settings_file = settings_file
-        self.config = configparser.ConfigParser()
-        self._lock = Lock()  # Thread safety
+        self._data: Dict[str, Dict[str, str]] = {}  # section -> {lowercased key: value string}
+        # Read-only copy of _data, replaced as a whole after each write (see _writing);
+        # the section/key queries read it without taking the lock
+        self._snapshot = MappingProxyType({})
+        self._lock = Lock()  # Serializes writes; reads go through _snapshot/_typed without it
         self._loaded = False
+        self._typed: Dict[tuple, Any] = {}  # (section, key, value_type) -> converted value or _MISSING
+        self._dirty = False  # Changes not yet written to settings_file
+        self._flush_timer: Optional[Timer] = None
+        # SHA-256 of settings_file as this manager last read or wrote it (None: no file),
+        # and its contents then; _data minus _base is what this process has changed since
+        self._disk_digest: Optional[bytes] = None
+        self._base: Dict[str, Dict[str, str]] = {}
         
         # Load existing settings
         self.load()
+        # Pending changes are written on interpreter exit as well as by flush()
+        atexit.register(self.flush)
+    
+    @contextmanager
+    def _writing(self):
+        """Hold the write lock for a change to _data; on exit, publish a new snapshot and drop converted values."""
+        with self._lock:
+            try:
+                yield
+            finally:
+                self._publish_unlocked()
+    
+    def _publish_unlocked(self):
+        """Publish a new snapshot of _data and drop converted values (caller holds the write lock)."""
+        # One attribute store: lock-free readers see either the old snapshot or the new one
+        self._snapshot = MappingProxyType({
+            section: MappingProxyType(dict(options)) for section, options in self._data.items()
+        })
+        # Swapped, not cleared, and only after the snapshot (see get())
+        self._typed = {}
     
     def load(self) -> bool:
         """Load settings from file."""
-        with self._lock:
+        with self._writing():
             try:
-                if os.path.exists(self.settings_file):
-                    self.config.read(self.settings_file)
-                    log_info(f"Settings loaded from {self.settings_file}")
-                    self._loaded = True
-                    return True
-                else:
+                # Open directly rather than stat first: one syscall on the cold-start path
+                try:
+                    with open(self.settings_file, 'rb') as f:
+                        raw = f.read()
+                except FileNotFoundError:
+                    self._disk_digest = None
+                    self._base = {}
                     log_info(f"Settings file not found, will create on first save: {self.settings_file}")
                     self._loaded = True
                     return True
+                
+                self._disk_digest = hashlib.sha256(raw).digest()
+                # Locale encoding, as the file is written (and as configparser read it)
+                disk = _parse_ini(raw.decode(locale.getpreferredencoding(False)))
+                self._base = {section: dict(options) for section, options in disk.items()}
+                for section, options in disk.items():
+                    self._data.setdefault(section, {}).update(options)
+                log_info(f"Settings loaded from {self.settings_file}")
+                self._loaded = True
+                return True
             except Exception as e:
                 log_error(f"Failed to load settings from {self.settings_file}", e)
-                # Initialize empty config on error
-                self.config = configparser.ConfigParser()
+                # Start with empty settings on error
+                self._data = {}
+                self._base = {}
                 self._loaded = True
                 return False
     
-    def _save_unlocked(self) -> bool:
-        """Internal save method without lock (assumes caller has lock)."""
+    def _file_digest(self) -> Optional[bytes]:
+        """SHA-256 of settings_file as it is on disk (None if it does not exist)."""
         try:
+            with open(self.settings_file, 'rb') as f:
+                return hashlib.sha256(f.read()).digest()
+        except FileNotFoundError:
+            return None
+    
+    def _merge_from_disk_unlocked(self):
+        """
+        Re-read settings_file after another process changed it, keeping this process's changes.
+        
+        The file's current contents become the new base; every key and section
+        that _data changed relative to the old base (set, added or deleted) is
+        re-applied on top. Caller holds the write lock.
+        """
+        try:
+            with open(self.settings_file, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raw = None
+        disk = _parse_ini(raw.decode(locale.getpreferredencoding(False))) if raw is not None else {}
+        new_base = {section: dict(options) for section, options in disk.items()}
+        
+        base, current = self._base, self._data
+        # Deletions
+        for section, options in base.items():
+            if section not in current:
+                disk.pop(section, None)
+                continue
+            disk_options = disk.get(section)
+            if disk_options is not None:
+                for key in options:
+                    if key not in current[section]:
+                        disk_options.pop(key, None)
+        # Additions and changed values
+        for section, options in current.items():
+            base_options = base.get(section, {})
+            changed = {key: value for key, value in options.items() if base_options.get(key) != value}
+            if changed or section not in base:
+                disk.setdefault(section, {}).update(changed)
+        
+        self._data = disk
+        self._base = new_base
+        self._disk_digest = hashlib.sha256(raw).digest() if raw is not None else None
+        self._publish_unlocked()
+    
+    def _save_unlocked(self, merged: bool = False) -> bool:
+        """
+        Internal save method without lock (assumes caller holds the write lock).
+        
+        If settings_file was changed by another process since it was read, the
+        file is re-read, this process's changes are merged into it, and the
+        result is saved (merged=True is that retry).
+        """
+        try:
+            # Serialized in memory and written in one call: locale encoding, native newlines
+            data = _format_ini(self._data).replace('\n', os.linesep).encode(locale.getpreferredencoding(False))
+            
             settings_dir = os.path.dirname(self.settings_file) or '.'
-            temp_fd, temp_path = tempfile.mkstemp(
-                suffix='.tmp',
-                prefix='settings_',
-                dir=settings_dir,
-                text=True
-            )
+            # Saves are serialized by the write lock, so a fixed per-process sibling name is
+            # enough (no mkstemp name probing); same directory keeps os.replace atomic
+            temp_path = f"{self.settings_file}.tmp.{os.getpid()}"
+            try:
+                temp_fd = os.open(temp_path, _TEMP_FLAGS, 0o600)
+            except FileExistsError:
+                # Left behind by a crashed save
+                os.unlink(temp_path)
+                temp_fd = os.open(temp_path, _TEMP_FLAGS, 0o600)
             
             try:
-                with os.fdopen(temp_fd, 'w') as temp_file:
-                    self.config.write(temp_file)
+                with os.fdopen(temp_fd, 'wb') as temp_file:
+                    temp_file.write(data)
+                    # Data must be on disk before the rename, or a crash can leave an empty file
+                    temp_file.flush()
+                    os.fsync(temp_file.fileno())
                 
-                if not os.path.exists(temp_path):
-                    raise IOError("Temp file was not created")
+                # Another process (or an editor) changed the file since we read it: don't
+                # overwrite its changes, merge ours into them and save that. The retry just
+                # re-read the file, so it writes without checking again (never stuck unable to save).
+                if not merged and self._file_digest() != self._disk_digest:
+                    os.remove(temp_path)
+                    log_warning(f"{self.settings_file} was changed by another process; merging settings")
+                    self._merge_from_disk_unlocked()
+                    return self._save_unlocked(merged=True)
                 
-                if os.path.exists(self.settings_file):
-                    os.replace(temp_path, self.settings_file)
-                else:
-                    shutil.move(temp_path, self.settings_file)
+                # Atomic, whether or not settings_file exists yet
+                os.replace(temp_path, self.settings_file)
+                self._fsync_dir(settings_dir)
                 
                 log_info(f"Settings saved atomically to {self.settings_file}")
+                self._disk_digest = hashlib.sha256(data).digest()
+                self._base = {section: dict(options) for section, options in self._data.items()}
+                self._dirty = False
                 return True
                 
             except Exception as e:
-                if os.path.exists(temp_path):
+                try:
                     os.remove(temp_path)
+                except FileNotFoundError:
+                    pass
                 raise e
                 
         except Exception as e:
             log_error(f"Failed to save settings to {self.settings_file}", e)
             return False
     
+    @staticmethod
+    def _fsync_dir(path: str):
+        """Make a rename in path durable (POSIX only; best effort)."""
+        if not hasattr(os, 'O_DIRECTORY'):
+            return  # Windows: directories can't be opened/fsynced
+        try:
+            dir_fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            # Some filesystems don't support fsync on directories
+            pass
+    
     def save(self) -> bool:
         """Save settings to file using atomic write operation (temp file then replace)."""
         with self._lock:
             return self._save_unlocked()
     
+    def _schedule_flush_unlocked(self):
+        """Mark settings dirty and (re)start the flush timer (caller holds the write lock)."""
+        self._dirty = True
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        timer = Timer(self.FLUSH_DELAY, self.flush)
+        timer.daemon = True  # atexit flushes whatever a cut-off timer left
+        self._flush_timer = timer
+        timer.start()
+    
+    def flush(self) -> bool:
+        """Write pending auto-saved changes now. Returns False only if that write fails."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+            return self._save_unlocked()
+    
     def get(self, section: str, key: str, default: Any = None, 
             value_type: type = str) -> Any:
-        """Get setting value with type conversion and default support."""
-        with self._lock:
-            try:
-                if not self.config.has_section(section):
-                    return default
-                
-                if not self.config.has_option(section, key):
-                    return default
-                
-                value = self.config.get(section, key)
-                
-                # Type conversion
-                if value_type == bool:
-                    return value.lower() in ('true', '1', 'yes', 'on')
-                elif value_type == int:
-                    return int(value)
-                elif value_type == float:
-                    return float(value)
-                else:
-                    return value
-                    
-            except Exception as e:
-                log_warning(f"Error reading setting [{section}].{key}: {e}")
+        """Get setting value with type conversion and default support (converted values are cached)."""
+        cache_key = (section, key, value_type)
+        # No lock: _typed is read before _snapshot, and _writing publishes the new snapshot
+        # before swapping in a fresh _typed, so whatever is cached here matches a snapshot
+        # that is still current (or lands in a dict a write has already discarded)
+        typed = self._typed
+        cached = typed.get(cache_key, None)
+        if cached is not None:
+            return default if cached is _MISSING else cached
+        
+        try:
+            options = self._snapshot.get(section)
+            value = options.get(key.lower()) if options is not None else None
+            if value is None:
+                typed[cache_key] = _MISSING
                 return default
+            
+            # Type conversion
+            convert = _CONVERTERS.get(value_type)
+            if convert is not None:
+                value = convert(value)
+            
+            typed[cache_key] = value
+            return value
+                
+        except Exception as e:
+            log_warning(f"Error reading setting [{section}].{key}: {e}")
+            return default
+    
+    def get_float(self, section: str, key: str, default: float = 0.0) -> float:
+        """Get setting as a float (default if missing, empty or not a number)."""
+        # An empty value (e.g. "monthly_threshold =") means "not set": no warning
+        if not self.get(section, key, '', value_type=str):
+            return default
+        return self.get(section, key, default, value_type=float)
     
     def set(self, section: str, key: str, value: Any, 
             auto_save: bool = True) -> bool:
-        """Set setting value with validation. Auto-saves by default."""
-        with self._lock:
+        """Set setting value with validation. Auto-saves by default (after FLUSH_DELAY, see flush)."""
+        # Re-applying the current value (e.g. the same theme again) leaves nothing to save,
+        # and keeps the value caches instead of rebuilding them
+        if section and key and self._holds(section, key, value):
+            return True
+        
+        with self._writing():
             try:
                 # Validate inputs
                 if not section or not key:
                     log_warning("Cannot set setting with empty section or key")
                     return False
                 
-                # Create section if it doesn't exist
-                if not self.config.has_section(section):
-                    self.config.add_section(section)
-                
-                # Convert value to string
+                # Convert value to string and set it (creating the section if needed)
                 str_value = str(value).strip()
+                self._data.setdefault(section, {})[key.lower()] = str_value
                 
-                # Set the value
-                self.config.set(section, key, str_value)
-                
-                # Auto-save if requested (use unlocked version since we already have the lock)
+                # Auto-save if requested; consecutive changes share one write
                 if auto_save:
-                    return self._save_unlocked()
+                    self._schedule_flush_unlocked()
                 
                 return True
                 
@@ -139,25 +375,36 @@ class SettingsManager:
                 log_error(f"Failed to set [{section}].{key} = {value}", e)
                 return False
     
+    def _holds(self, section: str, key: str, value: Any) -> bool:
+        """Check whether [section].key is already set to value (as set() would store it)."""
+        try:
+            options = self._snapshot.get(section)
+            return options is not None and options.get(key.lower()) == str(value).strip()
+        except Exception:
+            # Let set() report invalid input
+            return False
+    
     def delete(self, section: str, key: Optional[str] = None, 
                auto_save: bool = True) -> bool:
-        """Delete setting or entire section. If key is None, deletes entire section."""
-        with self._lock:
+        """Delete setting or entire section. If key is None, deletes entire section. Auto-saves like set()."""
+        with self._writing():
             try:
+                removed = False
                 if key is None:
                     # Delete entire section
-                    if self.config.has_section(section):
-                        self.config.remove_section(section)
+                    if self._data.pop(section, None) is not None:
+                        removed = True
                         log_info(f"Deleted section: [{section}]")
                 else:
                     # Delete specific key
-                    if self.config.has_section(section) and self.config.has_option(section, key):
-                        self.config.remove_option(section, key)
+                    options = self._data.get(section)
+                    if options is not None and options.pop(key.lower(), None) is not None:
+                        removed = True
                         log_info(f"Deleted setting: [{section}].{key}")
                 
-                # Auto-save if requested (use unlocked version since we already have the lock)
-                if auto_save:
-                    return self._save_unlocked()
+                # Auto-save if requested and something was removed; consecutive changes share one write
+                if auto_save and removed:
+                    self._schedule_flush_unlocked()
                 
                 return True
                 
@@ -165,42 +412,103 @@ class SettingsManager:
                 log_error(f"Failed to delete [{section}].{key if key else '*'}", e)
                 return False
     
-    def get_section(self, section: str) -> Dict[str, str]:
-        """Get all key-value pairs in a section."""
-        with self._lock:
+    def update_many(self, changes: Dict[str, Dict[str, Any]], auto_save: bool = True) -> bool:
+        """
+        Set several settings at once, e.g. {'Table': {'sort_column': 'Date', 'sort_order': 'desc'}}.
+        
+        Takes the write lock once and (with auto_save) schedules one write for
+        all changes. Values are stored as set() stores them; nothing is applied
+        if any section or key is empty.
+        """
+        with self._writing():
             try:
-                if self.config.has_section(section):
-                    return dict(self.config.items(section))
-                return {}
+                # Validate inputs
+                for section, values in changes.items():
+                    if not section or not all(values):
+                        log_warning("Cannot set setting with empty section or key")
+                        return False
+                
+                changed = False
+                for section, values in changes.items():
+                    options = self._data.setdefault(section, {})
+                    for key, value in values.items():
+                        str_value = str(value).strip()
+                        key = key.lower()
+                        if options.get(key) != str_value:
+                            options[key] = str_value
+                            changed = True
+                
+                if auto_save and changed:
+                    self._schedule_flush_unlocked()
+                
+                return True
+                
+            except Exception as e:
+                log_error(f"Failed to update settings {changes}", e)
+                return False
+    
+    def delete_many(self, targets: Dict[str, Optional[Iterable[str]]], auto_save: bool = True) -> bool:
+        """
+        Delete several settings at once: section -> keys to delete, or None for the whole section.
+        
+        Takes the write lock once and (with auto_save) schedules one write if anything was removed.
+        """
+        with self._writing():
+            try:
+                removed = False
+                for section, keys in targets.items():
+                    if keys is None:
+                        if self._data.pop(section, None) is not None:
+                            removed = True
+                            log_info(f"Deleted section: [{section}]")
+                        continue
+                    options = self._data.get(section)
+                    if options is None:
+                        continue
+                    for key in keys:
+                        if options.pop(key.lower(), None) is not None:
+                            removed = True
+                            log_info(f"Deleted setting: [{section}].{key}")
+                
+                if auto_save and removed:
+                    self._schedule_flush_unlocked()
+                
+                return True
+                
             except Exception as e:
-                log_warning(f"Error reading section [{section}]: {e}")
-                return {}
+                log_error(f"Failed to delete settings {targets}", e)
+                return False
+    
+    def get_section(self, section: str) -> Dict[str, str]:
+        """Get all key-value pairs in a section."""
+        try:
+            return dict(self._snapshot.get(section, {}))
+        except Exception as e:
+            log_warning(f"Error reading section [{section}]: {e}")
+            return {}
     
     def get_all_sections(self) -> List[str]:
         """Get list of all section names."""
-        with self._lock:
-            return self.config.sections()
+        return list(self._snapshot)
     
     def has_section(self, section: str) -> bool:
         """Check if a section exists."""
-        with self._lock:
-            return self.config.has_section(section)
+        return section in self._snapshot
     
     def has_key(self, section: str, key: str) -> bool:
         """Check if a key exists in a section."""
-        with self._lock:
-            return (self.config.has_section(section) and 
-                   self.config.has_option(section, key))
+        options = self._snapshot.get(section)
+        return options is not None and key.lower() in options
     
     def clear_all(self, auto_save: bool = True) -> bool:
         """Clear all settings (useful for reset/testing)."""
-        with self._lock:
+        with self._writing():
             try:
-                self.config = configparser.ConfigParser()
+                self._data = {}
                 log_info("All settings cleared")
                 
                 if auto_save:
-                    return self.save()
+                    return self._save_unlocked()
                 
                 return True
                 
@@ -211,14 +519,18 @@ class SettingsManager:
 
 # Singleton instance for global access
 _settings_instance: Optional[SettingsManager] = None
+_settings_instance_lock = Lock()
 
 
 def get_settings_manager(settings_file: str = "settings.ini") -> SettingsManager:
-    """Get singleton instance of SettingsManager."""
+    """Get singleton instance of SettingsManager (created once, even when first called from several threads)."""
     global _settings_instance
     
+    # Lock only until the instance exists (double-checked)
     if _settings_instance is None:
-        _settings_instance = SettingsManager(settings_file)
+        with _settings_instance_lock:
+            if _settings_instance is None:
+                _settings_instance = SettingsManager(settings_file)
     
     return _settings_instance
 
@@ -1,7 +1,6 @@
 """Centralized status bar management for displaying user feedback messages."""
 
 import tkinter as tk
-from tkinter import ttk
 import config
 
 
@@ -20,6 +19,11 @@ class StatusBarManager:
         
         # Timer management
         self.status_clear_timer = None
+        
+        # Dark mode flag the widget colors were last set for (None until create_ui)
+        self._colored_dark = None
+        # Text currently displayed by show() ("" once cleared)
+        self._current_text = ""
     
     def create_ui(self) -> tk.Frame:
         """Create and return the status bar frame widget. Caller must grid it."""
@@ -27,6 +31,7 @@ class StatusBarManager:
         if self.theme_manager:
             colors = self.theme_manager.get_colors()
             is_dark = self.theme_manager.is_dark_mode()
+            self._colored_dark = is_dark
             # Use BG_TERTIARY (#2d2d30) in dark mode for dark gray status bar
             # Use BG_COLOR (#e5e5e5) in light mode
             bg_color = colors.BG_TERTIARY if is_dark else self.config.StatusBar.BG_COLOR
@@ -79,19 +84,27 @@ class StatusBarManager:
         if not self.status_label:
             return  # Status bar not created yet
         
-        # Refresh theme-aware colors in case theme changed
-        if self.theme_manager:
-            colors = self.theme_manager.get_colors()
+        text = f"{icon} {message}"
+        
+        # Same message already showing and due to auto-clear: leave label and timer alone
+        if auto_clear and text == self._current_text and self.status_clear_timer is not None:
+            return
+        
+        # Refresh theme-aware colors only if the theme changed since they were last set
+        if self.theme_manager and self.theme_manager.is_dark_mode() != self._colored_dark:
             is_dark = self.theme_manager.is_dark_mode()
+            colors = self.theme_manager.get_colors()
             bg_color = colors.BG_TERTIARY if is_dark else self.config.StatusBar.BG_COLOR
             text_color = '#ffffff' if is_dark else self.config.StatusBar.TEXT_COLOR
             
-            # Update frame and label colors
+            # Update frame color, then label colors and text in one configure call
             self.status_bar_frame.configure(bg=bg_color)
-            self.status_label.configure(bg=bg_color, fg=text_color)
-        
-        # Update label text
-        self.status_label.config(text=f"{icon} {message}")
+            self.status_label.configure(text=text, bg=bg_color, fg=text_color)
+            self._colored_dark = is_dark
+        else:
+            # Update label text
+            self.status_label.configure(text=text)
+        self._current_text = text
         
         # Cancel any existing timer
         self._cancel_timer()
@@ -109,6 +122,7 @@ class StatusBarManager:
             return
         
         self.status_label.config(text="")
+        self._current_text = ""
         self._cancel_timer()
     
     def set_visible(self, visible: bool):
@@ -1,15 +1,25 @@
 """Tooltip creation, updates, and lifecycle management for GUI widgets."""
 
 import tkinter as tk
+import weakref
 import config
 
 
 class TooltipManager:
-    """Manages tooltips for GUI widgets."""
+    """
+    Manages tooltips for GUI widgets.
+    
+    All widgets share one hidden tooltip window: create() only records the
+    widget's text and binds the shared <Enter>/<Leave> handlers, which move,
+    relabel and show or hide that window.
+    """
     
     def __init__(self):
         """Initialize the tooltip manager"""
-        pass
+        self._texts = weakref.WeakKeyDictionary()  # widget -> tooltip text
+        self._tip = None
+        self._tip_label = None
+        self._owner = None  # Widget whose tooltip is showing
     
     def create(self, widget, text):
         """Create a tooltip for a widget."""
@@ -20,79 +30,22 @@ class TooltipManager:
         except:
             pass
         
-        # Destroy any existing tooltip window
-        if hasattr(widget, 'tooltip'):
-            try:
-                widget.tooltip.destroy()
-            except:
-                pass
-            delattr(widget, 'tooltip')
+        if self._owner is widget:
+            self._hide()
         
-        def on_enter(event):
-            # Don't create tooltip if one already exists
-            if hasattr(widget, 'tooltip') and widget.tooltip:
-                try:
-                    widget.tooltip.destroy()
-                except:
-                    pass
-            
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_attributes('-topmost', True)  # Ensure tooltip appears on top
-            
-            # Create label first to get its size
-            label = tk.Label(
-                tooltip,
-                text=text,
-                background="lightyellow",
-                relief="solid",
-                borderwidth=1,
-                font=config.Fonts.LABEL_SMALL
-            )
-            label.pack()
-            
-            # Update to get actual size
-            tooltip.update_idletasks()
-            tooltip_width = tooltip.winfo_width()
-            
-            # Position tooltip to the LEFT of cursor to prevent off-screen overflow
-            x_pos = event.x_root - tooltip_width - 10
-            y_pos = event.y_root + 10
-            
-            tooltip.wm_geometry(f"+{x_pos}+{y_pos}")
-            widget.tooltip = tooltip
-            
-        def on_leave(event):
-            if hasattr(widget, 'tooltip') and widget.tooltip:
-                try:
-                    widget.tooltip.destroy()
-                    delattr(widget, 'tooltip')
-                except:
-                    pass
-                
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        self._texts[widget] = text
+        widget.bind("<Enter>", self._on_enter)
+        widget.bind("<Leave>", self._on_leave)
     
     def update(self, widget, new_text):
         """Update the tooltip text for a widget."""
-        # Destroy existing tooltip if visible
-        if hasattr(widget, 'tooltip'):
-            try:
-                widget.tooltip.destroy()
-            except:
-                pass
-            if hasattr(widget, 'tooltip'):
-                delattr(widget, 'tooltip')
+        if widget not in self._texts:
+            self.create(widget, new_text)
+            return
         
-        # Unbind old handlers and recreate tooltip with new text
-        try:
-            widget.unbind("<Enter>")
-            widget.unbind("<Leave>")
-        except:
-            pass
-        
-        # Recreate tooltip with new text
-        self.create(widget, new_text)
+        self._texts[widget] = new_text
+        if self._owner is widget:
+            self._hide()
     
     def destroy(self, widget):
         """Destroy the tooltip for a widget."""
@@ -103,12 +56,74 @@ class TooltipManager:
         except:
             pass
         
-        # Destroy tooltip window
-        if hasattr(widget, 'tooltip'):
-            try:
-                widget.tooltip.destroy()
-            except:
-                pass
-            if hasattr(widget, 'tooltip'):
-                delattr(widget, 'tooltip')
-
+        self._texts.pop(widget, None)
+        if self._owner is widget:
+            self._hide()
+    
+    def _ensure_window(self):
+        """Create the shared tooltip window on first use (or after it was destroyed)."""
+        try:
+            if self._tip is not None and self._tip.winfo_exists():
+                return
+        except tk.TclError:
+            pass
+        
+        tooltip = tk.Toplevel()
+        tooltip.withdraw()
+        tooltip.wm_overrideredirect(True)
+        tooltip.wm_attributes('-topmost', True)  # Ensure tooltip appears on top
+        
+        label = tk.Label(
+            tooltip,
+            background="lightyellow",
+            relief="solid",
+            borderwidth=1,
+            font=config.Fonts.LABEL_SMALL
+        )
+        label.pack()
+        
+        self._tip = tooltip
+        self._tip_label = label
+    
+    def _owner_of(self, widget):
+        """Find the registered widget for an event widget (CustomTkinter delivers events from inner parts)."""
+        texts = self._texts
+        while widget is not None and not isinstance(widget, str):
+            if widget in texts:
+                return widget
+            widget = widget.master
+        return None
+    
+    def _on_enter(self, event):
+        widget = self._owner_of(event.widget)
+        if widget is None:
+            return
+        
+        try:
+            self._ensure_window()
+            self._tip_label.configure(text=self._texts[widget])
+            # The label's requested size is known right after configure, no idle flush needed
+            tooltip_width = self._tip_label.winfo_reqwidth()
+            
+            # Position tooltip to the LEFT of cursor to prevent off-screen overflow
+            x_pos = event.x_root - tooltip_width - 10
+            y_pos = event.y_root + 10
+            
+            self._tip.wm_geometry(f"+{x_pos}+{y_pos}")
+            self._tip.deiconify()
+            self._owner = widget
+        except tk.TclError:
+            pass
+    
+    def _on_leave(self, event):
+        if self._owner is not None:
+            self._hide()
+    
+    def _hide(self):
+        """Withdraw the shared tooltip window."""
+        self._owner = None
+        try:
+            if self._tip is not None:
+                self._tip.withdraw()
+        except tk.TclError:
+            pass
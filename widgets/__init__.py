@@ -2,11 +2,33 @@
 Widgets package for LiteFinPad.
 
 Provides reusable UI components for the application.
+
+The widget classes are imported on first access (module __getattr__), so
+importing the package only loads the submodules a caller actually uses.
+PyInstaller can't follow these imports: the submodules are listed in the
+.spec's hiddenimports.
 """
 
-from .number_pad import NumberPadWidget
-from .collapsible_date_combo import CollapsibleDateCombobox
-from .autocomplete_entry import AutoCompleteEntry
+import importlib
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    'NumberPadWidget': 'number_pad',
+    'CollapsibleDateCombobox': 'collapsible_date_combo',
+    'AutoCompleteEntry': 'autocomplete_entry',
+}
 
 __all__ = ['NumberPadWidget', 'CollapsibleDateCombobox', 'AutoCompleteEntry']
 
+
+def __getattr__(name):
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{submodule}', __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))